@@ -21,23 +21,9 @@ class Post(TimestampedModel):
 
         @property
         def obj(self):
-            queryset = Post.Comment.objects.filter(
-                post__pk=self.post.id, parent__pk=self.id)
-            comments = [x.obj for x in queryset]
+            from .projections import CommentProjection
 
-            return OrderedDict(
-                {
-                    'id': self.id,
-                    'post': self.post.pk,
-                    'content': self.content,
-                    'replies': comments,
-                    'owner': {
-                        'id': self.owner.pk,
-                        'username': self.owner.username
-                    } if self.owner else None,
-                    'created': self.created,
-                    'updated': self.updated
-                })
+            return CommentProjection.serialize_many([self])[0]
 
     @property
     def obj(self):
@@ -0,0 +1,80 @@
+from collections import OrderedDict, defaultdict
+
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Left
+
+from api.projections import Projection
+
+from .models import Post
+
+
+class PostProjection(Projection):
+    """
+    Projection of blog posts as listed, with their content shortened to a preview by the database, so that the full content is never read.
+    """
+    fields = ('id', 'title', 'created', 'updated')
+
+    # Number of characters of content previewed
+    PREVIEW_LEN = 500
+
+    @classmethod
+    def queryset(cls, queryset):
+        return super().queryset(queryset).annotate(
+            preview=Left('content', cls.PREVIEW_LEN))
+
+    @classmethod
+    def serialize(cls, instance):
+        return OrderedDict(
+            {
+                'id': instance.id,
+                'title': instance.title,
+                'content': instance.preview,
+                'created': instance.created,
+                'updated': instance.updated
+            })
+
+
+class CommentProjection(Projection):
+    """
+    Projection of comments with their owners joined and their replies nested. The replies to the comments of a page, and their own replies however deep, are collected by a recursive query and loaded at once, then assembled into threads in memory.
+    """
+    fields = (
+        'id', 'post', 'parent', 'content', 'created', 'updated', 'owner',
+        'owner__id', 'owner__username')
+    select_related = ('owner', )
+
+    @classmethod
+    def prepare(cls, instances):
+        table = Post.Comment._meta.db_table
+        thread = RawSQL(
+            'WITH RECURSIVE thread(id) AS ('
+            f'SELECT id FROM {table} WHERE parent_id = ANY(%s) '
+            f'UNION ALL SELECT reply.id FROM {table} reply '
+            'JOIN thread ON reply.parent_id = thread.id) '
+            'SELECT id FROM thread', [[x.id for x in instances]])
+
+        replies = defaultdict(list)
+        queryset = cls.queryset(
+            Post.Comment.objects.filter(id__in=thread).order_by('id'))
+
+        for reply in queryset:
+            replies[reply.parent_id].append(reply)
+
+        for comment in [*instances, *queryset]:
+            comment._replies = replies[comment.id]
+
+    @classmethod
+    def serialize(cls, instance):
+        return OrderedDict(
+            {
+                'id': instance.id,
+                'post': instance.post_id,
+                'content': instance.content,
+                'replies': [cls.serialize(x) for x in instance._replies],
+                'owner': {
+                    'id': instance.owner.pk,
+                    'username': instance.owner.username
+                } if instance.owner else None,
+                'created': instance.created,
+                'updated': instance.updated
+            })
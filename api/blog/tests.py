@@ -1,3 +1,108 @@
-from django.test import TestCase
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
-# Create your tests here.
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from api.authentication.models import User
+
+from .models import Post
+from .projections import CommentProjection
+
+
+class BlogListTests(APITestCase):
+    """
+    Tests to check that listing posts and threads of comments costs a number of queries that does not grow with the number of results.
+    """
+    client = APIClient()
+
+    posts_path = f'/api/{settings.VERSION}/blog/posts'
+    comments_path = f'/api/{settings.VERSION}/blog/comments'
+
+    def setUp(self):
+        """
+        Initialization method where a user and a post are created.
+        """
+        self.user = User.objects.create_user(
+            'alice', 'alice@example.com', 'Easypass123!')
+        self.post = Post.objects.create(title='Hello', content='x' * 600)
+
+    def __comment(self, parent=None):
+        return Post.Comment.objects.create(
+            post=self.post, parent=parent, content='Hi', owner=self.user)
+
+    def __count_queries(self, path, params={}):
+        """
+        Method to request a path and return the response along with the number of queries it took.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response, len(queries)
+
+    def test_posts(self):
+        """
+        Ensure pages of posts cost a constant number of queries, with their content shortened.
+        """
+        _, count = self.__count_queries(self.posts_path)
+
+        for i in range(4):
+            Post.objects.create(title=f'Post {i}', content='Text')
+        response, more_count = self.__count_queries(self.posts_path)
+
+        self.assertEqual(len(response.data['data']), 5)
+        self.assertEqual(len(response.data['data'][-1]['content']), 500)
+        self.assertEqual(count, more_count)
+
+    def test_comments(self):
+        """
+        Ensure pages of comments cost a constant number of queries however many replies they have, and however deep.
+        """
+        params = {'post': self.post.id}
+        first = self.__comment()
+        _, count = self.__count_queries(self.comments_path, params)
+
+        reply = self.__comment(first)
+        nested = self.__comment(reply)
+        second = self.__comment()
+        self.__comment(second)
+
+        response, more_count = self.__count_queries(
+            self.comments_path, params)
+        self.assertEqual(count, more_count)
+
+        thread = response.data['data'][-1]
+        self.assertEqual(thread['id'], first.id)
+        self.assertEqual(
+            thread['owner'], {
+                'id': self.user.id,
+                'username': 'alice'
+            })
+        self.assertEqual(thread['replies'][0]['id'], reply.id)
+        self.assertEqual(
+            [x['id'] for x in thread['replies'][0]['replies']], [nested.id])
+        self.assertEqual(first.obj, thread)
+
+    def test_replies_of_page(self):
+        """
+        Ensure only the replies to the comments being serialized are loaded, however deep, from a single query.
+        """
+        first = self.__comment()
+        reply = self.__comment(first)
+        nested = self.__comment(reply)
+        self.__comment(self.__comment())
+
+        with CaptureQueriesContext(connection) as queries:
+            CommentProjection.prepare([first])
+
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(first._replies, [reply])
+        self.assertEqual(first._replies[0]._replies, [nested])
+
+        with connection.cursor() as cursor:
+            cursor.execute(queries[0]['sql'])
+            self.assertEqual(
+                [x[0] for x in cursor.fetchall()], [reply.id, nested.id])
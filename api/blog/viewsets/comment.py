@@ -8,6 +8,7 @@ from rest_framework.permissions import IsAdminUser
 from api.authentication.permissions import IsSafeMethod, IsVerified, IsOwner
 
 from ..models import Post
+from ..projections import CommentProjection
 from ..serializers import CommentSerializer
 
 
@@ -30,6 +31,7 @@ class CommentViewSet(viewsets.ModelViewSet):
 
         comments = self.get_queryset(
             post__pk=post, parent=None).order_by('-updated')
+        comments = CommentProjection.queryset(comments)
         paginator = Paginator(comments, results_per_page)
 
         try:
@@ -53,7 +55,7 @@ class CommentViewSet(viewsets.ModelViewSet):
             {
                 'success':
                 f'Listing {len(page.object_list)} of {paginator.count} comment{"" if paginator.count == 1 else "s"}.',
-                'data': [x.obj for x in page.object_list],
+                'data': CommentProjection.serialize_many(page.object_list),
                 'pagination': {
                     'totalResults': paginator.count,
                     'maxResultsPerPage': paginator.per_page,
@@ -11,6 +11,7 @@ from api import NON_FIELD_ERRORS_KEY
 from api.authentication.permissions import *
 
 from ..models import Post
+from ..projections import PostProjection
 from ..serializers import PostSerializer
 
 
@@ -46,7 +47,8 @@ class PostViewSet(viewsets.ModelViewSet):
             int(request.query_params.get('results', default_page_len)),
             default_page_len)
 
-        posts = self.get_queryset().order_by('-updated')
+        posts = PostProjection.queryset(
+            self.get_queryset().order_by('-updated'))
         paginator = Paginator(posts, page_len)
 
         try:
@@ -70,16 +72,7 @@ class PostViewSet(viewsets.ModelViewSet):
             {
                 'success':
                 f'Found {paginator.count} post{"" if paginator.count == 1 else "s"}.',
-                'data': [
-                    OrderedDict(
-                        {
-                            'id': x.id,
-                            'title': x.title,
-                            'content': x.content[:500],
-                            'created': x.created,
-                            'updated': x.updated
-                        }) for x in page.object_list
-                ],
+                'data': PostProjection.serialize_many(page.object_list),
                 'pagination': {
                     'totalResults': paginator.count,
                     'maxResultsPerPage': paginator.per_page,
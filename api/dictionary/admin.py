@@ -1,5 +1,47 @@
+from django import forms
 from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
+
 from .models import Category, Icon
 
 admin.site.register(Category)
-admin.site.register(Icon)
+
+
+class IconAdminForm(forms.ModelForm):
+    """
+    Admin form for icons, storing uploaded images under their hashsums through Icon.set_image(), like uploads through the API.
+    """
+
+    class Meta:
+        model = Icon
+        fields = '__all__'
+
+    def clean_image(self):
+        """
+        Store a newly uploaded image, returning the name it is stored under so that the form does not save the upload again.
+        """
+        image = self.cleaned_data['image']
+        if not image or 'image' not in self.changed_data:
+            return image
+
+        try:
+            self.instance.set_image(image)
+        except Icon.HashCollision:
+            raise forms.ValidationError(
+                _('A different image with the same hashsum is already stored. Please modify the image and try again.'),
+                'hash_collision')
+
+        return self.instance.image.name
+
+
+@admin.register(Icon)
+class IconAdmin(admin.ModelAdmin):
+    """
+    Admin page for icons, listing only the columns shown and skipping the count of the whole table on filtered pages.
+    """
+    form = IconAdminForm
+    list_display = ['id', 'word', 'category', 'is_approved', 'created']
+    list_filter = ['is_approved']
+    list_select_related = ['category']
+    search_fields = ['word_key']
+    show_full_result_count = False
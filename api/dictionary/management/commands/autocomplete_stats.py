@@ -0,0 +1,40 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from api.dictionary.utils import AutocompleteIndex
+
+
+class Command(BaseCommand):
+    help = 'Builds the autocompletion index, then reports its size, memory footprint, and completion latency.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'prefixes',
+            nargs='*',
+            default=['a', 'ca', 'sta', 'x'],
+            help='Prefixes to time completions for.')
+        parser.add_argument(
+            '--number',
+            type=int,
+            default=10000,
+            help='Number of completions timed per prefix.')
+
+    def handle(self, *args, **options):
+        AutocompleteIndex.clear()
+        build = timeit.timeit(lambda: AutocompleteIndex.complete(''), number=1)
+        stats = AutocompleteIndex.stats()
+
+        self.stdout.write(
+            f'{stats["entries"]} words, {stats["bytes"]} bytes, '
+            f'built in {build * 1000:.1f} ms')
+
+        for prefix in options['prefixes']:
+            number = options['number']
+            seconds = timeit.timeit(
+                lambda: AutocompleteIndex.complete(prefix), number=number)
+            results = AutocompleteIndex.complete(prefix)
+
+            self.stdout.write(
+                f'{prefix!r:>10}{len(results):>6} results'
+                f'{seconds / number * 1e6:>10.2f} µs')
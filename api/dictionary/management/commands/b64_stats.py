@@ -0,0 +1,36 @@
+import timeit
+
+from django.core.management.base import BaseCommand
+
+from api.dictionary.models import Icon
+from api.dictionary.utils import Base64Cache
+
+
+class Command(BaseCommand):
+    help = 'Reads the base-64 renditions of stored icons through the rendition cache twice, then reports its hit rate, size, and read latency.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=1000,
+            help='Maximum number of icons read.')
+
+    def handle(self, *args, **options):
+        icons = list(
+            Icon.objects.filter(_hash__isnull=False).order_by('id').only(
+                'image', '_hash')[:options['limit']])
+
+        Base64Cache.clear()
+        for label in ['cold', 'warm']:
+            seconds = timeit.timeit(
+                lambda: [x.b64 for x in icons], number=1)
+
+            self.stdout.write(
+                f'{label:>10}{len(icons):>6} icons'
+                f'{seconds / max(len(icons), 1) * 1e6:>10.2f} µs')
+
+        stats = Base64Cache.stats()
+        self.stdout.write(
+            f'{stats["entries"]} entries, {stats["bytes"]} bytes, '
+            f'{stats["hits"]} hits, {stats["misses"]} misses')
@@ -0,0 +1,74 @@
+import os
+import tempfile
+import timeit
+
+from base64 import b64encode
+from functools import partial
+
+from django.core.management.base import BaseCommand
+
+from api.dictionary.utils import Base64Converter
+
+
+def legacy_encode(absolute_path, block_size=2**16):
+    """
+    The former, buffered implementation of Base64Converter.encode(), which concatenates blocks into a growing bytes string. Kept here as a baseline.
+    """
+    with open(absolute_path, 'rb') as f:
+        bytes_str = b''
+        for buffer in iter(partial(f.read, block_size), b''):
+            bytes_str += buffer
+        return str(b64encode(bytes_str), 'utf-8')
+
+
+class Command(BaseCommand):
+    help = 'Compares the base-64 encoders across a range of file sizes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--sizes',
+            type=int,
+            nargs='+',
+            default=[2**10, 2**14, 2**16, 2**20, 2**23],
+            help='File sizes to benchmark, in bytes.')
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of timed runs per encoder, of which the best is reported.')
+
+    def handle(self, *args, **options):
+        encoders = {
+            'legacy': legacy_encode,
+            'encode': lambda path: Base64Converter.encode(absolute_path=path),
+            'iter_encode': lambda path: ''.join(
+                Base64Converter.iter_encode(absolute_path=path)),
+        }
+
+        self.stdout.write(
+            f'{"size (B)":>10}' +
+            ''.join(f'{name + " (ms)":>18}' for name in encoders))
+
+        for size in options['sizes']:
+            with tempfile.NamedTemporaryFile(delete=False) as f:
+                f.write(os.urandom(size))
+                path = f.name
+
+            try:
+                expected = legacy_encode(path)
+                row = f'{size:>10}'
+
+                for name, encoder in encoders.items():
+                    assert encoder(path) == expected, name
+
+                    number = max(1, 2**20 // max(size, 1))
+                    best = min(
+                        timeit.repeat(
+                            partial(encoder, path),
+                            number=number,
+                            repeat=options['repeat'])) / number
+                    row += f'{best * 1000:>18.3f}'
+
+                self.stdout.write(row)
+            finally:
+                os.remove(path)
@@ -0,0 +1,87 @@
+import random
+import string
+import timeit
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.dictionary.models import Icon, IconNgram
+
+
+class Rollback(Exception):
+    """
+    Exception raised to discard the generated icons once timing is done.
+    """
+
+
+class Command(BaseCommand):
+    help = 'Times icon searches over a generated set of icons, which is rolled back afterwards.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--icons',
+            type=int,
+            default=100000,
+            help='Number of icons to generate.')
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Number of timed runs per query, of which the best is reported.')
+
+    def __generate(self, n):
+        """
+        Private method bulk-creating icons with random words and their trigrams.
+        """
+        rng = random.Random(0)
+        icons = []
+
+        for _ in range(n):
+            word = ''.join(
+                rng.choices(string.ascii_lowercase, k=rng.randint(3, 12)))
+            icons.append(
+                Icon(
+                    word=word,
+                    descriptor=word[::-1],
+                    word_key=word,
+                    word_length=len(word)))
+
+        icons = Icon.objects.bulk_create(icons, batch_size=5000)
+        IconNgram.objects.bulk_create(
+            [x for icon in icons for x in IconNgram.build(icon)],
+            batch_size=5000)
+
+        return icons
+
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                icons = self.__generate(options['icons'])
+                word = next(x.word for x in icons if len(x.word) >= 8)
+
+                queries = {
+                    'exact': word,
+                    'prefix': word[:3],
+                    'substring': word[1:-1],
+                    'typo': word[:-1] + ('a' if word[-1] != 'a' else 'b'),
+                }
+
+                self.stdout.write(
+                    f'{"query":>10}{"term":>14}{"results":>10}{"ms":>10}')
+
+                for name, term in queries.items():
+                    def run():
+                        return list(Icon.objects.search(term)[:100])
+
+                    results = len(run())
+                    best = min(
+                        timeit.repeat(
+                            run, number=1, repeat=options['repeat']))
+
+                    self.stdout.write(
+                        f'{name:>10}{term:>14}{results:>10}'
+                        f'{best * 1000:>10.2f}')
+
+                raise Rollback()
+        except Rollback:
+            pass
@@ -0,0 +1,61 @@
+import shutil
+import tempfile
+import timeit
+
+import numpy as np
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from api.dictionary.utils import FeatureIndex
+
+
+class Command(BaseCommand):
+    help = 'Times visual similarity queries over generated indexes of several sizes, stored in a temporary directory.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--icons',
+            type=int,
+            nargs='+',
+            default=[10000, 100000],
+            help='Numbers of icons to generate an index of.')
+        parser.add_argument(
+            '--results',
+            type=int,
+            default=10,
+            help='Number of similar icons requested per query.')
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=20,
+            help='Number of timed queries per index, of which the best and median are reported.')
+
+    def handle(self, *args, **options):
+        rng = np.random.default_rng(0)
+        media_root = tempfile.mkdtemp()
+
+        self.stdout.write(f'{"icons":>10}{"best ms":>10}{"median ms":>12}')
+
+        try:
+            with override_settings(MEDIA_ROOT=media_root):
+                for n in options['icons']:
+                    vectors = rng.standard_normal(
+                        (n, FeatureIndex.DIMENSIONS), dtype=np.float32)
+                    vectors /= np.linalg.norm(vectors, axis=1)[:, None]
+                    FeatureIndex.rebuild(zip(range(1, n + 1), vectors))
+
+                    # The first query maps the index
+                    FeatureIndex.similar(1, options['results'])
+
+                    times = timeit.repeat(
+                        lambda: FeatureIndex.similar(
+                            int(rng.integers(1, n + 1)), options['results']),
+                        number=1,
+                        repeat=options['repeat'])
+
+                    self.stdout.write(
+                        f'{n:>10}{min(times) * 1000:>10.2f}'
+                        f'{float(np.median(times)) * 1000:>12.2f}')
+        finally:
+            shutil.rmtree(media_root, ignore_errors=True)
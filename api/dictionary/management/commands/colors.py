@@ -0,0 +1,80 @@
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from api.dictionary.models import Icon, IconColor
+from api.dictionary.utils import ColorPalette
+
+
+def extract(path):
+    """
+    Extract the palette of an image in a worker process, or return None if it cannot be read.
+    """
+    try:
+        return ColorPalette.extract(path)
+    except OSError:
+        return None
+
+
+class Command(BaseCommand):
+    help = 'Extracts the dominant colors of stored icons that lack them, reading images in parallel worker processes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Extract colors of icons that have them already.')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Number of worker processes, defaulting to the number of processors.')
+        parser.add_argument(
+            '--batch',
+            type=int,
+            default=1000,
+            help='Number of images handed to the workers at a time.')
+
+    def handle(self, *args, **options):
+        icons = Icon.objects.exclude(image='').exclude(image__isnull=True)
+        if not options['force']:
+            icons = icons.filter(colors__isnull=True)
+
+        # Icons sharing a stored image share its palette
+        by_name = {}
+        for icon_id, name in icons.values_list('id', 'image').iterator():
+            by_name.setdefault(name, []).append(icon_id)
+
+        names = list(by_name)
+        count, failed = 0, 0
+
+        with ProcessPoolExecutor(max_workers=options['workers']) as executor:
+            for start in range(0, len(names), options['batch']):
+                batch = names[start:start + options['batch']]
+                palettes = executor.map(
+                    extract,
+                    [os.path.join(settings.MEDIA_ROOT, x) for x in batch])
+
+                rows = []
+                for name, palette in zip(batch, palettes):
+                    if palette is None:
+                        failed += 1
+                        continue
+
+                    for icon_id in by_name[name]:
+                        rows += IconColor.build(icon_id, palette)
+                        count += 1
+
+                with transaction.atomic():
+                    IconColor.objects.filter(
+                        icon_id__in=[
+                            x for name in batch for x in by_name[name]
+                        ]).delete()
+                    IconColor.objects.bulk_create(rows)
+
+        self.stdout.write(
+            f'{count} icons processed, {failed} images skipped as unreadable.')
@@ -0,0 +1,43 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.dictionary.models import Icon
+from api.dictionary.utils import PerceptualHash
+
+
+class Command(BaseCommand):
+    help = 'Computes the difference hashes of stored icons that lack one, so that near-duplicates of them are detected on upload.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Recompute hashes that already exist.')
+
+    def handle(self, *args, **options):
+        icons = Icon.objects.exclude(image='').exclude(image__isnull=True)
+        if not options['force']:
+            icons = icons.filter(_dhash__isnull=True)
+
+        count, failed = 0, 0
+        names = icons.values_list('image', flat=True).distinct()
+        for name in names.iterator():
+            try:
+                value = PerceptualHash.compute(
+                    os.path.join(settings.MEDIA_ROOT, name))
+            except OSError:
+                failed += 1
+                continue
+
+            # Icons sharing a stored image share its hash
+            count += Icon.objects.filter(image=name).update(
+                _dhash=PerceptualHash.to_signed(value),
+                **{
+                    f'_dhash_{i}': chunk
+                    for i, chunk in enumerate(PerceptualHash.chunks(value))
+                })
+
+        self.stdout.write(
+            f'{count} icons hashed, {failed} images skipped as unreadable.')
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.dictionary.utils import SpriteAtlas
+
+
+class Command(BaseCommand):
+    help = 'Removes the least recently requested category atlases beyond a maximum number.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-atlases',
+            type=int,
+            default=settings.SPRITE_ATLAS['MAX_ATLASES'],
+            help='Number of atlases to keep, 0 to remove them all.')
+
+    def handle(self, *args, **options):
+        removed = SpriteAtlas.prune(options['max_atlases'])
+
+        self.stdout.write(f'{removed} atlases removed.')
@@ -0,0 +1,50 @@
+import os
+import re
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.dictionary.models import Icon
+from api.dictionary.utils import Renditions
+
+
+class Command(BaseCommand):
+    help = 'Removes stored images, and their variants, that no icon refers to, such as those written by uploads whose transaction was rolled back.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--min-age',
+            type=int,
+            default=60 * 60 * 24,
+            help='Age in seconds below which images are kept, so that uploads in progress are not removed.')
+
+    def handle(self, *args, **options):
+        directory = os.path.join(settings.MEDIA_ROOT, Icon.RELATIVE_PATH)
+        since = time.time() - options['min_age']
+
+        stored = set(
+            bytes(x).hex() for x in Icon.objects.filter(
+                _hash__isnull=False).values_list('_hash', flat=True))
+
+        removed = 0
+        try:
+            with os.scandir(directory) as entries:
+                orphans = [
+                    x.name for x in entries
+                    if re.fullmatch(r'[a-f\d]{32}', x.name) and
+                    x.name not in stored and x.stat().st_mtime < since
+                ]
+        except FileNotFoundError:
+            orphans = []
+
+        for md5 in orphans:
+            try:
+                os.remove(os.path.join(directory, md5))
+            except FileNotFoundError:
+                continue
+
+            Renditions.delete(md5)
+            removed += 1
+
+        self.stdout.write(f'{removed} images removed.')
@@ -0,0 +1,20 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.dictionary.utils import SentenceStrip
+
+
+class Command(BaseCommand):
+    help = 'Removes the least recently requested sentence strips beyond a maximum number.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-strips',
+            type=int,
+            default=settings.SENTENCE_STRIP['MAX_STRIPS'],
+            help='Number of strips to keep, 0 to remove them all.')
+
+    def handle(self, *args, **options):
+        removed = SentenceStrip.prune(options['max_strips'])
+
+        self.stdout.write(f'{removed} strips removed.')
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from api.dictionary.models import PendingIconCount
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the counters of icons awaiting approval from the icons table.'
+
+    def handle(self, *args, **options):
+        PendingIconCount.recount()
+
+        total = sum(
+            PendingIconCount.objects.values_list('count', flat=True))
+        self.stdout.write(f'{total} icons awaiting approval.')
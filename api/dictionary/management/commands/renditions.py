@@ -0,0 +1,51 @@
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand
+
+from api.dictionary.models import Icon
+from api.dictionary.utils import Renditions
+
+
+class Command(BaseCommand):
+    help = 'Produces the size-optimized variants of every stored icon, then reports the bytes saved by each variant.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerate variants that already exist.')
+
+    def handle(self, *args, **options):
+        totals = defaultdict(int)
+        images = Icon.objects.filter(_hash__isnull=False).exclude(
+            image='').values_list('_hash', 'image').distinct()
+
+        count, failed = 0, 0
+        for _hash, relative_path in images.iterator():
+            md5 = bytes(_hash).hex()
+
+            try:
+                sizes = Renditions.generate(
+                    md5, relative_path, force=options['force'])
+            except FileNotFoundError:
+                sizes = None
+
+            if not sizes:
+                failed += 1
+                continue
+
+            count += 1
+            for variant, size in sizes.items():
+                totals[variant] += size
+
+        self.stdout.write(
+            f'{count} images processed, {failed} skipped as unreadable.')
+
+        original = totals[Renditions.ORIGINAL]
+        self.stdout.write(f'{"variant":>10}{"bytes":>14}{"saved":>10}')
+        self.stdout.write(f'{Renditions.ORIGINAL:>10}{original:>14}')
+
+        for variant in Renditions.CONTENT_TYPES:
+            saved = 1 - totals[variant] / original if original else 0
+            self.stdout.write(
+                f'{variant:>10}{totals[variant]:>14}{saved:>10.1%}')
@@ -0,0 +1,30 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.dictionary.models import Icon
+from api.dictionary.utils import FeatureIndex
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the visual similarity index from the stored icons, dropping the vectors of deleted icons and superseded images.'
+
+    def handle(self, *args, **options):
+        icons = Icon.objects.exclude(image='').exclude(
+            image__isnull=True).order_by('id').values_list('id', 'image')
+
+        vectors, failed = {}, set()
+        for name in {x for _, x in icons}:
+            try:
+                vectors[name] = FeatureIndex.compute(
+                    os.path.join(settings.MEDIA_ROOT, name))
+            except OSError:
+                failed.add(name)
+
+        count = FeatureIndex.rebuild(
+            (icon_id, vectors[name]) for icon_id, name in icons
+            if name in vectors)
+
+        self.stdout.write(
+            f'{count} icons indexed, {len(failed)} images skipped as unreadable.')
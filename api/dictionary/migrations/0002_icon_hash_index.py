@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='icon',
+            name='_hash',
+            field=models.BinaryField(db_index=True, max_length=16, null=True, verbose_name='MD5 hash'),
+        ),
+    ]
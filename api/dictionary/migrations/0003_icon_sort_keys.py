@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:52
+
+from django.db import migrations, models
+from django.db.models.functions import Length, Lower
+
+
+def populate_sort_keys(apps, schema_editor):
+    Icon = apps.get_model('dictionary', 'Icon')
+    Icon.objects.update(word_key=Lower('word'), word_length=Length('word'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0002_icon_hash_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='icon',
+            name='word_key',
+            field=models.CharField(default='', editable=False, max_length=40),
+        ),
+        migrations.AddField(
+            model_name='icon',
+            name='word_length',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_sort_keys, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='icon',
+            index=models.Index(fields=['word_key'], name='icon_word_key_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='icon',
+            index=models.Index(fields=['word_key', 'id'], name='icon_word_key_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='icon',
+            index=models.Index(fields=['word_length', 'word_key', 'id'], name='icon_word_length_order_idx'),
+        ),
+    ]
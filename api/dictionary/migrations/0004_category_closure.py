@@ -0,0 +1,51 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:53
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_closure(apps, schema_editor):
+    Category = apps.get_model('dictionary', 'Category')
+    CategoryClosure = apps.get_model('dictionary', 'CategoryClosure')
+
+    parents = dict(Category.objects.values_list('id', 'parent_id'))
+    links = []
+
+    for category_id in parents:
+        ancestor_id, depth, seen = category_id, 0, set()
+
+        # Stop at the root, or at a cycle left by earlier data
+        while ancestor_id is not None and ancestor_id not in seen:
+            seen.add(ancestor_id)
+            links.append(
+                CategoryClosure(
+                    ancestor_id=ancestor_id,
+                    descendant_id=category_id,
+                    depth=depth))
+            ancestor_id, depth = parents[ancestor_id], depth + 1
+
+    CategoryClosure.objects.bulk_create(links, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0003_icon_sort_keys'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CategoryClosure',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('depth', models.PositiveSmallIntegerField()),
+                ('ancestor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='descendant_links', to='dictionary.category')),
+                ('descendant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ancestor_links', to='dictionary.category')),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='categoryclosure',
+            constraint=models.UniqueConstraint(fields=('ancestor', 'descendant'), name='category_closure_unique_pair'),
+        ),
+        migrations.RunPython(populate_closure, migrations.RunPython.noop),
+    ]
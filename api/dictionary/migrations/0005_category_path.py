@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:56
+
+from django.db import migrations, models
+
+
+def populate_paths(apps, schema_editor):
+    Category = apps.get_model('dictionary', 'Category')
+
+    categories = {x.id: x for x in Category.objects.all()}
+
+    for category in categories.values():
+        names, parent_id, seen = [], category.parent_id, {category.id}
+
+        while parent_id is not None and parent_id not in seen:
+            seen.add(parent_id)
+            names.insert(0, categories[parent_id].name)
+            parent_id = categories[parent_id].parent_id
+
+        category.path = ' » '.join(names)
+        category.depth = len(names)
+
+    Category.objects.bulk_update(
+        categories.values(), ['path', 'depth'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0004_category_closure'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='path',
+            field=models.CharField(blank=True, default='', editable=False, max_length=400),
+        ),
+        migrations.RunPython(populate_paths, migrations.RunPython.noop),
+    ]
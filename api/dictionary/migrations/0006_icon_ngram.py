@@ -0,0 +1,76 @@
+# Generated by Django 4.2.30 on 2026-10-17 02:59
+
+from django.db import DatabaseError, migrations, models, transaction
+import django.db.models.deletion
+
+from api.dictionary.models.icon_ngram import trigrams
+
+
+def populate_ngrams(apps, schema_editor):
+    Icon = apps.get_model('dictionary', 'Icon')
+    IconNgram = apps.get_model('dictionary', 'IconNgram')
+
+    ngrams = []
+    for icon in Icon.objects.only('id', 'word', 'descriptor').iterator():
+        for gram in sorted(trigrams(icon.word) | trigrams(icon.descriptor)):
+            ngrams.append(IconNgram(icon_id=icon.id, gram=gram))
+
+    IconNgram.objects.bulk_create(ngrams, batch_size=1000)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # Trigram indexes need the pg_trgm extension, which may not be available
+    # to this database user. Searches fall back to the n-gram table then.
+    connection = schema_editor.connection
+    if connection.vendor != 'postgresql':
+        return
+
+    try:
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+                cursor.execute(
+                    'CREATE INDEX IF NOT EXISTS icon_word_key_trgm_idx '
+                    'ON dictionary_icon USING gin (word_key gin_trgm_ops)')
+                cursor.execute(
+                    'CREATE INDEX IF NOT EXISTS icon_descriptor_trgm_idx '
+                    'ON dictionary_icon '
+                    'USING gin (UPPER(descriptor::text) gin_trgm_ops)')
+    except DatabaseError:
+        pass
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('DROP INDEX IF EXISTS icon_word_key_trgm_idx')
+        cursor.execute('DROP INDEX IF EXISTS icon_descriptor_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0005_category_path'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IconNgram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gram', models.CharField(max_length=3)),
+                ('icon', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ngrams', to='dictionary.icon')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['gram', 'icon'], name='icon_ngram_gram_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='iconngram',
+            constraint=models.UniqueConstraint(fields=('icon', 'gram'), name='icon_ngram_unique_pair'),
+        ),
+        migrations.RunPython(populate_ngrams, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
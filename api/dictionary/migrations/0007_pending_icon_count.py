@@ -0,0 +1,37 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:16
+
+from django.db import migrations, models
+
+
+def populate_counts(apps, schema_editor):
+    Icon = apps.get_model('dictionary', 'Icon')
+    PendingIconCount = apps.get_model('dictionary', 'PendingIconCount')
+
+    counts = Icon.objects.filter(is_approved=False).values(
+        'category_id').annotate(n=models.Count('id')).values_list(
+            'category_id', 'n')
+
+    PendingIconCount.objects.bulk_create(
+        [PendingIconCount(category_id=x or 0, count=n) for x, n in counts])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0006_icon_ngram'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingIconCount',
+            fields=[
+                ('category_id', models.PositiveIntegerField(primary_key=True, serialize=False)),
+                ('count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='icon',
+            index=models.Index(condition=models.Q(('is_approved', False)), fields=['id'], name='icon_pending_idx'),
+        ),
+        migrations.RunPython(populate_counts, migrations.RunPython.noop),
+    ]
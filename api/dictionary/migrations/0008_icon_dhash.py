@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0007_pending_icon_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='icon',
+            name='_dhash',
+            field=models.BigIntegerField(editable=False, null=True, verbose_name='difference hash'),
+        ),
+        migrations.AddField(
+            model_name='icon',
+            name='_dhash_0',
+            field=models.PositiveIntegerField(db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='icon',
+            name='_dhash_1',
+            field=models.PositiveIntegerField(db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='icon',
+            name='_dhash_2',
+            field=models.PositiveIntegerField(db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='icon',
+            name='_dhash_3',
+            field=models.PositiveIntegerField(db_index=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:28
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0008_icon_dhash'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IconColor',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket', models.PositiveSmallIntegerField()),
+                ('share', models.FloatField()),
+                ('red', models.PositiveSmallIntegerField()),
+                ('green', models.PositiveSmallIntegerField()),
+                ('blue', models.PositiveSmallIntegerField()),
+                ('icon', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='colors', to='dictionary.icon')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['bucket', 'icon'], name='icon_color_bucket_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='iconcolor',
+            constraint=models.UniqueConstraint(fields=('icon', 'bucket'), name='icon_color_unique_bucket'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0009_icon_color'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WordMiss',
+            fields=[
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='datetime created')),
+                ('updated', models.DateTimeField(auto_now=True, verbose_name='datetime updated')),
+                ('id', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('suggestions', models.JSONField(default=list, verbose_name='Merriam-Webster suggestions')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
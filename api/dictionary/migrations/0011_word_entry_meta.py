@@ -0,0 +1,54 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:49
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0010_word_miss'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dictionaryentry',
+            name='headword',
+            field=models.CharField(default='', max_length=128, verbose_name='headword'),
+        ),
+        migrations.AddField(
+            model_name='dictionaryentry',
+            name='offensive',
+            field=models.BooleanField(default=False, verbose_name='offensive'),
+        ),
+        migrations.AddField(
+            model_name='dictionaryentry',
+            name='sort',
+            field=models.CharField(default='', max_length=32, verbose_name='sort key'),
+        ),
+        migrations.AddField(
+            model_name='dictionaryentry',
+            name='stems',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=128), default=list, size=None, verbose_name='stems'),
+        ),
+        migrations.AddField(
+            model_name='thesaurusentry',
+            name='headword',
+            field=models.CharField(default='', max_length=128, verbose_name='headword'),
+        ),
+        migrations.AddField(
+            model_name='thesaurusentry',
+            name='offensive',
+            field=models.BooleanField(default=False, verbose_name='offensive'),
+        ),
+        migrations.AddField(
+            model_name='thesaurusentry',
+            name='sort',
+            field=models.CharField(default='', max_length=32, verbose_name='sort key'),
+        ),
+        migrations.AddField(
+            model_name='thesaurusentry',
+            name='stems',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(max_length=128), default=list, size=None, verbose_name='stems'),
+        ),
+    ]
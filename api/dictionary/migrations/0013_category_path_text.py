@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0012_cache_generation'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='category',
+            name='path',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+    ]
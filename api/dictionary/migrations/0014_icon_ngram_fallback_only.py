@@ -0,0 +1,61 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:20
+
+from django.db import migrations
+
+
+def trigrams(text):
+    # Copied from api.dictionary.models.icon_ngram, so that the migration
+    # does not depend on the current application code
+    grams = set()
+
+    for word in (text or '').lower().split():
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+
+    return grams
+
+
+def has_trigram_support(connection):
+    if connection.vendor != 'postgresql':
+        return False
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def populate_ngrams(apps, schema_editor):
+    Icon = apps.get_model('dictionary', 'Icon')
+    IconNgram = apps.get_model('dictionary', 'IconNgram')
+
+    IconNgram.objects.all().delete()
+
+    ngrams = []
+    for icon in Icon.objects.only('id', 'word', 'descriptor').iterator():
+        for gram in sorted(trigrams(icon.word) | trigrams(icon.descriptor)):
+            ngrams.append(IconNgram(icon_id=icon.id, gram=gram))
+
+    IconNgram.objects.bulk_create(ngrams, batch_size=1000)
+
+
+def keep_fallback_ngrams(apps, schema_editor):
+    # Trigrams are no longer maintained where pg_trgm is installed, so the
+    # rows would only go stale there. Elsewhere they are rebuilt once, as
+    # they are kept up to date on save from now on.
+    if has_trigram_support(schema_editor.connection):
+        apps.get_model('dictionary', 'IconNgram').objects.all().delete()
+    else:
+        populate_ngrams(apps, schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0013_category_path_text'),
+    ]
+
+    operations = [
+        # Reversing restores trigrams for every icon, as they were maintained
+        # on every database before
+        migrations.RunPython(keep_fallback_ngrams, populate_ngrams),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:40
+
+from django.db import migrations
+
+
+ENTRY_MODELS = ('DictionaryEntry', 'ThesaurusEntry')
+
+
+def normalize_json(apps, schema_editor):
+    # Entries default to an empty string, which is not valid JSON and would
+    # fail the cast of the column in the next migration. The update runs in
+    # a transaction of its own, as PostgreSQL refuses to alter a table with
+    # foreign key checks of updated rows still pending.
+    for model_name in ENTRY_MODELS:
+        Entry = apps.get_model('dictionary', model_name)
+        Entry.objects.filter(json='').update(json='{}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0014_icon_ngram_fallback_only'),
+    ]
+
+    operations = [
+        migrations.RunPython(normalize_json, migrations.RunPython.noop),
+    ]
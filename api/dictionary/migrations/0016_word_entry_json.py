@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0015_word_entry_json_normalize'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='dictionaryentry',
+            name='json',
+            field=models.JSONField(default=dict, verbose_name='Merriam-Webster dictionary entry'),
+        ),
+        migrations.AlterField(
+            model_name='thesaurusentry',
+            name='json',
+            field=models.JSONField(default=dict, verbose_name='Merriam-Webster thesaurus entry'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:40
+
+from django.db import migrations
+
+
+ENTRY_MODELS = ('DictionaryEntry', 'ThesaurusEntry')
+
+
+def extract_meta(apps, schema_editor):
+    # The columns are indexed in the next migration, once filled
+    with schema_editor.connection.cursor() as cursor:
+        for model_name in ENTRY_MODELS:
+            table = apps.get_model('dictionary', model_name)._meta.db_table
+            cursor.execute(
+                f"""
+                UPDATE {table} SET
+                    headword = LEFT(COALESCE(json->'hwi'->>'hw', ''), 128),
+                    sort = LEFT(COALESCE(json->'meta'->>'sort', ''), 32),
+                    stems = ARRAY(
+                        SELECT LEFT(x, 128) FROM jsonb_array_elements_text(
+                            COALESCE(json->'meta'->'stems', '[]')) AS x),
+                    offensive = COALESCE(
+                        (json->'meta'->>'offensive')::boolean, false)
+                """)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0016_word_entry_json'),
+    ]
+
+    operations = [
+        migrations.RunPython(extract_meta, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:40
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dictionary', '0017_word_entry_meta_backfill'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='dictionaryentry',
+            index=models.Index(fields=['word', 'sort', 'id'], name='dictionaryentry_word_sort_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dictionaryentry',
+            index=models.Index(fields=['headword'], name='dictionaryentry_headword_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='dictionaryentry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['stems'], name='dictionaryentry_stems_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='thesaurusentry',
+            index=models.Index(fields=['word', 'sort', 'id'], name='thesaurusentry_word_sort_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='thesaurusentry',
+            index=models.Index(fields=['headword'], name='thesaurusentry_headword_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='thesaurusentry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['stems'], name='thesaurusentry_stems_idx'),
+        ),
+    ]
@@ -1,5 +1,9 @@
+from .cache_generation import *
 from .category import *
 from .icon import *
+from .icon_color import *
+from .icon_ngram import *
 from .image import *
 from .mp3 import *
+from .pending_icon_count import *
 from .word import *
@@ -0,0 +1,32 @@
+from django.db import connection, models
+
+
+class CacheGeneration(models.Model):
+    """
+    Counter of the changes to data cached in each process, keyed by name. Processes compare it with the value their copy was built at to learn of changes made by other processes, since caches local to a process are not shared between workers.
+    """
+    name = models.CharField(primary_key=True, max_length=64)
+    value = models.BigIntegerField(default=0)
+
+    @classmethod
+    def current(cls, name):
+        """
+        Class method returning the counter of a name, or 0 if it was never incremented.
+        """
+        return cls.objects.filter(name=name).values_list(
+            'value', flat=True).first() or 0
+
+    @classmethod
+    def bump(cls, name):
+        """
+        Class method incrementing the counter of a name in a single statement, creating it if needed, and returning its new value.
+        """
+        table = cls._meta.db_table
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'INSERT INTO {table} (name, value) VALUES (%s, 1) '
+                f'ON CONFLICT (name) DO UPDATE SET value = {table}.value + 1 '
+                'RETURNING value', [name])
+
+            return cursor.fetchone()[0]
@@ -1,9 +1,14 @@
 from collections import OrderedDict
-from django.db import models
+from django.db import models, transaction
+from django.utils import timezone
 from api.models import TimestampedModel
 
 
 class Category(TimestampedModel):
+    # Static variables
+    PATH_SEPARATOR = ' » '
+
+    # Attributes
     name = models.CharField(max_length=40)
     parent = models.ForeignKey(
         'self',
@@ -12,19 +17,14 @@ class Category(TimestampedModel):
         related_name='children',
         on_delete=models.CASCADE)
 
-    @property
-    def path(self):
-        if self.parent:
-            if self.parent.path:
-                return self.parent.path + ' » ' + self.parent.name
-            else:
-                return self.parent.name
-
-        return ''
+    # Names of the ancestors and the distance from the root, maintained on
+    # save for the whole subtree
+    path = models.TextField(blank=True, default='', editable=False)
+    depth = models.PositiveSmallIntegerField(default=0, editable=False)
 
     def __str__(self):
-        if self.parent:
-            return self.path + ' » ' + self.name
+        if self.path:
+            return self.path + self.PATH_SEPARATOR + self.name
 
         return self.name
 
@@ -35,27 +35,160 @@ class Category(TimestampedModel):
                 'id': self.id,
                 'name': self.name,
                 'path': self.path,
-                'parent': self.parent.id if self.parent else None,
+                'parent': self.parent_id,
             })
 
+    def __set_path(self, parent):
+        """
+        Derive the stored path and depth from those of a parent category.
+        """
+        if parent:
+            self.path = str(parent)
+            self.depth = parent.depth + 1
+        else:
+            self.path = ''
+            self.depth = 0
+
     @classmethod
     def subcategories(cls, root_id=0):
+        """
+        Get a queryset of a category and all of its descendants, or of all categories if no root is given. Resolved with a single lookup on the closure table.
+        """
         if root_id == 0:
             return cls.objects.all()
 
-        category = cls.objects.get(id=root_id)
-        subcategories = [category]
-        for subcategory in cls.objects.filter(parent=category.id):
-            subcategories += cls.subcategories(subcategory.id)
+        return cls.objects.filter(ancestor_links__ancestor_id=root_id)
 
-        return subcategories
+    def is_descendant_of(self, category):
+        """
+        Whether this category is within the subtree of another category, including the category itself.
+        """
+        return CategoryClosure.objects.filter(
+            ancestor_id=category.id, descendant_id=self.id).exists()
 
     def save(self, *args, **kwargs):
-        # prevent a category to be its own parent
-        if self.id and self.parent and self.id == self.parent.id:
+        # prevent a category to be its own parent, or that of an ancestor
+        if self.id and self.parent and (
+                self.id == self.parent.id or
+                self.parent.is_descendant_of(self)):
             self.parent = None
 
-        super().save(*args, **kwargs)
+        created = self._state.adding
+        old_parent_id, old_name = None, None
+        if not created:
+            old = Category.objects.filter(id=self.id).values_list(
+                'parent_id', 'name').first()
+
+            # A category deleted since it was loaded is inserted again
+            if old is None:
+                created = True
+            else:
+                old_parent_id, old_name = old
+
+        self.__set_path(self.parent)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'path', 'depth'}
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+            if created:
+                CategoryClosure.insert(self)
+            elif old_parent_id != self.parent_id:
+                CategoryClosure.move(self)
+
+            if not created and (
+                    old_parent_id != self.parent_id or old_name != self.name):
+                self.__update_descendant_paths()
+
+    def __update_descendant_paths(self):
+        """
+        Recompute the stored paths and depths of every descendant after this category has been renamed or moved, in one bulk update. Descendants are visited top-down, so each parent is updated before its children.
+        """
+        categories = {self.id: self}
+        descendants = Category.subcategories(self.id).exclude(
+            id=self.id).order_by('depth')
+        now = timezone.now()
+
+        for category in descendants:
+            category.__set_path(categories[category.parent_id])
+            category.updated = now
+            categories[category.id] = category
+
+        Category.objects.bulk_update(
+            [x for x in categories.values() if x is not self],
+            ['path', 'depth', 'updated'],
+            batch_size=500)
 
     class Meta:
-        verbose_name_plural = 'Categories'
\ No newline at end of file
+        verbose_name_plural = 'Categories'
+
+
+class CategoryClosure(models.Model):
+    """
+    Closure table of the category tree, holding one row for every pair of a category and one of its ancestors, including a row linking each category to itself at depth zero. Maintained when categories are saved, and cleared by cascade when they are deleted.
+    """
+    ancestor = models.ForeignKey(
+        Category, related_name='descendant_links', on_delete=models.CASCADE)
+    descendant = models.ForeignKey(
+        Category, related_name='ancestor_links', on_delete=models.CASCADE)
+    depth = models.PositiveSmallIntegerField()
+
+    class Meta:
+        """
+        The metaclass defining a unique constraint over each pair, which doubles as the index for subtree lookups.
+        """
+        constraints = [
+            models.UniqueConstraint(
+                fields=['ancestor', 'descendant'],
+                name='category_closure_unique_pair'),
+        ]
+
+    @classmethod
+    def insert(cls, category):
+        """
+        Class method linking a new leaf category to itself and to every ancestor of its parent.
+        """
+        links = [cls(ancestor=category, descendant=category, depth=0)]
+
+        if category.parent_id:
+            links += [
+                cls(
+                    ancestor_id=ancestor_id,
+                    descendant=category,
+                    depth=depth + 1) for ancestor_id, depth in
+                cls.objects.filter(descendant_id=category.parent_id)
+                .values_list('ancestor_id', 'depth')
+            ]
+
+        cls.objects.bulk_create(links)
+
+    @classmethod
+    def move(cls, category):
+        """
+        Class method relinking the subtree of a category after its parent has changed. Links from outside the subtree are replaced by links from the new ancestors, while links within the subtree are kept.
+        """
+        subtree = list(
+            cls.objects.filter(ancestor_id=category.id).values_list(
+                'descendant_id', 'depth'))
+        subtree_ids = [descendant_id for descendant_id, _ in subtree]
+
+        cls.objects.filter(descendant_id__in=subtree_ids).exclude(
+            ancestor_id__in=subtree_ids).delete()
+
+        if category.parent_id:
+            ancestors = cls.objects.filter(
+                descendant_id=category.parent_id).values_list(
+                    'ancestor_id', 'depth')
+
+            cls.objects.bulk_create(
+                [
+                    cls(
+                        ancestor_id=ancestor_id,
+                        descendant_id=descendant_id,
+                        depth=ancestor_depth + descendant_depth + 1)
+                    for ancestor_id, ancestor_depth in ancestors
+                    for descendant_id, descendant_depth in subtree
+                ])
@@ -1,13 +1,128 @@
-from collections import OrderedDict
-from itertools import chain
+import os
 
-from django.db import models
-from django.db.models.signals import post_save
+from collections import OrderedDict, defaultdict
+from functools import reduce
+from math import ceil
+
+from django.conf import settings
+from django.db import connections, models, transaction
+from django.db.models import (
+    Case, Count, F, FloatField, Func, IntegerField, OuterRef, Q, Subquery,
+    Value, When)
+from django.db.models.functions import Cast, Coalesce
+from django.db.models.signals import post_delete, post_save
+from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from api.models import TimestampedModel
 from .image import Image
 from .category import Category
+from .icon_color import IconColor
+from .icon_ngram import IconNgram, trigrams
+from .pending_icon_count import PendingIconCount
+from ..utils import (
+    AutocompleteIndex, FeatureIndex, PerceptualHash, Renditions)
+
+
+class IconManager(models.Manager):
+    """
+    Manager containing methods to search icons by word and descriptor, backed by trigram indexes, and to find near-duplicate images, backed by difference hash indexes.
+    """
+    # Whether the pg_trgm extension is installed, by database alias
+    __trigram_support = {}
+
+    def has_trigram_support(self):
+        """
+        Return whether the database is PostgreSQL with the pg_trgm extension installed, in which case the trigram table is neither used nor maintained. The result is cached per database alias.
+        """
+        connection = connections[self.db]
+        if connection.vendor != 'postgresql':
+            return False
+
+        if self.db not in self.__trigram_support:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                self.__trigram_support[self.db] = cursor.fetchone() is not None
+
+        return self.__trigram_support[self.db]
+
+    def search(self, query):
+        """
+        Get a queryset of icons matching a query, ranked by exact matches of the word first, then word prefixes, then substrings of the word or descriptor, and finally fuzzy matches of the word. Within each rank, icons are ordered by similarity, then as in search listings.
+
+        Fuzzy matches use trigram similarity from pg_trgm where it is installed, whose trigram indexes also serve substring matches. Elsewhere, they fall back to the precomputed trigram table, and similarity is the fraction of the query's trigrams found in the icon.
+        """
+        key = query.lower().strip()
+        if not key:
+            return self.none()
+
+        threshold = settings.ICON_SEARCH['SIMILARITY_THRESHOLD']
+        substring = Q(word_key__contains=key) | Q(descriptor__icontains=key)
+
+        if self.has_trigram_support():
+            # Compared explicitly, rather than through the % operator, so the
+            # threshold is not left in the session of a pooled connection
+            similarity = Func(
+                F('word_key'),
+                Value(key),
+                function='similarity',
+                output_field=FloatField())
+            queryset = self.get_queryset().alias(
+                similarity=similarity).filter(
+                    substring | Q(similarity__gte=threshold))
+        else:
+            grams = trigrams(key)
+            matches = IconNgram.objects.filter(gram__in=grams).values(
+                'icon').annotate(shared=Count('id')).filter(
+                    shared__gte=ceil(threshold * len(grams))).values('icon')
+            shared = IconNgram.objects.filter(
+                icon=OuterRef('pk'), gram__in=grams).values('icon').annotate(
+                    shared=Count('id')).values('shared')
+
+            queryset = self.get_queryset().filter(
+                substring | Q(id__in=matches))
+            similarity = Cast(
+                Coalesce(Subquery(shared), 0),
+                output_field=FloatField()) / len(grams)
+
+        rank = Case(
+            When(word_key=key, then=Value(0)),
+            When(word_key__startswith=key, then=Value(1)),
+            When(substring, then=Value(2)),
+            default=Value(3),
+            output_field=IntegerField())
+
+        return queryset.annotate(
+            rank=rank, similarity=similarity).order_by(
+                'rank', '-similarity', *Icon.SEARCH_ORDERING)
+
+
+    def near_duplicates(self, dhash, max_distance=None, exclude=None):
+        """
+        Get a list of two-tuples containing icons whose difference hashes are within a Hamming distance of a hash, and that distance, closest first. Candidates are the icons sharing a chunk of the hash, found through the chunk indexes, so the distance must be smaller than the number of chunks. An icon ID may be excluded.
+        """
+        if max_distance is None:
+            max_distance = settings.NEAR_DUPLICATES['MAX_DISTANCE']
+        max_distance = min(max_distance, PerceptualHash.CHUNKS - 1)
+
+        queryset = self.get_queryset().filter(
+            reduce(
+                lambda x, y: x | y, [
+                    Q(**{f'_dhash_{i}': chunk})
+                    for i, chunk in enumerate(PerceptualHash.chunks(dhash))
+                ]))
+        if exclude is not None:
+            queryset = queryset.exclude(id=exclude)
+
+        matches = [
+            (x, PerceptualHash.distance(dhash, x.dhash)) for x in queryset
+        ]
+
+        return sorted(
+            [x for x in matches if x[1] <= max_distance],
+            key=lambda x: (x[1], x[0].id))
 
 
 class Icon(Image):
@@ -15,9 +130,33 @@ class Icon(Image):
     Image file associated with a word, a descriptor, a part of speech, and (for verbs) tense.
     """
 
+    class Meta:
+        """
+        The metaclass defining indexes that back the listing orders and the moderation queue, the latter covering only icons awaiting approval.
+        """
+        indexes = [
+            models.Index(
+                fields=['word_key'],
+                name='icon_word_key_prefix_idx',
+                opclasses=['varchar_pattern_ops']),
+            models.Index(
+                fields=['word_key', 'id'], name='icon_word_key_order_idx'),
+            models.Index(
+                fields=['word_length', 'word_key', 'id'],
+                name='icon_word_length_order_idx'),
+            models.Index(
+                fields=['id'],
+                name='icon_pending_idx',
+                condition=Q(is_approved=False)),
+        ]
+
     # Static variables
     BLOCK_SIZE = 2**12
 
+    # Listing orders, each ending with a unique field for keyset pagination
+    LIST_ORDERING = ('word_key', 'id')
+    SEARCH_ORDERING = ('word_length', 'word_key', 'id')
+
     # Attributes
     word = models.CharField(max_length=40)
     descriptor = models.CharField(blank=True, null=True, max_length=80)
@@ -25,29 +164,238 @@ class Icon(Image):
         Category, blank=True, null=True, on_delete=models.CASCADE)
     is_approved = models.BooleanField(default=False)
 
+    # Sort keys derived from the word, maintained on save
+    word_key = models.CharField(max_length=40, default='', editable=False)
+    word_length = models.PositiveSmallIntegerField(default=0, editable=False)
+
+    # Managers
+    objects = IconManager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the searchable text an instance was loaded with, so that its trigrams are only rebuilt when the text changes, and the word it replaces can be dropped from autocompletion. Likewise, remember the counter of pending icons it was counted in, and the image it was loaded with.
+        """
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_terms = (
+            instance.__dict__.get('word'), instance.__dict__.get('descriptor'))
+        instance._loaded_hash = instance.__dict__.get('_hash')
+        instance._autocomplete_state = instance.__autocomplete_state(
+            instance.__dict__)
+        if {'is_approved', 'category_id'} <= instance.__dict__.keys():
+            instance._loaded_pending = instance.__pending_category()
+
+        return instance
+
+    @staticmethod
+    def __autocomplete_state(values):
+        """
+        Private static method returning the values of an icon that autocompletion depends on, from a dictionary of its fields, None standing for those not loaded.
+        """
+        return tuple(
+            values.get(x) for x in ('word', 'word_key', 'is_approved'))
+
+    def __pending_category(self):
+        """
+        Private method returning the key of the counter of pending icons this icon belongs to (0 for no category), or None if it is approved.
+        """
+        return None if self.is_approved else (self.category_id or 0)
+
+    def save(self, *args, **kwargs):
+        """
+        Update the stored sort keys before saving, and the stored trigrams (where pg_trgm is missing) and counters of pending icons after saving. Once saved with a new image, and the transaction committed, size-optimized variants of the image are produced, the icon is added to the visual similarity index and its dominant colors are stored. A new image stored for an icon that fails to save is removed.
+        """
+        self.word_key = self.word.lower()
+        self.word_length = len(self.word)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'word' in update_fields:
+            kwargs['update_fields'] = {
+                *update_fields, 'word_key', 'word_length'
+            }
+
+        terms = (self.word, self.descriptor)
+        terms_changed = terms != getattr(self, '_loaded_terms', None)
+        self._loaded_terms = terms
+
+        pending = self.__pending_category()
+        if self._state.adding:
+            loaded_pending = None
+        else:
+            loaded_pending = getattr(self, '_loaded_pending', pending)
+        self._loaded_pending = pending
+
+        image_changed = self._hash is not None and \
+            self._hash != getattr(self, '_loaded_hash', None)
+        self._loaded_hash = self._hash
+
+        try:
+            with transaction.atomic():
+                super().save(*args, **kwargs)
+
+                if terms_changed and \
+                        not Icon.objects.has_trigram_support():
+                    IconNgram.refresh(self)
+
+                if loaded_pending != pending:
+                    if loaded_pending is not None:
+                        PendingIconCount.add(loaded_pending, -1)
+                    if pending is not None:
+                        PendingIconCount.add(pending, 1)
+        except BaseException:
+            self.discard_image()
+            raise
+
+        self._written_image = None
+
+        if image_changed:
+            md5, name = self.md5, self.image.name
+            transaction.on_commit(lambda: Renditions.generate(md5, name))
+            transaction.on_commit(self.index_features)
+            transaction.on_commit(lambda: IconColor.refresh(self))
+
+    def index_features(self):
+        """
+        Add the feature vector of the stored image to the visual similarity index, returning whether the image could be read.
+        """
+        try:
+            vector = FeatureIndex.compute(
+                os.path.join(settings.MEDIA_ROOT, self.image.name))
+        except OSError:
+            return False
+
+        FeatureIndex.add(self.id, vector)
+
+        return True
+
+    @property
+    def url(self):
+        """
+        Get the URL of the raw, content-addressed image file.
+        """
+        if not self._hash:
+            return None
+
+        return reverse('api:dict:icon-raw', kwargs={'md5': self.md5})
+
     @property
     def obj(self):
         """
         Serialize relevant fields and properties for JSON output.
         """
-        return OrderedDict(
+        return self.to_obj()
+
+    def to_obj(self, inline=True):
+        """
+        Serialize relevant fields and properties for JSON output. If inline is False, the image is referenced by the URL of the raw file instead of being embedded as a base-64 string.
+        """
+        obj = OrderedDict(
             {
                 'id': self.id,
                 'word': self.word,
                 'descriptor': self.descriptor,
-                'category': self.category.id if self.category else None,
-                'icon': self.b64,
-                'md5': self.md5,
+                'category': self.category_id,
             })
 
+        if inline:
+            obj['icon'] = self.b64
+        else:
+            obj['url'] = self.url
+
+        obj['md5'] = self.md5
+
+        return obj
+
     @classmethod
     def by_category(cls, category_id, filter_kwargs={}):
-        querysets = []
-        for category in Category.subcategories(category_id):
-            querysets.append(
-                cls.objects.filter(category=category, **filter_kwargs))
+        """
+        Get a queryset of icons within a category and its subcategories, resolved in a single query through the category closure table.
+        """
+        return cls.objects.filter(
+            category__in=Category.subcategories(category_id).values('id'),
+            **filter_kwargs)
+
+    @classmethod
+    def listing(cls, search=None, category_id=None, color=None):
+        """
+        Get an ordered queryset of icons, optionally filtered by a case-insensitive word prefix, a category subtree, and a dominant color as an RGB three-tuple, along with the ordering used. Icons are ordered alphabetically, and search results are ordered by word length first. Icons filtered by color are ordered by the distance to their closest dominant color first.
+        """
+        if category_id:
+            queryset = cls.by_category(category_id)
+        else:
+            queryset = cls.objects.all()
+
+        if search:
+            queryset = queryset.filter(word_key__startswith=search.lower())
+            ordering = cls.SEARCH_ORDERING
+        else:
+            ordering = cls.LIST_ORDERING
+
+        if color:
+            queryset = IconColor.nearest(queryset, color)
+            ordering = ('color_distance', *ordering)
+
+        return queryset.order_by(*ordering), ordering
+
+    @classmethod
+    def set_approved(cls, queryset, is_approved=True):
+        """
+        Approve or revoke approval of the icons of a queryset in a single UPDATE of the icons table, returning the number of icons changed. Icons already in the requested state are left untouched. The changed rows are locked beforehand to adjust the counters of pending icons by category. No signals are sent, so the autocompletion index is invalidated once the transaction commits.
+        """
+        with transaction.atomic():
+            rows = list(
+                queryset.order_by().exclude(
+                    is_approved=is_approved).select_for_update().values_list(
+                        'id', 'category_id'))
+            if not rows:
+                return 0
+
+            updated = cls.objects.filter(id__in=[x[0] for x in rows]).update(
+                is_approved=is_approved, updated=timezone.now())
+
+            deltas = defaultdict(int)
+            for _, category_id in rows:
+                deltas[category_id] += -1 if is_approved else 1
+            PendingIconCount.add_many(deltas)
+
+            transaction.on_commit(AutocompleteIndex.invalidate)
+
+        return updated
+
+    @classmethod
+    def count_pending_deletion(cls, sender, instance, **kwargs):
+        """
+        Method to decrement the counter of pending icons when a pending icon is deleted.
+        """
+        if not instance.is_approved:
+            PendingIconCount.add(instance.category_id, -1)
+
+    @classmethod
+    def sync_autocomplete(cls, sender, instance, **kwargs):
+        """
+        Method to update the autocompletion index with the current and former word of an icon, once the saving or deleting transaction commits. Nothing is done unless the approval changed, or the word of an approved icon changed, compared to the values the icon was loaded or last saved with, so that other processes are not made to rebuild needlessly.
+        """
+        if kwargs.get('created'):
+            loaded = (None, None, False)
+        else:
+            loaded = getattr(instance, '_autocomplete_state', (None, ) * 3)
+
+        if 'created' in kwargs:
+            state = cls.__autocomplete_state(instance.__dict__)
+        else:
+            state = (None, None, False)
+        instance._autocomplete_state = state
+
+        # An approval not loaded counts as possibly approved
+        approved = state[2] or loaded[2] is not False
+        if state == loaded or not approved:
+            return
 
-        return list(chain(*querysets))
+        words = {instance.word, loaded[0]}
+        transaction.on_commit(lambda: AutocompleteIndex.sync(words))
 
 
-post_save.connect(Image.post_save, sender=Icon, dispatch_uid='0')
+post_save.connect(Icon.sync_autocomplete, sender=Icon, dispatch_uid='4')
+post_delete.connect(Icon.sync_autocomplete, sender=Icon, dispatch_uid='5')
+post_delete.connect(
+    Icon.count_pending_deletion, sender=Icon, dispatch_uid='6')
@@ -0,0 +1,91 @@
+import os
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import F, OuterRef, Subquery
+
+from ..utils import ColorPalette
+
+
+class IconColor(models.Model):
+    """
+    Dominant color of an icon, as extracted by ColorPalette, with the bucket it falls in indexed for lookups by color. Maintained when icons are saved with a new image.
+    """
+    icon = models.ForeignKey(
+        'dictionary.Icon', related_name='colors', on_delete=models.CASCADE)
+    bucket = models.PositiveSmallIntegerField()
+    share = models.FloatField()
+    red = models.PositiveSmallIntegerField()
+    green = models.PositiveSmallIntegerField()
+    blue = models.PositiveSmallIntegerField()
+
+    class Meta:
+        """
+        The metaclass defining a unique constraint over each icon and bucket, and an index for looking up icons by bucket.
+        """
+        constraints = [
+            models.UniqueConstraint(
+                fields=['icon', 'bucket'], name='icon_color_unique_bucket'),
+        ]
+        indexes = [
+            models.Index(
+                fields=['bucket', 'icon'], name='icon_color_bucket_idx'),
+        ]
+
+    @classmethod
+    def build(cls, icon_id, palette):
+        """
+        Class method returning unsaved color rows for an icon, given its palette.
+        """
+        return [
+            cls(
+                icon_id=icon_id,
+                bucket=bucket,
+                share=share,
+                red=r,
+                green=g,
+                blue=b) for bucket, share, (r, g, b) in palette
+        ]
+
+    @classmethod
+    def refresh(cls, icon):
+        """
+        Class method replacing the stored colors of an icon with the palette of its stored image, returning whether the image could be read.
+        """
+        try:
+            palette = ColorPalette.extract(
+                os.path.join(settings.MEDIA_ROOT, icon.image.name))
+        except OSError:
+            return False
+
+        with transaction.atomic():
+            cls.objects.filter(icon_id=icon.id).delete()
+            cls.objects.bulk_create(cls.build(icon.id, palette))
+
+        return True
+
+    @classmethod
+    def nearest(cls, queryset, rgb, max_distance=None):
+        """
+        Class method narrowing a queryset of icons to those with a dominant color within a Euclidean distance of a color, annotated with the squared distance to their closest such color as "color_distance". Candidates are first found through the bucket index, among the buckets neighbouring the color, so the distance is capped below the width of a bucket.
+        """
+        if max_distance is None:
+            max_distance = settings.ICON_COLORS['MAX_DISTANCE']
+        max_distance = min(max_distance, ColorPalette.BUCKET_WIDTH - 1)
+
+        buckets = ColorPalette.neighbours(rgb)
+        distance = sum(
+            (F(field) - value) * (F(field) - value)
+            for field, value in zip(['red', 'green', 'blue'], rgb))
+
+        closest = cls.objects.filter(
+            icon=OuterRef('pk'), bucket__in=buckets).annotate(
+                distance=distance).filter(
+                    distance__lte=max_distance**2).order_by('distance')
+        candidates = cls.objects.filter(bucket__in=buckets).values('icon')
+
+        return queryset.filter(id__in=candidates).annotate(
+            color_distance=Subquery(
+                closest.values('distance')[:1],
+                output_field=models.IntegerField())).filter(
+                    color_distance__isnull=False)
@@ -0,0 +1,53 @@
+from django.db import models, transaction
+
+
+def trigrams(text):
+    """
+    Split a text into the set of lowercase, space-padded trigrams of each of its words, following the convention of the PostgreSQL pg_trgm extension.
+    """
+    grams = set()
+
+    for word in (text or '').lower().split():
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+
+    return grams
+
+
+class IconNgram(models.Model):
+    """
+    Precomputed trigram of an icon's word or descriptor, used for fuzzy matching on databases without the pg_trgm extension. Maintained when icons are saved on such databases only.
+    """
+    icon = models.ForeignKey(
+        'dictionary.Icon', related_name='ngrams', on_delete=models.CASCADE)
+    gram = models.CharField(max_length=3)
+
+    class Meta:
+        """
+        The metaclass defining a unique constraint over each pair, and an index for looking up icons by trigram.
+        """
+        constraints = [
+            models.UniqueConstraint(
+                fields=['icon', 'gram'], name='icon_ngram_unique_pair'),
+        ]
+        indexes = [
+            models.Index(fields=['gram', 'icon'], name='icon_ngram_gram_idx'),
+        ]
+
+    @classmethod
+    def build(cls, icon):
+        """
+        Class method returning unsaved trigram rows for an icon.
+        """
+        grams = trigrams(icon.word) | trigrams(icon.descriptor)
+
+        return [cls(icon_id=icon.id, gram=gram) for gram in sorted(grams)]
+
+    @classmethod
+    def refresh(cls, icon):
+        """
+        Class method replacing the stored trigrams of an icon.
+        """
+        with transaction.atomic():
+            cls.objects.filter(icon_id=icon.id).delete()
+            cls.objects.bulk_create(cls.build(icon))
@@ -1,19 +1,18 @@
 import hashlib
 import os
+import tempfile
 
 from base64 import b16encode, b64encode
 from collections import OrderedDict
-from functools import partial
 from io import BytesIO
 from PIL import Image
 
 from django.conf import settings
 from django.db import models
-from django.db.models.signals import post_save
 from django.utils.translation import gettext_lazy as _
 
 from api.models import TimestampedModel
-from ..utils import Base64Converter
+from ..utils import Base64Cache, PerceptualHash
 
 
 class Image(TimestampedModel):
@@ -34,7 +33,21 @@ class Image(TimestampedModel):
     # Attributes
     image = models.ImageField(
         blank=True, null=True, default=None, upload_to=RELATIVE_PATH)
-    _hash = models.BinaryField(_('MD5 hash'), null=True, max_length=16)
+    _hash = models.BinaryField(
+        _('MD5 hash'), null=True, max_length=16, db_index=True)
+
+    # Difference hash of the image, and its chunks indexed for near-duplicate
+    # lookups, as split by PerceptualHash
+    _dhash = models.BigIntegerField(
+        _('difference hash'), null=True, editable=False)
+    _dhash_0 = models.PositiveIntegerField(
+        null=True, editable=False, db_index=True)
+    _dhash_1 = models.PositiveIntegerField(
+        null=True, editable=False, db_index=True)
+    _dhash_2 = models.PositiveIntegerField(
+        null=True, editable=False, db_index=True)
+    _dhash_3 = models.PositiveIntegerField(
+        null=True, editable=False, db_index=True)
 
     def __str__(self):
         """
@@ -42,47 +55,109 @@ class Image(TimestampedModel):
         """
         return self.image.name
 
-    def __hash(self):
+    class HashCollision(Exception):
         """
-        Create a MD5 cryptographic hash of the image, store it in the database, and rename the file.
+        Exception to be raised when an uploaded image has the same MD5 hashsum as a stored image, but different contents.
         """
-        hasher = hashlib.md5()
-        filename = os.path.join(settings.MEDIA_ROOT, self.image.name)
+        def __init__(self, md5):
+            return super().__init__(
+                f'An image with MD5 hashsum {md5} and different contents is already stored.'
+            )
 
-        with open(filename, 'rb') as image:
-            for buffer in iter(partial(image.read, self.BLOCK_SIZE), b''):
-                hasher.update(buffer)
+    def set_image(self, upload):
+        """
+        Point the instance at the stored blob of an uploaded file, hashing it in memory beforehand. The file is written under its hashsum only if no identical blob is stored yet, so that the instance needs to be saved only once, and no file is renamed. A blob written here is removed by discard_image() if the instance fails to save. Raises Image.HashCollision if a different blob is stored under the same hashsum.
+        """
+        content = b''.join(upload.chunks())
+        hasher = hashlib.md5(content)
+        name = os.path.join(self.RELATIVE_PATH, hasher.hexdigest())
+        filename = os.path.join(settings.MEDIA_ROOT, name)
+
+        self._written_image = None
+        if not self.__is_stored(filename, content):
+            os.makedirs(os.path.dirname(filename), exist_ok=True)
+            fd, temporary_filename = tempfile.mkstemp(
+                dir=os.path.dirname(filename))
+
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(content)
+
+                # Linking fails if a concurrent upload stored the blob first
+                try:
+                    os.link(temporary_filename, filename)
+                    self._written_image = filename
+                except FileExistsError:
+                    if not self.__is_stored(filename, content):
+                        raise
+            finally:
+                os.remove(temporary_filename)
+
+        self.image.name = name
+        self._hash = hasher.digest()
+        self.set_dhash(BytesIO(content))
+
+        Base64Cache.set(self.md5, str(b64encode(content), 'ascii'))
+
+    def discard_image(self):
+        """
+        Remove the blob written by the last call to set_image(), if any, once saving the instance failed.
+        """
+        filename = getattr(self, '_written_image', None)
+        self._written_image = None
+
+        if filename:
+            try:
+                os.remove(filename)
+            except FileNotFoundError:
+                pass
+
+    @classmethod
+    def __is_stored(cls, filename, content):
+        """
+        Private class method returning whether a file holds some contents, False if it does not exist, and raising Image.HashCollision if it holds other contents.
+        """
+        try:
+            with open(filename, 'rb') as f:
+                stored = f.read()
+        except FileNotFoundError:
+            return False
+
+        if stored != content:
+            raise cls.HashCollision(os.path.basename(filename))
 
-            # Make changes if stored hash does not exist
-            if not self._hash or self._hash != hasher.hexdigest().lower():
-                # Update hash and image name attributes
-                self._hash = hasher.digest()
-                self.image.name = os.path.join(
-                    self.RELATIVE_PATH,
-                    hasher.hexdigest().lower())
+        return True
 
-                # Save
-                from ..models import Icon
-                post_save.disconnect(
-                    Image.post_save, sender=Icon, dispatch_uid='0')
+    def set_dhash(self, f=None):
+        """
+        Compute the difference hash of an image, given its path or a file object, or of the stored image by default, and set it along with its chunks.
+        """
+        if f is None:
+            f = os.path.join(settings.MEDIA_ROOT, self.image.name)
+
+        value = PerceptualHash.compute(f)
 
-                self.save()
+        self._dhash = PerceptualHash.to_signed(value)
+        for i, chunk in enumerate(PerceptualHash.chunks(value)):
+            setattr(self, f'_dhash_{i}', chunk)
 
-                post_save.connect(
-                    Image.post_save, sender=Icon, dispatch_uid='0')
+    @property
+    def dhash(self):
+        """
+        Get the difference hash of the image as an unsigned integer.
+        """
+        if self._dhash is None:
+            return None
 
-                # Update filesystem
-                new_filename = os.path.join(
-                    settings.MEDIA_ROOT, self.image.name)
-                os.rename(filename, new_filename)
+        return PerceptualHash.to_unsigned(self._dhash)
 
     @property
     def b64(self):
         """
-        Convert the image to a base-64 string.
+        Convert the image to a base-64 string, served from the rendition cache when possible.
         """
-        return Base64Converter.encode(
-            self.image.name, block_size=self.BLOCK_SIZE)
+        return Base64Cache.get_or_encode(
+            self.md5, self.image.name, block_size=self.BLOCK_SIZE)
 
     @property
     def md5(self):
@@ -103,12 +178,3 @@ class Image(TimestampedModel):
                 'icon': self.b64,
                 'md5': self.md5,
             })
-
-    @classmethod
-    def post_save(
-            cls, sender, instance, created, raw, using, update_fields,
-            **kwargs):
-        """
-        Method to perform preliminary operations just after instance creation.
-        """
-        instance.__hash()
@@ -1,6 +1,5 @@
 import hashlib
 import os
-import requests
 import string
 
 from base64 import b16encode
@@ -19,7 +18,7 @@ from rest_framework.exceptions import NotFound
 
 from api.exceptions import InternalServerError
 from api.models import TimestampedModel
-from api.dictionary.utils import ExternalAPIManager
+from api.dictionary.utils import Base64Cache, ExternalAPIManager
 
 
 class MP3Manager(models.Manager, ExternalAPIManager):
@@ -44,8 +43,8 @@ class MP3Manager(models.Manager, ExternalAPIManager):
         if subdir in string.punctuation + string.digits:
             subdir = 'number'
 
-        return requests.get(
-            f'https://media.merriam-webster.com/audio/prons/en/us/mp3/{subdir}/{id}.mp3'
+        return cls.request(
+            f"{settings.EXTERNAL_API['MP3_URL']}{subdir}/{id}.mp3"
         )
 
     @classmethod
@@ -119,6 +118,10 @@ class MP3(TimestampedModel):
                     new_filename = os.path.join(
                         settings.MEDIA_ROOT, self.mp3.name)
                     os.rename(filename, new_filename)
+
+                # Populate the rendition cache while the file is hot
+                Base64Cache.get_or_encode(
+                    self.md5, self.mp3.name, block_size=self.BLOCK_SIZE)
         except FileNotFoundError:
             path = Path(working_dir)
             path.mkdir(parents=True, exist_ok=True)
@@ -131,11 +134,10 @@ class MP3(TimestampedModel):
     @property
     def b64(self):
         """
-        Convert the MP3 to a base-64 string.
+        Convert the MP3 to a base-64 string, served from the rendition cache when possible.
         """
-        from api.dictionary.utils import Base64Converter
-
-        return Base64Converter.encode(self.mp3.name, block_size=self.BLOCK_SIZE)
+        return Base64Cache.get_or_encode(
+            self.md5, self.mp3.name, block_size=self.BLOCK_SIZE)
 
     @property
     def md5(self):
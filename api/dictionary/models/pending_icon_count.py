@@ -0,0 +1,57 @@
+from django.db import IntegrityError, models, transaction
+from django.db.models import F
+
+
+class PendingIconCount(models.Model):
+    """
+    Counter of the icons awaiting approval in a category, keyed by category ID, or 0 for icons without a category. Maintained when icons are saved, deleted, or approved in bulk, so the moderation queue never counts rows.
+    """
+    category_id = models.PositiveIntegerField(primary_key=True)
+    count = models.IntegerField(default=0)
+
+    @classmethod
+    def add(cls, category_id, delta):
+        """
+        Class method adding to the counter of a category, creating it if needed.
+        """
+        if not delta:
+            return
+
+        category_id = category_id or 0
+
+        with transaction.atomic():
+            if cls.objects.filter(category_id=category_id).update(
+                    count=F('count') + delta):
+                return
+
+            try:
+                with transaction.atomic():
+                    cls.objects.create(category_id=category_id, count=delta)
+            except IntegrityError:
+                # Created concurrently
+                cls.objects.filter(category_id=category_id).update(
+                    count=F('count') + delta)
+
+    @classmethod
+    def add_many(cls, deltas):
+        """
+        Class method adding to the counters of several categories, given a dictionary of category IDs to deltas.
+        """
+        for category_id, delta in deltas.items():
+            cls.add(category_id, delta)
+
+    @classmethod
+    def recount(cls):
+        """
+        Class method rebuilding every counter from the icons table.
+        """
+        from .icon import Icon
+
+        counts = Icon.objects.filter(is_approved=False).values(
+            'category_id').annotate(n=models.Count('id')).values_list(
+                'category_id', 'n')
+
+        with transaction.atomic():
+            cls.objects.all().delete()
+            cls.objects.bulk_create(
+                [cls(category_id=x or 0, count=n) for x, n in counts])
@@ -1,2 +1,3 @@
 from .word import *
 from .word_entries import *
+from .word_miss import *
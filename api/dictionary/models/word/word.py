@@ -1,51 +1,206 @@
 import json
-from collections import OrderedDict
-from django.db import models
+import os
+import threading
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import OperationalError, connection, models, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from psycopg2 import errorcodes
+from requests.exceptions import RequestException
+from rest_framework import status
+
+from api.exceptions import ServiceUnavailableError
 from api.models import TimestampedModel
 from api.dictionary.utils import DictionaryAPIManager, ThesaurusAPIManager
 
 from .word_entries import DictionaryEntry, ThesaurusEntry
+from .word_miss import WordMiss
 
 
 class WordManager(models.Manager):
     """
     Manager containing a method to pull Word data locally or remotely, depending on what's in store.
     """
+    # First key of the advisory locks taken on words, which sets them apart
+    # from any other advisory locks
+    LOCK_NAMESPACE = 0x776f7264
+
+    __refresh_lock = threading.Lock()
+    __refresh_executor = None
+    __refresh_pid = None
+    __refreshes = {}
+
     @staticmethod
-    def get_word_and_entries(word):
+    def __lock(word):
         """
-        Static method to obtain a word and its corresponding dictionary entries from the local database, creating them if they don't exist.
+        Private static method taking an advisory lock on a word until the end of the current transaction. Raises a ServiceUnavailableError if another lookup of the word holds it for longer than settings.WORD_LOOKUP['LOCK_TIMEOUT'] seconds.
+        """
+        timeout = settings.WORD_LOOKUP['LOCK_TIMEOUT']
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT set_config('lock_timeout', %s, true)",
+                [f'{round(timeout * 1000)}ms'])
+
+            try:
+                cursor.execute(
+                    'SELECT pg_advisory_xact_lock(%s, hashtext(%s))',
+                    [WordManager.LOCK_NAMESPACE, word])
+            except OperationalError as e:
+                if getattr(e.__cause__, 'pgcode',
+                           None) != errorcodes.LOCK_NOT_AVAILABLE:
+                    raise
+
+                raise ServiceUnavailableError(
+                    _('The word "%(word)s" is being looked up. Please try again shortly.') %
+                    {'word': word})
 
-        Returns a two-tuple containing (a) the Word object on a hit or a near miss, and None for any other input, and (b) the list of dictionary entries, None, or a list of suggestions.
+    @staticmethod
+    def __since(stage):
+        """
+        Private static method returning the earliest update time of words still within a stage of the freshness policy, "FRESH_TTL" or "STALE_TTL" in settings.WORD_LOOKUP.
+        """
+        return timezone.now() - timedelta(
+            seconds=settings.WORD_LOOKUP[stage])
 
-        TODO: Add thesaurus and WordNet entries
+    @staticmethod
+    def __fetch(word, since):
         """
-        _word = None
+        Private static method fetching a word from the API and storing it along with its entries, or as a miss if it is not found. Fetches of a word take turns, and the API is not called again if the word was updated after the given time while this fetch waited.
 
-        try:
-            _word = Word.objects.get(id=word)
-        except Word.DoesNotExist:
-            _word = Word.objects.create(id=word)
+        Returns a two-tuple containing the Word object, or None and a list of suggestions on a miss.
+        """
+        with transaction.atomic():
+            WordManager.__lock(word)
+
+            _word = Word.objects.filter(id=word).first()
+            if _word is None:
+                suggestions = WordMiss.suggestions_for(word)
+                if suggestions is not None:
+                    return None, suggestions
+            elif _word.updated >= since:
+                return _word, None
 
             response = DictionaryAPIManager.get(word)
             data = json.loads(response.text)
 
-            if type(data) != list or len(data) == 0:
-                return None, []
-            elif type(data[0]) == str:
-                _word.delete()
-                return None, data
+            if type(data) != list or len(data) == 0 or type(data[0]) == str:
+                suggestions = data if type(data) == list else []
+
+                # Error responses are not cached as misses, and words found
+                # before keep their entries
+                if response.status_code != status.HTTP_200_OK:
+                    pass
+                elif _word is None:
+                    WordMiss.record(word, suggestions)
+                else:
+                    _word.save(update_fields=['updated'])
+
+                return _word, None if _word else suggestions
+
+            if _word is None:
+                _word = Word.objects.create(id=word)
+                WordMiss.objects.filter(id=word).delete()
             else:
-                mw_dict_entries = filter(
-                    lambda x: word == x['meta']['id'].split(':')[0], data)
+                _word.save(update_fields=['updated'])
 
-                for entry in mw_dict_entries:
-                    DictionaryEntry.objects.create(
-                        id=entry['meta']['id'],
-                        word=_word,
-                        json=json.dumps(entry),
-                    )
+            entries = OrderedDict(
+                (x['meta']['id'], x) for x in data
+                if word == x['meta']['id'].split(':')[0])
+
+            stored = DictionaryEntry.objects.filter(word=_word)
+            stored.exclude(id__in=entries).delete()
+
+            updates = list(stored.only('id'))
+            for entry in updates:
+                entry.set_json(entries.pop(entry.id))
+                entry.updated = _word.updated
+
+            creates = []
+            for id, entry_data in entries.items():
+                entry = DictionaryEntry(id=id, word=_word)
+                entry.set_json(entry_data)
+                creates.append(entry)
+
+            DictionaryEntry.objects.bulk_update(
+                updates, ['json', *DictionaryEntry.META_FIELDS, 'updated'])
+            DictionaryEntry.objects.bulk_create(creates)
+
+        return _word, None
+
+    @staticmethod
+    def __refresh(word):
+        """
+        Private static method refreshing a stale word from a background thread. Failures are ignored, since the stale entries are served meanwhile and the next lookup tries again.
+        """
+        try:
+            WordManager.__fetch(word, WordManager.__since('FRESH_TTL'))
+        except (RequestException, ServiceUnavailableError, ValueError):
+            pass
+        finally:
+            connection.close()
+
+            with WordManager.__refresh_lock:
+                WordManager.__refreshes.pop(word, None)
+
+    @staticmethod
+    def refresh_in_background(word):
+        """
+        Static method refreshing a word in a background thread of the current process, and returning a future of the refresh. A word already being refreshed is not refreshed twice.
+        """
+        pid = os.getpid()
+
+        with WordManager.__refresh_lock:
+            # Threads do not survive a fork, so each process has its own pool
+            if WordManager.__refresh_pid != pid:
+                WordManager.__refresh_executor = ThreadPoolExecutor(
+                    max_workers=settings.WORD_LOOKUP['REFRESH_WORKERS'],
+                    thread_name_prefix='word-refresh')
+                WordManager.__refreshes = {}
+                WordManager.__refresh_pid = pid
+
+            future = WordManager.__refreshes.get(word)
+            if future is None:
+                future = WordManager.__refresh_executor.submit(
+                    WordManager.__refresh, word)
+                WordManager.__refreshes[word] = future
+
+            return future
+
+    @staticmethod
+    def get_word_and_entries(word):
+        """
+        Static method to obtain a word and its corresponding dictionary entries from the local database, creating them if they don't exist.
+
+        Words are served as they are while fresh, served and refreshed in the background once stale, and refreshed before they are served once expired, as set in settings.WORD_LOOKUP. Expired words are still served if they cannot be refreshed.
+
+        Returns a two-tuple containing (a) the Word object on a hit or a near miss, and None for any other input, and (b) the list of dictionary entries, None, or a list of suggestions.
+
+        TODO: Add thesaurus and WordNet entries
+        """
+        _word = Word.objects.filter(id=word).first()
+
+        if _word is None:
+            suggestions = WordMiss.suggestions_for(word)
+            if suggestions is None:
+                _word, suggestions = WordManager.__fetch(
+                    word, WordManager.__since('STALE_TTL'))
+
+            if _word is None:
+                return None, suggestions
+        elif _word.updated < WordManager.__since('STALE_TTL'):
+            try:
+                _word, _ = WordManager.__fetch(
+                    word, WordManager.__since('STALE_TTL'))
+            except (RequestException, ServiceUnavailableError, ValueError):
+                pass
+        elif _word.updated < WordManager.__since('FRESH_TTL'):
+            WordManager.refresh_in_background(word)
 
         return _word, DictionaryEntry.objects.filter(word=_word)
 
@@ -65,7 +220,11 @@ class Word(TimestampedModel):
         """
         Property returning an OrderedDict with the following attributes: 'word', which contains the word as a string, 'dictionary', a list of dictionary entries, 'thesaurus', a list of thesaurus entries, 'word-net', data from the Princeton WordNet library.
         """
-        dictionary = [x.obj for x in DictionaryEntry.objects.filter(word=self)]
+        from api.dictionary.projections import WordEntryProjection
+
+        dictionary = WordEntryProjection.serialize_many(
+            WordEntryProjection.queryset(
+                DictionaryEntry.objects.filter(word=self)))
 
         return OrderedDict(
             {
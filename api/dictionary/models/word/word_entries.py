@@ -1,22 +1,32 @@
-import json
-from collections import OrderedDict
-
+from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from api.models import TimestampedModel
-from api.dictionary.models import Icon
 
 
 class WordEntry(TimestampedModel):
     """
     Timestamed, abstract model defining the data associated with a word. Has a string ID and foreign keys to Word, Icon, and MP3 models.
+
+    The headword and the sort key, stems and offensive flag of the metadata are copied into columns of their own when the JSON data is set, so searches read them from SQL rather than parsing each entry.
     """
     class Meta:
         """
-        Metaclass defining the model as abstract.
+        Metaclass defining the model as abstract, and indexing the columns extracted from the JSON data.
         """
         abstract = True
+        indexes = [
+            models.Index(
+                fields=['word', 'sort', 'id'],
+                name='%(class)s_word_sort_idx'),
+            models.Index(fields=['headword'], name='%(class)s_headword_idx'),
+            GinIndex(fields=['stems'], name='%(class)s_stems_idx'),
+        ]
+
+    # Fields extracted from the JSON data by set_json()
+    META_FIELDS = ('headword', 'sort', 'stems', 'offensive')
 
     id = models.CharField(primary_key=True, max_length=64)
     word = models.ForeignKey('dictionary.Word', on_delete=models.CASCADE)
@@ -26,33 +36,44 @@ class WordEntry(TimestampedModel):
         null=True,
         default=None,
         on_delete=models.CASCADE)
+    headword = models.CharField(_('headword'), max_length=128, default='')
+    sort = models.CharField(_('sort key'), max_length=32, default='')
+    stems = ArrayField(
+        models.CharField(max_length=128), verbose_name=_('stems'),
+        default=list)
+    offensive = models.BooleanField(_('offensive'), default=False)
+
+    def set_json(self, data):
+        """
+        Set the JSON data of the entry, along with the columns extracted from it.
+        """
+        meta = data.get('meta', {})
+
+        self.json = data
+        self.headword = data.get('hwi', {}).get('hw', '')[:128]
+        self.sort = meta.get('sort', '')[:32]
+        self.stems = [x[:128] for x in meta.get('stems', [])]
+        self.offensive = meta.get('offensive', False)
 
     @property
     def obj(self):
-        return OrderedDict(
-            {
-                'id':
-                self.id,
-                'icons': [
-                    icon.obj for icon in Icon.objects.filter(
-                        word=self.id, is_approved=True)
-                ],
-                'mp3':
-                self.mp3.b64 if self.mp3 else None,
-                'data':
-                json.loads(self.json),
-            })
+        """
+        Serialize the entry for JSON output, as projected by WordEntryProjection.
+        """
+        from api.dictionary.projections import WordEntryProjection
+
+        return WordEntryProjection.serialize_many([self])[0]
 
 
 class DictionaryEntry(WordEntry):
     """
     An entry pulled from the Merriam-Webster Collegiate Dictionary API. Contains all attributes and properties defined in WordEntry, along with the JSON data from the API.
     """
-    json = models.TextField(_('Merriam-Webster dictionary entry'), default='')
+    json = models.JSONField(_('Merriam-Webster dictionary entry'), default=dict)
 
 
 class ThesaurusEntry(WordEntry):
     """
     An entry pulled from the Merriam-Webster Collegiate Thesaurus API. Contains all attributes and properties defined in WordEntry, along with the JSON data from the API.
     """
-    json = models.TextField(_('Merriam-Webster thesaurus entry'), default='')
+    json = models.JSONField(_('Merriam-Webster thesaurus entry'), default=dict)
@@ -0,0 +1,37 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from api.models import TimestampedModel
+
+
+class WordMiss(TimestampedModel):
+    """
+    Timestamped model for a word missing from the Merriam-Webster dictionary, along with the suggestions returned in its place, if any. Misses are reused for settings.WORD_LOOKUP['MISS_TTL'] seconds, so repeated typos cost one indexed read rather than a call to the API.
+    """
+    id = models.CharField(primary_key=True, max_length=64)
+    suggestions = models.JSONField(
+        _('Merriam-Webster suggestions'), default=list)
+
+    @classmethod
+    def suggestions_for(cls, word):
+        """
+        Class method returning the list of suggestions stored for a word, or None if the word has no miss younger than the TTL.
+        """
+        since = timezone.now() - timedelta(
+            seconds=settings.WORD_LOOKUP['MISS_TTL'])
+
+        return cls.objects.filter(
+            id=word, updated__gte=since).values_list(
+                'suggestions', flat=True).first()
+
+    @classmethod
+    def record(cls, word, suggestions):
+        """
+        Class method storing the suggestions returned for a word, restarting its TTL.
+        """
+        cls.objects.update_or_create(
+            id=word, defaults={'suggestions': suggestions})
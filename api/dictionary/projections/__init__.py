@@ -0,0 +1,3 @@
+from .icon_projections import *
+from .category_projections import *
+from .word_projections import *
@@ -0,0 +1,12 @@
+from api.projections import Projection
+
+
+class CategoryProjection(Projection):
+    """
+    Projection of categories as listed, with their parent referenced by ID.
+    """
+    fields = ('id', 'name', 'path', 'parent')
+
+    @classmethod
+    def serialize(cls, instance):
+        return instance.obj
@@ -0,0 +1,14 @@
+from api.projections import Projection
+
+
+class IconProjection(Projection):
+    """
+    Projection of icons as listed, reading the columns of the serialized fields and of the listing orders, which keyset cursors are encoded from.
+    """
+    fields = (
+        'id', 'word', 'descriptor', 'category', 'image', '_hash', 'word_key',
+        'word_length')
+
+    @classmethod
+    def serialize(cls, instance, inline=True):
+        return instance.to_obj(inline=inline)
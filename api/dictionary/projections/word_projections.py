@@ -0,0 +1,38 @@
+from collections import OrderedDict, defaultdict
+
+from api.projections import Projection
+
+from ..models import Icon
+from .icon_projections import IconProjection
+
+
+class WordEntryProjection(Projection):
+    """
+    Projection of dictionary and thesaurus entries, with their MP3 joined and the approved icons of all entries loaded in one query. Icons are matched to entries by word rather than by a foreign key, so they are loaded by prepare().
+    """
+    fields = ('id', 'json', 'mp3', 'mp3__id', 'mp3__mp3', 'mp3___hash')
+    select_related = ('mp3', )
+
+    @classmethod
+    def prepare(cls, instances):
+        icons = defaultdict(list)
+        queryset = IconProjection.queryset(
+            Icon.objects.filter(
+                word__in={x.id for x in instances},
+                is_approved=True).order_by('id'))
+
+        for icon in queryset:
+            icons[icon.word].append(icon)
+
+        for instance in instances:
+            instance._icons = icons[instance.id]
+
+    @classmethod
+    def serialize(cls, instance):
+        return OrderedDict(
+            {
+                'id': instance.id,
+                'icons': [IconProjection.serialize(x) for x in instance._icons],
+                'mp3': instance.mp3.b64 if instance.mp3 else None,
+                'data': instance.json,
+            })
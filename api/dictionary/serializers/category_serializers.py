@@ -27,4 +27,9 @@ class CategorySerializer(serializers.ModelSerializer):
         except Category.DoesNotExist:
             return None
 
+        if self.instance and value.is_descendant_of(self.instance):
+            raise ValidationError(
+                _('A category cannot be moved into its own subtree.'),
+                'invalid_parent')
+
         return value
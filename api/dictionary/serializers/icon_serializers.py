@@ -1,7 +1,13 @@
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import ErrorDetail, ValidationError
+
+from api.exceptions import ConflictError
 
 from ..models import Word, Icon, DictionaryEntry, Category
 
@@ -35,26 +41,42 @@ class IconUploadSerializer(serializers.Serializer):
         return descriptor
 
     def save(self):
-        icon = Icon.objects.create(
-            image=self.validated_data['icon'],
+        """
+        Create an icon in a single write, storing the uploaded image under its hashsum unless an identical image is stored already. Icons with identical or similar images are flagged as likely duplicates in the attribute "duplicates".
+        """
+        icon = Icon(
             word=self.validated_data['word'],
+            descriptor=self.validated_data.get('descriptor'),
             category=self.validated_data['category'],
         )
-        should_save = False
-
-        try:
-            icon.descriptor = self.validated_data['descriptor']
-            should_save = True
-        except KeyError:
-            pass
 
         user = self.context['request'].user
         if user and (user.is_staff or user.is_superuser):
             icon.is_approved = True
-            should_save = True
 
-        if should_save:
-            icon.save()
+        try:
+            icon.set_image(self.validated_data['icon'])
+        except Icon.HashCollision:
+            raise ConflictError(
+                ErrorDetail(
+                    _(
+                        'A different image with the same hashsum is already stored. Please modify the image and try again.'
+                    ), 'hash_collision'))
+
+        icon.save()
+        self.instance = icon
+
+        self.duplicates = [
+            OrderedDict(
+                {
+                    'id': x.id,
+                    'word': x.word,
+                    'md5': x.md5,
+                    'distance': distance,
+                })
+            for x, distance in Icon.objects.near_duplicates(
+                icon.dhash, exclude=icon.id)
+        ]
 
         return icon
 
@@ -66,6 +88,68 @@ class IconApproveSerializer(serializers.Serializer):
     id = serializers.IntegerField(write_only=True, required=True)
 
 
+class IconBulkApproveSerializer(serializers.Serializer):
+    """
+    Serializer for the bulk icon approve action. Defines write-only attributes ids, or category and search as a filter, along with is_approved.
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        allow_empty=False)
+    category = serializers.PrimaryKeyRelatedField(
+        queryset=Category.objects.all(), required=False)
+    search = serializers.CharField(required=False, max_length=40)
+    is_approved = serializers.BooleanField(required=False, default=True)
+
+    def validate_ids(self, ids):
+        if len(ids) > settings.MAX_BATCH_LEN['icon']:
+            raise ValidationError(
+                _('No more than %(max)d icons may be moderated at once.') %
+                {'max': settings.MAX_BATCH_LEN['icon']}, 'too_many')
+
+        return list(OrderedDict.fromkeys(ids))
+
+    def validate(self, data):
+        if 'ids' in data and ('category' in data or 'search' in data):
+            raise ValidationError(
+                _('Either a list of IDs or a filter must be given, not both.'),
+                'bad_request')
+
+        if not {'ids', 'category', 'search'} & data.keys():
+            raise ValidationError(
+                _('A list of IDs or a filter is required.'), 'required')
+
+        return data
+
+    def save(self):
+        """
+        Apply the approval to the selected icons in a single UPDATE, and return the counts of icons changed, icons already in the requested state, and any IDs not found.
+        """
+        ids = self.validated_data.get('ids')
+        category = self.validated_data.get('category')
+
+        with transaction.atomic():
+            if ids:
+                icons = Icon.objects.filter(id__in=ids)
+                found = set(icons.values_list('id', flat=True))
+                matched = len(found)
+            else:
+                icons, ordering = Icon.listing(
+                    search=self.validated_data.get('search'),
+                    category_id=category.id if category else None)
+                matched = icons.count()
+
+            updated = Icon.set_approved(
+                icons, self.validated_data['is_approved'])
+
+        return OrderedDict(
+            {
+                'updated': updated,
+                'unchanged': matched - updated,
+                'missing': [x for x in ids if x not in found] if ids else [],
+            })
+
+
 class IconRetrieveSerializer(serializers.ModelSerializer):
     """
     Serializer for the icon retrieve action. Defines read-only attributes id, icon, and md5.
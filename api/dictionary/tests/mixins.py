@@ -0,0 +1,139 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.test import override_settings
+
+from ..models import Icon
+from ..utils import ExternalAPIManager
+
+
+class IconFixturesMixin:
+    """
+    Class containing methods to create icons in an isolated media directory, which is removed after each test.
+    """
+    icon_filepath = os.path.join(
+        settings.BASE_DIR, 'api/dictionary/tests/media/img/can.GIF')
+
+    def setUp(self):
+        """
+        Initialization method where a temporary media directory is created.
+        """
+        super().setUp()
+
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+
+        media_override = override_settings(MEDIA_ROOT=media_root)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+    def create_icon(self, word='can', content=None, **kwargs):
+        """
+        Method to create an icon from the contents of a file, defaulting to the test GIF.
+        """
+        if content is None:
+            with open(self.icon_filepath, 'rb') as f:
+                content = f.read()
+
+        icon = Icon(word=word, **kwargs)
+        icon.set_image(ContentFile(content, name=f'{word}.gif'))
+        icon.save()
+
+        return icon
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    Request handler of a local stub server, answering each path through the route registered for it, called with the number of requests to the path so far.
+    """
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        path = self.path.split('?')[0]
+
+        with server.lock:
+            server.hits[path] = server.hits.get(path, 0) + 1
+            server.ports.append(self.client_address[1])
+            hits = server.hits[path]
+
+        code, body, delay = 404, '', 0
+        if path in server.routes:
+            code, body, delay = server.routes[path](hits)
+
+        time.sleep(delay)
+
+        body = body.encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class StubServerMixin:
+    """
+    Class containing methods to answer requests to external APIs from a local stub server, which is stopped after each test.
+    """
+    def setUp(self):
+        """
+        Initialization method where the stub server is started on a free port, and the shared session is rebuilt with the current settings.
+        """
+        super().setUp()
+
+        self.stub_server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        self.stub_server.daemon_threads = True
+        self.stub_server.lock = threading.Lock()
+        self.stub_server.routes = {}
+        self.stub_server.hits = {}
+        self.stub_server.ports = []
+
+        threading.Thread(target=self.stub_server.serve_forever).start()
+        self.addCleanup(self.stub_server.server_close)
+        self.addCleanup(self.stub_server.shutdown)
+
+        dictionary_override = override_settings(
+            EXTERNAL_API={
+                **settings.EXTERNAL_API,
+                'DICTIONARY_URL': self.stub_url('/dictionary/'),
+            })
+        dictionary_override.enable()
+        self.addCleanup(dictionary_override.disable)
+
+        ExternalAPIManager.close_session()
+        self.addCleanup(ExternalAPIManager.close_session)
+
+    def stub_url(self, path):
+        """
+        Method returning the URL of a path on the stub server.
+        """
+        return f'http://127.0.0.1:{self.stub_server.server_port}{path}'
+
+    def stub_route(self, path, route):
+        """
+        Method registering a function answering requests to a path, which is given the number of requests to the path so far and returns a three-tuple of a status code, a body, and a delay in seconds.
+        """
+        self.stub_server.routes[path] = route
+
+    def stub_dictionary(self, word, data, delay=0):
+        """
+        Method answering dictionary lookups of a word with data encoded as JSON, after an optional delay.
+        """
+        self.stub_route(
+            f'/dictionary/{word}', lambda hits: (200, json.dumps(data), delay))
+
+    def stub_hits(self, path):
+        """
+        Method returning the number of requests to a path on the stub server.
+        """
+        return self.stub_server.hits.get(path, 0)
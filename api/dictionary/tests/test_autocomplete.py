@@ -0,0 +1,193 @@
+import os
+
+from unittest import mock
+
+from django.conf import settings
+from django.db import connections
+from django.test import TransactionTestCase, override_settings
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from api.tests.mixins import TestCaseShortcutsMixin
+
+from ..models import Icon
+from ..utils import AutocompleteIndex
+from .mixins import IconFixturesMixin
+
+
+class AutocompleteTests(
+        IconFixturesMixin, TestCaseShortcutsMixin, APITestCase):
+    """
+    Tests to check the autocompletion index and endpoint, and that the index follows icon saves and deletions.
+    """
+    client = APIClient()
+
+    url_name = 'api:dict:icon-autocomplete'
+    url_path = f'/api/{settings.VERSION}/icons/autocomplete'
+
+    words = ['Cart', 'can', 'Banana', 'cat', 'apple', 'candle']
+
+    def setUp(self):
+        """
+        Initialization method where approved icons and one unapproved icon are created.
+        """
+        super().setUp()
+
+        AutocompleteIndex.clear()
+        self.addCleanup(AutocompleteIndex.clear)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            for word in self.words:
+                self.create_icon(word=word, is_approved=True)
+            self.create_icon(word='cab')
+
+    def test_complete(self):
+        """
+        Ensure completions match a case-insensitive prefix, are ordered alphabetically, and exclude unapproved icons.
+        """
+        self.assertEqual(
+            AutocompleteIndex.complete('CA'), ['can', 'candle', 'Cart', 'cat'])
+        self.assertEqual(AutocompleteIndex.complete('ca', 2), ['can', 'candle'])
+        self.assertEqual(AutocompleteIndex.complete('z'), [])
+
+    def test_no_queries(self):
+        """
+        Ensure completions from a built index do not query the database.
+        """
+        AutocompleteIndex.complete('c')
+
+        with self.assertNumQueries(0):
+            AutocompleteIndex.complete('ba')
+
+    def test_signals(self):
+        """
+        Ensure the index follows approvals, renames, and deletions.
+        """
+        AutocompleteIndex.complete('')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            icon = Icon.objects.get(word='cab')
+            icon.is_approved = True
+            icon.save()
+
+            icon = Icon.objects.get(word='Cart')
+            icon.word = 'Carton'
+            icon.save()
+
+            Icon.objects.get(word='cat').delete()
+
+        self.assertEqual(
+            AutocompleteIndex.complete('ca'),
+            ['cab', 'can', 'candle', 'Carton'])
+
+    def test_unrelated_changes(self):
+        """
+        Ensure saves that leave the approved words unchanged, and changes to unapproved icons, do not update the index.
+        """
+        with mock.patch.object(AutocompleteIndex, 'sync') as sync, \
+                self.captureOnCommitCallbacks(execute=True):
+            icon = Icon.objects.get(word='cat')
+            icon.descriptor = 'Feline'
+            icon.save()
+
+            icon = Icon.objects.get(word='cab')
+            icon.word = 'cob'
+            icon.save()
+            icon.delete()
+
+            self.create_icon(word='cub')
+
+        sync.assert_not_called()
+
+        with mock.patch.object(AutocompleteIndex, 'sync') as sync, \
+                self.captureOnCommitCallbacks(execute=True):
+            icon = Icon.objects.only('id', 'word').get(word='cat')
+            icon.save()
+
+        sync.assert_called_once()
+
+    def test_stats(self):
+        """
+        Ensure the index reports its size and memory footprint.
+        """
+        AutocompleteIndex.complete('')
+        stats = AutocompleteIndex.stats()
+
+        self.assertEqual(stats['entries'], len(self.words))
+        self.assertGreater(stats['bytes'], 0)
+
+    def test_view(self):
+        """
+        Ensure the endpoint returns completions, limited by the "results" query parameter.
+        """
+        response = self.client.get(
+            self.url_path, {
+                'search': 'ca',
+                'results': 3
+            })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data'], ['can', 'candle', 'Cart'])
+
+
+class AutocompleteProcessesTests(IconFixturesMixin, TransactionTestCase):
+    """
+    Tests to check that changes made by one process reach the indexes of the others.
+    """
+    def setUp(self):
+        """
+        Initialization method where an approved and an unapproved icon are created, and the index of this process is built.
+        """
+        super().setUp()
+
+        AutocompleteIndex.clear()
+        self.addCleanup(AutocompleteIndex.clear)
+
+        self.create_icon(word='can', is_approved=True)
+        self.create_icon(word='cab')
+
+        self.assertEqual(AutocompleteIndex.complete('ca'), ['can'])
+
+    def __in_child_process(self, function):
+        """
+        Method calling a function in a forked process, on a database connection of its own, and waiting for it to succeed.
+        """
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                # The parent's connection must be neither used nor closed
+                for connection in connections.all():
+                    connection.connection = None
+                function()
+                status = 0
+            finally:
+                os._exit(status)
+
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+
+    @override_settings(AUTOCOMPLETE={'CHECK_INTERVAL': 0})
+    def test_bulk_approval(self):
+        """
+        Ensure a bulk approval in another process, which sends no signals, invalidates the index of this process.
+        """
+        self.__in_child_process(
+            lambda: Icon.set_approved(Icon.objects.filter(word='cab')))
+
+        self.assertEqual(AutocompleteIndex.complete('ca'), ['cab', 'can'])
+
+    @override_settings(AUTOCOMPLETE={'CHECK_INTERVAL': 0})
+    def test_save(self):
+        """
+        Ensure an icon saved in another process reaches the index of this process.
+        """
+        def approve():
+            icon = Icon.objects.get(word='cab')
+            icon.is_approved = True
+            icon.save()
+
+        self.__in_child_process(approve)
+
+        self.assertEqual(AutocompleteIndex.complete('ca'), ['cab', 'can'])
@@ -0,0 +1,77 @@
+import os
+
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from ..utils import Base64Cache, Base64Converter
+from .mixins import IconFixturesMixin
+
+
+class Base64CacheTests(IconFixturesMixin, TestCase):
+    """
+    Tests to check the base-64 rendition cache and its use by icons.
+    """
+
+    def setUp(self):
+        """
+        Initialization method where the cache is emptied.
+        """
+        super().setUp()
+
+        Base64Cache.clear()
+
+    def test_populated_at_hash_time(self):
+        """
+        Ensure the rendition is cached when an icon is hashed, so later reads do not touch the file.
+        """
+        icon = self.create_icon()
+        b64 = Base64Converter.encode(icon.image.name)
+
+        os.remove(os.path.join(settings.MEDIA_ROOT, icon.image.name))
+
+        self.assertEqual(icon.b64, b64)
+        self.assertEqual(icon.b64, b64)
+
+        stats = Base64Cache.stats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 0)
+        self.assertEqual(stats['entries'], 1)
+        self.assertEqual(stats['bytes'], len(b64))
+
+    def test_miss(self):
+        """
+        Ensure an unknown hashsum counts as a miss.
+        """
+        self.assertIsNone(Base64Cache.get('0' * 32))
+        self.assertEqual(Base64Cache.stats()['misses'], 1)
+
+    @override_settings(B64_CACHE={'MAX_BYTES': 8})
+    def test_eviction_by_size(self):
+        """
+        Ensure the least recently used entries are evicted once the local tier exceeds its size limit.
+        """
+        Base64Cache.set('a' * 32, 'AAAA')
+        Base64Cache.set('b' * 32, 'BBBB')
+        Base64Cache.get('a' * 32)
+        Base64Cache.set('c' * 32, 'CCCC')
+
+        self.assertEqual(Base64Cache.get('a' * 32), 'AAAA')
+        self.assertIsNone(Base64Cache.get('b' * 32))
+        self.assertEqual(Base64Cache.get('c' * 32), 'CCCC')
+        self.assertEqual(Base64Cache.stats()['bytes'], 8)
+
+    def test_stats_command(self):
+        """
+        Ensure the command reads each icon once from the file and once from the cache.
+        """
+        icon = self.create_icon()
+
+        out = StringIO()
+        call_command('b64_stats', stdout=out)
+
+        self.assertIn(
+            f'1 entries, {len(icon.b64)} bytes, 1 hits, 1 misses',
+            out.getvalue())
@@ -0,0 +1,59 @@
+import os
+import tempfile
+
+from base64 import b64encode
+
+from django.test import SimpleTestCase
+
+from ..utils import Base64Converter
+
+
+class Base64ConverterTests(SimpleTestCase):
+    """
+    Tests to check the one-shot and streaming base-64 encoders against the standard library.
+    """
+
+    def __write(self, content):
+        """
+        Method to write content to a temporary file, which is removed after the test.
+        """
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            f.write(content)
+
+        self.addCleanup(os.remove, f.name)
+
+        return f.name
+
+    def test_encode(self):
+        """
+        Ensure files on either side of the memory-mapping threshold are encoded correctly.
+        """
+        for size in (0, 1, 2, 3, Base64Converter.MMAP_THRESHOLD + 1):
+            content = os.urandom(size)
+            path = self.__write(content)
+
+            self.assertEqual(
+                Base64Converter.encode(absolute_path=path),
+                str(b64encode(content), 'utf-8'))
+
+    def test_iter_encode(self):
+        """
+        Ensure streamed chunks are padded only at the end and concatenate to the one-shot output.
+        """
+        content = os.urandom(1000)
+        path = self.__write(content)
+
+        chunks = list(
+            Base64Converter.iter_encode(absolute_path=path, chunk_size=100))
+
+        self.assertEqual(len(chunks), 11)
+        for chunk in chunks[:-1]:
+            self.assertNotIn('=', chunk)
+        self.assertEqual(''.join(chunks), str(b64encode(content), 'utf-8'))
+
+    def test_improperly_defined_path(self):
+        """
+        Ensure exactly one of a relative and an absolute path is required.
+        """
+        with self.assertRaises(Base64Converter.ImproperlyDefinedPath):
+            Base64Converter.encode()
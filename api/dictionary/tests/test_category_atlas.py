@@ -0,0 +1,191 @@
+import os
+
+from io import BytesIO, StringIO
+
+from PIL import Image
+
+from django.conf import settings
+from django.core.management import call_command
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from api.tests.mixins import TestCaseShortcutsMixin
+
+from ..models import Category
+from ..utils import SpriteAtlas
+from .mixins import IconFixturesMixin
+
+
+class CategoryAtlasTests(
+        IconFixturesMixin, TestCaseShortcutsMixin, APITestCase):
+    """
+    Tests to check sprite atlases of the approved icons in a category subtree.
+    """
+    client = APIClient()
+
+    url_name = 'api:dict:category-atlas'
+
+    def __gif(self, color, size=(64, 54)):
+        """
+        Method returning the contents of a GIF image of a single color.
+        """
+        f = BytesIO()
+        Image.new('RGB', size, color).save(f, format='GIF')
+
+        return f.getvalue()
+
+    def setUp(self):
+        """
+        Initialization method where icons of different colors are created in a category and its subcategory.
+        """
+        super().setUp()
+
+        self.root = Category.objects.create(name='Root')
+        self.child = Category.objects.create(name='Child', parent=self.root)
+
+        self.red = self.create_icon(
+            word='red',
+            content=self.__gif('red'),
+            category=self.root,
+            is_approved=True)
+        self.blue = self.create_icon(
+            word='blue',
+            content=self.__gif('blue', (32, 54)),
+            category=self.child,
+            is_approved=True)
+        self.create_icon(
+            word='green', content=self.__gif('green'), category=self.child)
+
+        self.url_path = \
+            f'/api/{settings.VERSION}/categories/{self.root.id}/atlas'
+        self.reverse_kwargs = {'pk': self.root.id}
+
+    def test_success(self):
+        """
+        Ensure the atlas holds every approved icon of the subtree at its mapped position.
+        """
+        response = self.client.get(self.url_path)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        data = response.data['data']
+        self.assertEqual(
+            [x['word'] for x in data['icons']], ['blue', 'red'])
+
+        key = response['ETag'].strip('"')
+        self.assertEqual(
+            data['url'],
+            f'/api/{settings.VERSION}/atlas/{self.root.id}/{key}.png')
+        self.assertFalse(data['truncated'])
+
+        with Image.open(SpriteAtlas.absolute_path(self.root.id, key)) as sheet:
+            sheet = sheet.convert('RGB')
+            self.assertEqual(sheet.size, (data['width'], data['height']))
+
+            colors = [(0, 0, 255), (255, 0, 0)]
+            for icon, color in zip(data['icons'], colors):
+                self.assertEqual(
+                    sheet.getpixel((icon['x'], icon['y'])), color)
+
+        blue = data['icons'][0]
+        self.assertEqual((blue['width'], blue['height']), (32, 54))
+
+    def test_raw(self):
+        """
+        Ensure the atlas sheet is served with immutable caching headers.
+        """
+        data = self.client.get(self.url_path).data['data']
+        response = self.client.get(data['url'])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertIn('immutable', response['Cache-Control'])
+
+    def test_not_modified(self):
+        """
+        Ensure we get an empty HTTP 304 response while membership is unchanged.
+        """
+        etag = self.client.get(self.url_path)['ETag']
+        response = self.client.get(self.url_path, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_membership_change(self):
+        """
+        Ensure a new atlas is built when an icon joins the subtree, and the former one remains available.
+        """
+        response = self.client.get(self.url_path)
+        etag, url = response['ETag'], response.data['data']['url']
+
+        self.create_icon(
+            word='white',
+            content=self.__gif('white'),
+            category=self.root,
+            is_approved=True)
+        response = self.client.get(self.url_path, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['data']['icons']), 3)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_200_OK)
+
+    def test_prune(self):
+        """
+        Ensure the least recently requested atlases are removed beyond the maximum number stored.
+        """
+        atlas = {**settings.SPRITE_ATLAS, 'MAX_ATLASES': 2}
+        with self.settings(SPRITE_ATLAS=atlas):
+            first = self.client.get(self.url_path).data['data']['url']
+            second = self.client.get(
+                f'/api/{settings.VERSION}/categories/{self.child.id}/atlas'
+            ).data['data']['url']
+
+            # Requesting the first atlas again makes the second the oldest
+            for url in [first, second]:
+                category_id, filename = url.split('/')[-2:]
+                os.utime(
+                    SpriteAtlas.absolute_path(
+                        category_id, filename[:-len('.png')], 'json'),
+                    (0, 0))
+            self.client.get(self.url_path)
+
+            self.create_icon(
+                word='white',
+                content=self.__gif('white'),
+                category=self.root,
+                is_approved=True)
+            self.client.get(self.url_path)
+
+        self.assertEqual(
+            self.client.get(first).status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.client.get(second).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_prune_command(self):
+        """
+        Ensure the command removes atlases beyond the given number.
+        """
+        url = self.client.get(self.url_path).data['data']['url']
+
+        out = StringIO()
+        call_command('prune_atlases', max_atlases=0, stdout=out)
+
+        self.assertIn('1 atlases removed', out.getvalue())
+        self.assertEqual(
+            self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(SpriteAtlas.prune(0), 0)
+
+    def test_truncated(self):
+        """
+        Ensure no more than the maximum number of icons are packed, the first ones in listing order.
+        """
+        max_batch_len = {**settings.MAX_BATCH_LEN, 'atlas': 1}
+        with self.settings(MAX_BATCH_LEN=max_batch_len):
+            response = self.client.get(self.url_path)
+
+        data = response.data['data']
+        self.assertTrue(data['truncated'])
+        self.assertEqual([x['word'] for x in data['icons']], ['blue'])
+        self.assertEqual(
+            (data['width'], data['height']),
+            (SpriteAtlas.CELL_WIDTH, SpriteAtlas.CELL_HEIGHT))
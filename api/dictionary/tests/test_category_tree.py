@@ -0,0 +1,123 @@
+from django.test import TestCase
+
+from ..models import Category, CategoryClosure, Icon
+
+
+class CategoryTreeTests(TestCase):
+    """
+    Tests to check that the category closure table follows changes to the tree, and that subtree lookups take a single query.
+    """
+
+    def setUp(self):
+        """
+        Initialization method where a small tree of categories is created.
+        """
+        self.nouns = Category.objects.create(name='Nouns')
+        self.food = Category.objects.create(name='Food', parent=self.nouns)
+        self.fruit = Category.objects.create(name='Fruit', parent=self.food)
+        self.verbs = Category.objects.create(name='Verbs')
+
+        Icon.objects.create(word='apple', category=self.fruit)
+        Icon.objects.create(word='bread', category=self.food)
+        Icon.objects.create(word='run', category=self.verbs)
+
+    def __subtree(self, category):
+        return set(
+            Category.subcategories(category.id).values_list('name', flat=True))
+
+    def test_subcategories(self):
+        """
+        Ensure a subtree is resolved in one query.
+        """
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.__subtree(self.nouns), {'Nouns', 'Food', 'Fruit'})
+
+    def test_by_category(self):
+        """
+        Ensure the icons in a subtree are resolved in one query.
+        """
+        with self.assertNumQueries(1):
+            words = set(
+                Icon.by_category(self.nouns.id).values_list('word', flat=True))
+
+        self.assertEqual(words, {'apple', 'bread'})
+
+    def test_move(self):
+        """
+        Ensure moving a category relinks its whole subtree.
+        """
+        self.food.parent = self.verbs
+        self.food.save()
+
+        self.assertEqual(self.__subtree(self.nouns), {'Nouns'})
+        self.assertEqual(
+            self.__subtree(self.verbs), {'Verbs', 'Food', 'Fruit'})
+        self.assertEqual(
+            CategoryClosure.objects.get(
+                ancestor=self.verbs, descendant=self.fruit).depth, 2)
+
+    def test_cycle(self):
+        """
+        Ensure a category cannot become a child of its own descendant.
+        """
+        self.nouns.parent = self.fruit
+        self.nouns.save()
+
+        self.assertIsNone(self.nouns.parent)
+        self.assertEqual(
+            self.__subtree(self.nouns), {'Nouns', 'Food', 'Fruit'})
+
+    def test_delete(self):
+        """
+        Ensure deleting a category removes its subtree and its links.
+        """
+        self.food.delete()
+
+        self.assertEqual(self.__subtree(self.nouns), {'Nouns'})
+        self.assertFalse(
+            CategoryClosure.objects.filter(
+                descendant_id=self.fruit.id).exists())
+
+    def test_path(self):
+        """
+        Ensure stored paths and depths follow renames and moves of an ancestor.
+        """
+        self.assertEqual(self.fruit.path, 'Nouns » Food')
+        self.assertEqual(self.fruit.depth, 2)
+
+        self.nouns.name = 'Things'
+        self.nouns.save()
+        self.fruit.refresh_from_db()
+        self.assertEqual(self.fruit.path, 'Things » Food')
+
+        self.food.parent = self.verbs
+        self.food.save()
+        self.fruit.refresh_from_db()
+        self.assertEqual(self.fruit.path, 'Verbs » Food')
+        self.assertEqual(str(self.fruit), 'Verbs » Food » Fruit')
+
+    def test_deep_path(self):
+        """
+        Ensure paths are stored whatever the depth of a category and the length of the names of its ancestors.
+        """
+        parent = self.fruit
+        for i in range(20):
+            parent = Category.objects.create(
+                name=f'{i:02}' * 20, parent=parent)
+
+        parent.refresh_from_db()
+        self.assertEqual(parent.depth, 22)
+        self.assertEqual(
+            len(parent.path), len('Nouns » Food » Fruit') + 19 * 43)
+
+    def test_save_deleted(self):
+        """
+        Ensure a category deleted since it was loaded is inserted again when saved, along with its links.
+        """
+        stale = Category.objects.get(id=self.verbs.id)
+        Category.objects.filter(id=self.verbs.id).delete()
+
+        stale.save()
+
+        self.assertEqual(self.__subtree(stale), {'Verbs'})
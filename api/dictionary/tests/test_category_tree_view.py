@@ -0,0 +1,60 @@
+from django.conf import settings
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from api.tests.mixins import TestCaseShortcutsMixin
+
+from ..models import Category
+
+
+class CategoryTreeViewTests(TestCaseShortcutsMixin, APITestCase):
+    """
+    Tests to check the endpoint returning the whole category hierarchy.
+    """
+    client = APIClient()
+
+    url_name = 'api:dict:category-tree'
+    url_path = f'/api/{settings.VERSION}/categories/tree'
+
+    def setUp(self):
+        """
+        Initialization method where a small tree of categories is created.
+        """
+        self.nouns = Category.objects.create(name='Nouns')
+        self.food = Category.objects.create(name='Food', parent=self.nouns)
+        self.animals = Category.objects.create(
+            name='Animals', parent=self.nouns)
+        self.fruit = Category.objects.create(name='Fruit', parent=self.food)
+        self.verbs = Category.objects.create(name='Verbs')
+
+    def test_success(self):
+        """
+        Ensure the hierarchy is returned as nested objects from one query.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url_path)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        roots = response.data['data']
+        self.assertEqual([x['name'] for x in roots], ['Nouns', 'Verbs'])
+        self.assertEqual(
+            [x['name'] for x in roots[0]['children']], ['Animals', 'Food'])
+        self.assertEqual(
+            roots[0]['children'][1]['children'][0]['name'], 'Fruit')
+
+    def test_not_modified(self):
+        """
+        Ensure an unchanged tree yields an HTTP 304 response, and a changed one does not.
+        """
+        etag = self.client.get(self.url_path)['ETag']
+
+        response = self.client.get(self.url_path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.fruit.name = 'Fruits'
+        self.fruit.save()
+
+        response = self.client.get(self.url_path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
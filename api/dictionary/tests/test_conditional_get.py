@@ -0,0 +1,112 @@
+from django.conf import settings
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from ..models import Category
+from .mixins import IconFixturesMixin
+
+
+class ConditionalGetTests(IconFixturesMixin, APITestCase):
+    """
+    Tests to check entity tags and modification times of icon and category collections, and the HTTP 304 responses they allow.
+    """
+    client = APIClient()
+
+    icons_path = f'/api/{settings.VERSION}/icons'
+    search_path = f'/api/{settings.VERSION}/icons/search/can'
+    categories_path = f'/api/{settings.VERSION}/categories'
+
+    def setUp(self):
+        """
+        Initialization method where a category and icons are created.
+        """
+        super().setUp()
+
+        self.category = Category.objects.create(name='Containers')
+        self.can = self.create_icon(word='can', category=self.category)
+        self.create_icon(word='candle', category=self.category)
+
+    def __revalidate(self, path, **params):
+        """
+        Method to request a collection twice, the second time conditionally, and return both responses.
+        """
+        response = self.client.get(path, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+        return response, self.client.get(
+            path, params, HTTP_IF_NONE_MATCH=response['ETag'])
+
+    def test_icons(self):
+        """
+        Ensure an unchanged icon list is answered with an HTTP 304 response from a single query.
+        """
+        response = self.client.get(self.icons_path)
+
+        with self.assertNumQueries(1):
+            revalidated = self.client.get(
+                self.icons_path, HTTP_IF_NONE_MATCH=response['ETag'])
+
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(revalidated['ETag'], response['ETag'])
+        self.assertFalse(revalidated.content)
+
+    def test_icons_changed(self):
+        """
+        Ensure updates and deletions change the entity tag of the icon list.
+        """
+        etags = {self.client.get(self.icons_path)['ETag']}
+
+        self.can.word = 'tin'
+        self.can.save()
+        etags.add(self.client.get(self.icons_path)['ETag'])
+
+        self.can.delete()
+        etags.add(self.client.get(self.icons_path)['ETag'])
+
+        self.assertEqual(len(etags), 3)
+
+    def test_icons_filtered(self):
+        """
+        Ensure the entity tag follows the filtered queryset, and also applies to cursor pages.
+        """
+        _, revalidated = self.__revalidate(self.icons_path, search='cand')
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        _, revalidated = self.__revalidate(self.icons_path, cursor='')
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_if_modified_since(self):
+        """
+        Ensure the modification time alone can be used to revalidate.
+        """
+        response = self.client.get(self.icons_path)
+        revalidated = self.client.get(
+            self.icons_path,
+            HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_search(self):
+        """
+        Ensure unchanged search results are answered with an HTTP 304 response.
+        """
+        _, revalidated = self.__revalidate(self.search_path)
+
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_categories(self):
+        """
+        Ensure an unchanged category list is answered with an HTTP 304 response, and a new category changes its entity tag.
+        """
+        response, revalidated = self.__revalidate(self.categories_path)
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Category.objects.create(name='Tools')
+        revalidated = self.client.get(
+            self.categories_path, HTTP_IF_NONE_MATCH=response['ETag'])
+
+        self.assertEqual(revalidated.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(revalidated.data['data']), 2)
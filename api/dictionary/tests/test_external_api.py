@@ -0,0 +1,94 @@
+import os
+import time
+
+from django.conf import settings
+from django.test import SimpleTestCase, override_settings
+
+from requests.exceptions import ReadTimeout
+
+from ..utils import DictionaryAPIManager, ExternalAPIManager
+from .mixins import StubServerMixin
+
+
+@override_settings(
+    EXTERNAL_API={
+        **settings.EXTERNAL_API,
+        'READ_TIMEOUT': 0.25,
+        'BACKOFF_FACTOR': 0.01,
+    })
+class ExternalAPIManagerTests(StubServerMixin, SimpleTestCase):
+    """
+    Tests to check the pooled session used for requests to external APIs, against a local stub server.
+    """
+    def setUp(self):
+        """
+        Initialization method where the stub server is given paths that succeed, fail twice before succeeding, always fail, or answer after a second.
+        """
+        super().setUp()
+
+        self.stub_route('/ok', lambda hits: (200, f'/ok {hits}', 0))
+        self.stub_route(
+            '/flaky',
+            lambda hits: (503 if hits <= 2 else 200, f'/flaky {hits}', 0))
+        self.stub_route('/down', lambda hits: (503, f'/down {hits}', 0))
+        self.stub_route('/slow', lambda hits: (200, f'/slow {hits}', 1))
+
+    def test_keep_alive(self):
+        """
+        Ensure consecutive requests, from any manager, reuse one connection.
+        """
+        for manager in [ExternalAPIManager, DictionaryAPIManager] * 2:
+            response = manager.request(self.stub_url('/ok'))
+            self.assertEqual(response.status_code, 200)
+
+        self.assertIs(
+            DictionaryAPIManager.session(), ExternalAPIManager.session())
+        self.assertEqual(len(self.stub_server.ports), 4)
+        self.assertEqual(len(set(self.stub_server.ports)), 1)
+
+    def test_retry(self):
+        """
+        Ensure failed requests are retried, and the last response is returned once retries run out.
+        """
+        response = ExternalAPIManager.request(self.stub_url('/flaky'))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.text, '/flaky 3')
+
+        response = ExternalAPIManager.request(self.stub_url('/down'))
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(
+            self.stub_hits('/down'), settings.EXTERNAL_API['RETRIES'] + 1)
+
+    def test_timeout(self):
+        """
+        Ensure a slow response raises an error within the read timeout rather than holding the worker.
+        """
+        start = time.monotonic()
+        with self.assertRaises(ReadTimeout):
+            ExternalAPIManager.request(self.stub_url('/slow'))
+
+        self.assertLess(time.monotonic() - start, 0.9)
+
+    def test_fork(self):
+        """
+        Ensure a forked process builds its own session rather than sharing the connections of its parent.
+        """
+        session = ExternalAPIManager.session()
+
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(
+                write_fd,
+                b'1' if ExternalAPIManager.session() is not session else b'0')
+            os._exit(0)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd, 'rb') as f:
+            self.assertEqual(f.read(), b'1')
+
+        os.waitpid(pid, 0)
+        self.assertIs(ExternalAPIManager.session(), session)
@@ -0,0 +1,81 @@
+import hashlib
+import os
+
+from io import BytesIO
+
+from PIL import Image as PILImage
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+
+from api.authentication.models import User
+
+from ..models import Icon
+from ..utils import Base64Cache, Renditions
+from .mixins import IconFixturesMixin
+
+
+class IconAdminTests(IconFixturesMixin, TestCase):
+    """
+    Tests to check that icons uploaded through the admin site are stored like those uploaded through the API.
+    """
+    databases = {'default', 'admin_db'}
+
+    url_path = '/admin/dictionary/icon/'
+
+    def setUp(self):
+        """
+        Initialization method where an administrator is logged in.
+        """
+        super().setUp()
+
+        self.admin = User.objects.create_superuser(
+            'bob', 'bob@example.com', 'Easypass123!')
+        self.client.force_login(self.admin)
+
+    def __upload(self, path, word='can'):
+        with open(self.icon_filepath, 'rb') as f:
+            upload = SimpleUploadedFile(
+                'Can.GIF', f.read(), content_type='image/gif')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                path, {
+                    'word': word,
+                    'descriptor': '',
+                    'image': upload,
+                })
+
+    def test_add(self):
+        """
+        Ensure an uploaded image is stored under its hashsum, along with its difference hash, cached rendition and variants.
+        """
+        response = self.__upload(f'{self.url_path}add/')
+        self.assertEqual(response.status_code, 302)
+
+        icon = Icon.objects.get(word='can')
+        with open(self.icon_filepath, 'rb') as f:
+            self.assertEqual(icon.md5, hashlib.md5(f.read()).hexdigest())
+        self.assertEqual(icon.image.name, f'{Icon.RELATIVE_PATH}/{icon.md5}')
+        self.assertIsNotNone(icon.dhash)
+        self.assertIsNotNone(Base64Cache.get(icon.md5))
+
+        for variant in Renditions.CONTENT_TYPES:
+            self.assertTrue(
+                os.path.isfile(Renditions.absolute_path(icon.md5, variant)))
+
+    def test_change(self):
+        """
+        Ensure replacing the image of an icon stores and hashes the new image.
+        """
+        f = BytesIO()
+        PILImage.new('RGB', (64, 54), 'red').save(f, format='GIF')
+        icon = self.create_icon(content=f.getvalue())
+        md5 = icon.md5
+
+        response = self.__upload(f'{self.url_path}{icon.id}/change/')
+        self.assertEqual(response.status_code, 302)
+
+        icon.refresh_from_db()
+        self.assertNotEqual(icon.md5, md5)
+        self.assertEqual(icon.image.name, f'{Icon.RELATIVE_PATH}/{icon.md5}')
@@ -0,0 +1,124 @@
+from io import BytesIO
+
+from PIL import Image
+
+from django.conf import settings
+from django.test import override_settings
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from api import NON_FIELD_ERRORS_KEY
+from api.authentication.models import User
+from api.tests.mixins import TestCaseShortcutsMixin
+
+from .mixins import IconFixturesMixin
+
+
+class IconBatchTests(IconFixturesMixin, TestCaseShortcutsMixin, APITestCase):
+    """
+    Tests to check retrieval of several icons at once by ID and MD5 hashsum.
+    """
+    client = APIClient()
+
+    url_name = 'api:dict:icon-batch'
+    url_path = f'/api/{settings.VERSION}/icons/batch'
+
+    databases = {'default', 'admin_db'}
+
+    def setUp(self):
+        """
+        Initialization method where approved icons and one awaiting approval are created.
+        """
+        super().setUp()
+
+        self.icons = [
+            self.create_icon(word=x, is_approved=True)
+            for x in ['can', 'tin', 'jar']
+        ]
+
+        # An image of its own, as the others share the test GIF
+        f = BytesIO()
+        Image.new('RGB', (64, 54), 'red').save(f, format='GIF')
+        self.pending = self.create_icon(word='pot', content=f.getvalue())
+
+    def __get(self, **params):
+        return self.client.get(self.url_path, {'inline': 'false', **params})
+
+    def test_success(self):
+        """
+        Ensure icons are returned in the requested order from a single query, with missing icons reported per item.
+        """
+        can, tin, jar = self.icons
+        ids = f'{jar.id},{can.id},999999,{jar.id}'
+        md5s = f'{tin.md5},{"0" * 32}'
+
+        with self.assertNumQueries(1):
+            response = self.__get(ids=ids, md5s=md5s)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [x and x['id'] for x in response.data['data']['ids']],
+            [jar.id, can.id, None])
+        self.assertEqual(
+            [x and x['md5'] for x in response.data['data']['md5s']],
+            [tin.md5, None])
+        self.assertEqual(
+            response.data['missing'], {
+                'ids': [999999],
+                'md5s': ['0' * 32]
+            })
+
+    def test_pending(self):
+        """
+        Ensure icons awaiting approval are reported as missing, except to administrators.
+        """
+        params = {'ids': self.pending.id, 'md5s': self.pending.md5}
+        response = self.__get(**params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['missing'], {
+                'ids': [self.pending.id],
+                'md5s': [self.pending.md5]
+            })
+
+        admin = User.objects.create_superuser(
+            'bob', 'bob@example.com', 'Easypass123!')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {admin.access}')
+        response = self.__get(**params)
+
+        self.assertEqual(response.data['missing'], {'ids': [], 'md5s': []})
+        self.assertEqual(
+            response.data['data']['ids'][0]['id'], self.pending.id)
+
+    def test_invalid_id(self):
+        """
+        Ensure we get an HTTP 400 response for a malformed ID.
+        """
+        response = self.__get(ids='1,two')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data[NON_FIELD_ERRORS_KEY][0].code, 'invalid_type')
+
+    def test_empty(self):
+        """
+        Ensure we get an HTTP 400 response when nothing is requested.
+        """
+        response = self.__get()
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data[NON_FIELD_ERRORS_KEY][0].code, 'required')
+
+    @override_settings(MAX_BATCH_LEN={'icon': 2})
+    def test_too_many(self):
+        """
+        Ensure we get an HTTP 400 response when too many icons are requested.
+        """
+        response = self.__get(ids=','.join(str(x.id) for x in self.icons))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data[NON_FIELD_ERRORS_KEY][0].code, 'too_many')
@@ -0,0 +1,130 @@
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from api import NON_FIELD_ERRORS_KEY
+from api.authentication.models import User
+from api.tests.mixins import TestCaseShortcutsMixin
+
+from ..models import Category, Icon
+from ..utils import AutocompleteIndex
+from .mixins import IconFixturesMixin
+
+
+class IconBulkApproveTests(
+        IconFixturesMixin, TestCaseShortcutsMixin, APITestCase):
+    """
+    Tests to check approval of many icons at once, by IDs or by a filter.
+    """
+    client = APIClient()
+    databases = {'default', 'admin_db'}
+
+    url_name = 'api:dict:icon-approve-many'
+    url_path = f'/api/{settings.VERSION}/icons/approve'
+
+    def setUp(self):
+        """
+        Initialization method where an administrator and unapproved icons in two categories are created.
+        """
+        super().setUp()
+
+        self.admin = User.objects.create_superuser(
+            'bob', 'bob@example.com', 'Easypass123!')
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {self.admin.access}')
+
+        self.food = Category.objects.create(name='Food')
+        self.tools = Category.objects.create(name='Tools')
+
+        self.icons = [
+            self.create_icon(word=word, category=category)
+            for word, category in [
+                ('apple', self.food),
+                ('bread', self.food),
+                ('hammer', self.tools),
+                ('saw', self.tools),
+            ]
+        ]
+
+        AutocompleteIndex.clear()
+        self.addCleanup(AutocompleteIndex.clear)
+
+    def __post(self, data):
+        return self.client.post(self.url_path, data, format='json')
+
+    def test_ids(self):
+        """
+        Ensure icons are approved by ID in a single update, with counts of changed, unchanged, and missing icons.
+        """
+        apple, bread, _, _ = self.icons
+        Icon.set_approved(Icon.objects.filter(id=bread.id))
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.__post({'ids': [apple.id, bread.id, 999999]})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['data'], {
+                'updated': 1,
+                'unchanged': 1,
+                'missing': [999999],
+            })
+        self.assertEqual(
+            set(
+                Icon.objects.filter(is_approved=True).values_list(
+                    'word', flat=True)), {'apple', 'bread'})
+        self.assertEqual(
+            len([
+                x for x in queries
+                if x['sql'].startswith('UPDATE "dictionary_icon"')
+            ]), 1)
+
+    def test_filter(self):
+        """
+        Ensure icons are approved by category, and approval is revoked by search prefix.
+        """
+        response = self.__post({'category': self.tools.id})
+        self.assertEqual(response.data['data']['updated'], 2)
+
+        response = self.__post({'search': 'SA', 'is_approved': False})
+        self.assertEqual(response.data['data']['updated'], 1)
+
+        self.assertEqual(
+            list(
+                Icon.objects.filter(is_approved=True).values_list(
+                    'word', flat=True)), ['hammer'])
+
+    def test_autocomplete(self):
+        """
+        Ensure the autocompletion index is refreshed after a bulk approval.
+        """
+        self.assertEqual(AutocompleteIndex.complete('a'), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.__post({'ids': [x.id for x in self.icons]})
+
+        self.assertEqual(AutocompleteIndex.complete('a'), ['apple'])
+
+    def test_invalid(self):
+        """
+        Ensure we get an HTTP 400 response without a selection, or with both IDs and a filter.
+        """
+        for data in [{}, {'ids': [1], 'search': 'a'}]:
+            response = self.__post(data)
+
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(NON_FIELD_ERRORS_KEY, response.data)
+
+    def test_unauthorized(self):
+        """
+        Ensure users other than administrators cannot approve icons.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+        response = self.__post({'ids': [self.icons[0].id]})
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertFalse(Icon.objects.filter(is_approved=True).exists())
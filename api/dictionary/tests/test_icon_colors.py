@@ -0,0 +1,125 @@
+from io import BytesIO, StringIO
+
+from PIL import Image as PILImage
+
+from django.conf import settings
+from django.core.management import call_command
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from ..models import IconColor
+from ..utils import ColorPalette
+from .mixins import IconFixturesMixin
+
+
+class IconColorTests(IconFixturesMixin, APITestCase):
+    """
+    Tests to check the extraction of dominant colors from icons, and the filter of icon listings by color.
+    """
+    client = APIClient()
+
+    url_path = f'/api/{settings.VERSION}/icons'
+
+    def setUp(self):
+        """
+        Initialization method where icons of red, dark red, blue, and red and green halves are created.
+        """
+        super().setUp()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.red = self.create_icon('red', self.__gif((255, 0, 0)))
+            self.maroon = self.create_icon(
+                'maroon', self.__gif((230, 20, 20)))
+            self.blue = self.create_icon('blue', self.__gif((0, 0, 255)))
+            self.halves = self.create_icon(
+                'halves', self.__gif((255, 0, 0), (0, 255, 0)))
+
+    @staticmethod
+    def __gif(left, right=None):
+        """
+        Method returning the contents of a GIF whose halves are filled with one or two colors, on a transparent border.
+        """
+        image = PILImage.new('RGBA', (40, 54), (0, 0, 0, 0))
+        image.paste(left, (4, 4, 20, 50))
+        image.paste(right or left, (20, 4, 36, 50))
+
+        f = BytesIO()
+        image.save(f, format='GIF')
+
+        return f.getvalue()
+
+    def __list(self, **params):
+        response = self.client.get(
+            self.url_path, {'inline': 'false', **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response
+
+    def test_palette(self):
+        """
+        Ensure the dominant colors of an icon are stored with their shares of the opaque pixels, ignoring transparent ones.
+        """
+        colors = IconColor.objects.filter(
+            icon=self.halves).order_by('bucket')
+
+        self.assertEqual(
+            [(x.red, x.green, x.blue, x.share) for x in colors],
+            [(0, 255, 0, 0.5), (255, 0, 0, 0.5)])
+        self.assertEqual(
+            [x.bucket for x in colors], [
+                ColorPalette.bucket((0, 255, 0)),
+                ColorPalette.bucket((255, 0, 0)),
+            ])
+
+    def test_filter(self):
+        """
+        Ensure icons are filtered by color, closest first, then alphabetically.
+        """
+        response = self.__list(color='#ff0000')
+
+        self.assertEqual(
+            [x['word'] for x in response.data['data']],
+            ['halves', 'red', 'maroon'])
+
+        response = self.__list(color='00f')
+        self.assertEqual(
+            [x['word'] for x in response.data['data']], ['blue'])
+
+        response = self.__list(color='ff0000', search='ma')
+        self.assertEqual(
+            [x['word'] for x in response.data['data']], ['maroon'])
+
+    def test_cursor(self):
+        """
+        Ensure keyset pagination follows the color ordering.
+        """
+        words, cursor = [], ''
+        while cursor is not None:
+            response = self.__list(color='ff0000', results=1, cursor=cursor)
+            words += [x['word'] for x in response.data['data']]
+            cursor = response.data['pagination']['nextCursor']
+
+        self.assertEqual(words, ['halves', 'red', 'maroon'])
+
+    def test_invalid(self):
+        """
+        Ensure we get an HTTP 400 response for a color that is not hexadecimal RGB.
+        """
+        response = self.client.get(self.url_path, {'color': 'red'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_backfill(self):
+        """
+        Ensure the backfill command restores the colors of every icon, using worker processes.
+        """
+        IconColor.objects.all().delete()
+
+        out = StringIO()
+        call_command('colors', workers=2, stdout=out)
+
+        self.assertIn('4 icons processed', out.getvalue())
+        self.assertEqual(
+            [x['word'] for x in self.__list(color='ff0000').data['data']],
+            ['halves', 'red', 'maroon'])
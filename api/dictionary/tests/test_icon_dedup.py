@@ -0,0 +1,98 @@
+import hashlib
+import os
+
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+
+from api.exceptions import ConflictError
+
+from ..models import Category, Icon
+from ..serializers import IconUploadSerializer
+from .mixins import IconFixturesMixin
+
+
+class IconDeduplicationTests(IconFixturesMixin, TestCase):
+    """
+    Tests to check that uploads are stored under their hashsum in a single write, that identical uploads share one file, and that hash collisions are refused.
+    """
+
+    def setUp(self):
+        """
+        Initialization method where a category and the upload contents are prepared.
+        """
+        super().setUp()
+
+        self.category = Category.objects.create(name='Containers')
+
+        with open(self.icon_filepath, 'rb') as f:
+            self.content = f.read()
+        self.md5 = hashlib.md5(self.content).hexdigest()
+
+    def __upload(self, word='can', content=None):
+        """
+        Method to upload an icon through the upload serializer, as an administrator.
+        """
+        upload = SimpleUploadedFile(
+            'upload.gif', content or self.content, content_type='image/gif')
+        serializer = IconUploadSerializer(
+            data={
+                'icon': upload,
+                'word': word,
+                'category': self.category.id,
+            },
+            context={
+                'request': SimpleNamespace(
+                    user=SimpleNamespace(is_staff=True, is_superuser=False))
+            })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+
+        return serializer.save()
+
+    def __stored_files(self):
+        """
+        Method returning the names of stored originals, leaving out their variants.
+        """
+        return sorted(
+            x for x in os.listdir(
+                os.path.join(settings.MEDIA_ROOT, Icon.RELATIVE_PATH))
+            if '.' not in x)
+
+    def test_hash_before_write(self):
+        """
+        Ensure the upload is written under its hashsum, with its hashsum saved in the same write.
+        """
+        icon = self.__upload()
+        icon.refresh_from_db()
+
+        self.assertEqual(icon.md5, self.md5)
+        self.assertEqual(icon.image.name, f'{Icon.RELATIVE_PATH}/{self.md5}')
+        self.assertTrue(icon.is_approved)
+        self.assertEqual(self.__stored_files(), [self.md5])
+
+    def test_deduplication(self):
+        """
+        Ensure identical uploads point at a single stored file.
+        """
+        can = self.__upload('can')
+        tin = self.__upload('tin')
+
+        self.assertNotEqual(can.id, tin.id)
+        self.assertEqual(can.image.name, tin.image.name)
+        self.assertEqual(self.__stored_files(), [self.md5])
+
+    def test_collision(self):
+        """
+        Ensure an upload is refused when different contents are stored under its hashsum.
+        """
+        directory = os.path.join(settings.MEDIA_ROOT, Icon.RELATIVE_PATH)
+        os.makedirs(directory)
+        with open(os.path.join(directory, self.md5), 'wb') as f:
+            f.write(b'different contents')
+
+        with self.assertRaises(ConflictError):
+            self.__upload()
+
+        self.assertFalse(Icon.objects.exists())
@@ -0,0 +1,124 @@
+from django.conf import settings
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from api import NON_FIELD_ERRORS_KEY
+from api.tests.mixins import TestCaseShortcutsMixin
+
+from ..models import Category, Icon
+from .mixins import IconFixturesMixin
+
+
+class IconListTests(IconFixturesMixin, TestCaseShortcutsMixin, APITestCase):
+    """
+    Tests to check ordering, filtering, and both pagination modes of the icon list endpoint.
+    """
+    client = APIClient()
+
+    url_name = 'api:dict:icon-list'
+    url_path = f'/api/{settings.VERSION}/icons'
+
+    words = ['Cart', 'can', 'Banana', 'cat', 'apple', 'Ca', 'candle']
+
+    def setUp(self):
+        """
+        Initialization method where icons are created in two categories.
+        """
+        super().setUp()
+
+        self.root = Category.objects.create(name='Root')
+        self.child = Category.objects.create(name='Child', parent=self.root)
+        self.other = Category.objects.create(name='Other')
+
+        for i, word in enumerate(self.words):
+            category = self.child if i % 2 else self.other
+            self.create_icon(word=word, category=category)
+
+    def __get(self, **params):
+        response = self.client.get(
+            self.url_path, {'inline': 'false', **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response.data
+
+    def test_ordering(self):
+        """
+        Ensure icons are ordered alphabetically without regard to case.
+        """
+        data = self.__get()
+
+        self.assertEqual(
+            [x['word'] for x in data['data']],
+            sorted(self.words, key=str.lower))
+        self.assertEqual(
+            data['pagination']['totalResults'], len(self.words))
+
+    def test_search_ordering(self):
+        """
+        Ensure search results match a case-insensitive prefix and are ordered by length, then alphabetically.
+        """
+        data = self.__get(search='CA')
+
+        self.assertEqual(
+            [x['word'] for x in data['data']],
+            ['Ca', 'can', 'cat', 'Cart', 'candle'])
+
+    def test_category(self):
+        """
+        Ensure icons are filtered by a category subtree.
+        """
+        data = self.__get(category=self.root.id)
+
+        self.assertEqual(
+            [x['word'] for x in data['data']], ['Ca', 'can', 'cat'])
+
+    def test_cursor(self):
+        """
+        Ensure keyset pages cover every icon exactly once, in order.
+        """
+        words = []
+        data = self.__get(cursor='', results=3)
+        pages = 1
+
+        while True:
+            words += [x['word'] for x in data['data']]
+            if not data['pagination']['nextPageExists']:
+                break
+
+            data = self.__get(
+                cursor=data['pagination']['nextCursor'], results=3)
+            pages += 1
+
+        self.assertEqual(pages, 3)
+        self.assertEqual(words, sorted(self.words, key=str.lower))
+
+    def test_invalid_cursor(self):
+        """
+        Ensure we get an HTTP 400 response for a malformed cursor.
+        """
+        response = self.client.get(self.url_path, {'cursor': 'invalid!'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data[NON_FIELD_ERRORS_KEY][0].code, 'invalid_cursor')
+
+    def test_invalid_results(self):
+        """
+        Ensure we get an HTTP 400 response for a non-integer page length.
+        """
+        response = self.client.get(self.url_path, {'results': 'many'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_sort_keys(self):
+        """
+        Ensure the stored sort keys follow changes to the word.
+        """
+        icon = Icon.objects.get(word='apple')
+        icon.word = 'Zucchini'
+        icon.save(update_fields=['word'])
+        icon.refresh_from_db()
+
+        self.assertEqual(icon.word_key, 'zucchini')
+        self.assertEqual(icon.word_length, 8)
@@ -0,0 +1,122 @@
+from io import BytesIO, StringIO
+from types import SimpleNamespace
+
+from PIL import Image as PILImage, ImageOps
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..models import Category, Icon
+from ..serializers import IconUploadSerializer
+from ..utils import PerceptualHash
+from .mixins import IconFixturesMixin
+
+
+class IconNearDuplicateTests(IconFixturesMixin, TestCase):
+    """
+    Tests to check that difference hashes are stored with icons, and that uploads of similar images are flagged as likely duplicates.
+    """
+
+    def setUp(self):
+        """
+        Initialization method where a category is created.
+        """
+        super().setUp()
+
+        self.category = Category.objects.create(name='Containers')
+
+    def __variant(self, transform):
+        """
+        Method returning the contents of the test GIF re-saved after a transformation, keeping its transparency.
+        """
+        f = BytesIO()
+        with PILImage.open(self.icon_filepath) as image:
+            transform(image.convert('RGBA')).save(f, format='GIF')
+
+        return f.getvalue()
+
+    @staticmethod
+    def __brighten(image):
+        """
+        Method slightly brightening the colors of an image, leaving its alpha channel.
+        """
+        *bands, alpha = image.split()
+
+        bands = [x.point(lambda v: min(255, v + 8)) for x in bands]
+
+        return PILImage.merge('RGBA', [*bands, alpha])
+
+    def __upload(self, word, content=None):
+        """
+        Method to upload an icon through the upload serializer, returning the serializer.
+        """
+        if content is None:
+            with open(self.icon_filepath, 'rb') as f:
+                content = f.read()
+
+        serializer = IconUploadSerializer(
+            data={
+                'icon': SimpleUploadedFile(
+                    f'{word}.gif', content, content_type='image/gif'),
+                'word': word,
+                'category': self.category.id,
+            },
+            context={
+                'request': SimpleNamespace(
+                    user=SimpleNamespace(is_staff=False, is_superuser=False))
+            })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        serializer.save()
+
+        return serializer
+
+    def test_stored(self):
+        """
+        Ensure the difference hash and its chunks are stored with uploaded and created icons alike.
+        """
+        expected = PerceptualHash.compute(self.icon_filepath)
+
+        for icon in [self.__upload('can').instance, self.create_icon('tin')]:
+            icon = Icon.objects.get(id=icon.id)
+
+            self.assertEqual(icon.dhash, expected)
+            self.assertEqual(
+                [getattr(icon, f'_dhash_{i}') for i in range(4)],
+                PerceptualHash.chunks(expected))
+
+    def test_flagged(self):
+        """
+        Ensure uploads of identical and slightly recolored images are flagged, closest first, but not uploads of different images.
+        """
+        original = self.create_icon('can')
+
+        recolored = self.__upload('tin', self.__variant(self.__brighten))
+        self.assertEqual(
+            [x['id'] for x in recolored.duplicates], [original.id])
+        self.assertLessEqual(recolored.duplicates[0]['distance'], 3)
+
+        identical = self.__upload('jar')
+        self.assertEqual(
+            [(x['id'], x['distance']) for x in identical.duplicates][0],
+            (original.id, 0))
+
+        mirrored = self.__upload('pot', self.__variant(ImageOps.mirror))
+        self.assertEqual(mirrored.duplicates, [])
+
+    def test_backfill(self):
+        """
+        Ensure the backfill command hashes icons stored without a difference hash.
+        """
+        icon = self.create_icon('can')
+        Icon.objects.update(
+            _dhash=None, _dhash_0=None, _dhash_1=None, _dhash_2=None,
+            _dhash_3=None)
+
+        out = StringIO()
+        call_command('dhash', stdout=out)
+
+        self.assertIn('1 icons hashed', out.getvalue())
+        icon.refresh_from_db()
+        self.assertEqual(
+            icon.dhash, PerceptualHash.compute(self.icon_filepath))
@@ -0,0 +1,97 @@
+from io import BytesIO
+
+from PIL import Image as PILImage
+
+from django.conf import settings
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from api.tests.mixins import TestCaseShortcutsMixin
+
+from .mixins import IconFixturesMixin
+
+
+class IconRawTests(IconFixturesMixin, TestCaseShortcutsMixin, APITestCase):
+    """
+    Tests to check the content-addressed icon file endpoint, along with the option to reference icons by URL in list and retrieve responses.
+    """
+    client = APIClient()
+
+    url_name = 'api:dict:icon-raw'
+
+    def setUp(self):
+        """
+        Initialization method where an icon is created.
+        """
+        super().setUp()
+
+        self.icon = self.create_icon()
+
+        self.url_path = f'/api/{settings.VERSION}/icons/{self.icon.md5}'
+        self.reverse_kwargs = {'md5': self.icon.md5}
+
+    def test_success(self):
+        """
+        Ensure we get an icon with immutable caching headers, as the smaller of the original and optimized GIF files.
+        """
+        response = self.client.get(self.url_path)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'image/gif')
+        self.assertIn(
+            response['ETag'], [f'"{self.icon.md5}"', f'"{self.icon.md5}.gif"'])
+        self.assertIn('immutable', response['Cache-Control'])
+
+        content = b''.join(response.streaming_content)
+        with open(self.icon_filepath, 'rb') as f:
+            self.assertLessEqual(len(content), len(f.read()))
+
+        with PILImage.open(BytesIO(content)) as image, \
+                PILImage.open(self.icon_filepath) as original:
+            self.assertEqual(image.size, original.size)
+
+    def test_not_modified(self):
+        """
+        Ensure we get an empty HTTP 304 response when the client already holds the icon.
+        """
+        etag = self.client.get(self.url_path)['ETag']
+        response = self.client.get(self.url_path, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_not_found(self):
+        """
+        Ensure we get an HTTP 404 response for an unknown hashsum.
+        """
+        response = self.client.get(
+            f'/api/{settings.VERSION}/icons/{"0" * 32}')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_list_by_url(self):
+        """
+        Ensure icons are referenced by URL instead of base-64 data when requested.
+        """
+        response = self.client.get(
+            f'/api/{settings.VERSION}/icons', {'inline': 'false'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        icon = response.data['data'][0]
+        self.assertNotIn('icon', icon)
+        self.assertEqual(icon['url'], self.url_path)
+
+    def test_retrieve_by_url(self):
+        """
+        Ensure a single icon is referenced by URL instead of base-64 data when requested.
+        """
+        response = self.client.get(
+            f'/api/{settings.VERSION}/icons/{self.icon.id}',
+            {'inline': 'false'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['url'], self.url_path)
+        self.assertRegex(response.data['data']['md5'], settings.MD5_REGEX)
@@ -51,8 +51,8 @@ class IconSearchTests(TestCaseShortcutsMixin, APITestCase):
     def __check_dict_entries(self):
         for entry in self.__get_dict_entries():
             self.assertIsInstance(entry, DictionaryEntry)
-            self.assertIsInstance(entry.json, str)
-            self.assertGreater(len(entry.json), 0)
+            self.assertIsInstance(entry.json, dict)
+            self.assertEqual(entry.json['meta']['id'], entry.id)
 
     def __test_success(self, response):
         """
@@ -0,0 +1,116 @@
+from unittest import mock
+
+from django.conf import settings
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from api.tests.mixins import TestCaseShortcutsMixin
+
+from ..models import Icon, IconNgram, trigrams
+from ..models.icon import IconManager
+from .mixins import IconFixturesMixin
+
+
+class IconSearchRankingTests(IconFixturesMixin, TestCaseShortcutsMixin, APITestCase):
+    """
+    Tests to check relevance ranking and fuzzy matching of icon searches.
+    """
+    client = APIClient()
+
+    url_name = 'api:dict:icon-search'
+    url_path = f'/api/{settings.VERSION}/icons/search/can'
+
+    reverse_kwargs = {'word': 'can'}
+
+    icons = [
+        ('Scanner', None),
+        ('can', None),
+        ('Candle', None),
+        ('Cane', None),
+        ('tin', 'a can of soup'),
+        ('canoe', None),
+        ('bread', None),
+    ]
+
+    def setUp(self):
+        """
+        Initialization method where icons are created.
+        """
+        super().setUp()
+
+        for word, descriptor in self.icons:
+            self.create_icon(word=word, descriptor=descriptor)
+
+    def test_trigrams(self):
+        """
+        Ensure trigrams are padded per word, as in pg_trgm.
+        """
+        self.assertEqual(
+            trigrams('Cat'), {'  c', ' ca', 'cat', 'at '})
+        self.assertEqual(trigrams(None), set())
+
+    def test_ranking(self):
+        """
+        Ensure exact matches come first, then prefixes, then substrings of the word or descriptor.
+        """
+        words = [x.word for x in Icon.objects.search('CAN')]
+
+        self.assertEqual(
+            words[:6], ['can', 'Cane', 'canoe', 'Candle', 'tin', 'Scanner'])
+        self.assertNotIn('bread', words)
+
+    def test_fuzzy(self):
+        """
+        Ensure misspelled queries still match by trigram similarity.
+        """
+        words = [x.word for x in Icon.objects.search('candel')]
+
+        self.assertEqual(words[0], 'Candle')
+        self.assertNotIn('bread', words)
+
+    def test_empty(self):
+        """
+        Ensure blank queries match nothing.
+        """
+        self.assertFalse(Icon.objects.search('  ').exists())
+
+    def test_ngrams(self):
+        """
+        Ensure stored trigrams follow changes to the word.
+        """
+        icon = Icon.objects.get(word='bread')
+        icon.word = 'toast'
+        icon.save()
+
+        self.assertEqual(
+            set(icon.ngrams.values_list('gram', flat=True)),
+            trigrams('toast'))
+        self.assertFalse(
+            IconNgram.objects.filter(icon=icon, gram='bre').exists())
+
+    def test_ngrams_with_pg_trgm(self):
+        """
+        Ensure trigrams are not stored where pg_trgm is installed, and the similarity threshold is not set on the connection.
+        """
+        with mock.patch.object(
+                IconManager, 'has_trigram_support', return_value=True):
+            icon = self.create_icon(word='toast')
+
+            sql = str(Icon.objects.search('candel').query)
+
+        self.assertFalse(icon.ngrams.exists())
+        self.assertIn(
+            f'>= {settings.ICON_SEARCH["SIMILARITY_THRESHOLD"]}', sql)
+        self.assertNotIn('set_config', sql)
+
+    def test_view(self):
+        """
+        Ensure the search endpoint returns ranked results.
+        """
+        response = self.client.get(self.url_path, {'results': 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [x['word'] for x in response.data['results']], ['can', 'Cane'])
+        self.assertEqual(response.data['pagination']['totalResults'], 6)
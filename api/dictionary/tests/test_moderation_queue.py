@@ -0,0 +1,146 @@
+from django.conf import settings
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from api.authentication.models import User
+from api.tests.mixins import TestCaseShortcutsMixin
+
+from ..models import Category, Icon, PendingIconCount
+from .mixins import IconFixturesMixin
+
+
+class ModerationQueueTests(
+        IconFixturesMixin, TestCaseShortcutsMixin, APITestCase):
+    """
+    Tests to check the moderation queue endpoint and the counters of pending icons.
+    """
+    client = APIClient()
+    databases = {'default', 'admin_db'}
+
+    url_name = 'api:dict:icon-pending'
+    url_path = f'/api/{settings.VERSION}/icons/pending'
+
+    def setUp(self):
+        """
+        Initialization method where an administrator and pending icons in two categories are created.
+        """
+        super().setUp()
+
+        self.admin = User.objects.create_superuser(
+            'bob', 'bob@example.com', 'Easypass123!')
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {self.admin.access}')
+
+        self.food = Category.objects.create(name='Food')
+        self.tools = Category.objects.create(name='Tools')
+
+        for word in ['apple', 'bread', 'cheese']:
+            self.create_icon(word=word, category=self.food)
+        for word in ['hammer', 'saw']:
+            self.create_icon(word=word, category=self.tools)
+        self.create_icon(word='done', category=self.tools, is_approved=True)
+        self.create_icon(word='misc')
+
+    def __counts(self):
+        """
+        Method returning the stored counters by category, leaving out empty ones.
+        """
+        return dict(
+            PendingIconCount.objects.filter(count__gt=0).values_list(
+                'category_id', 'count'))
+
+    def __expected_counts(self):
+        """
+        Method returning the counters computed from the icons table.
+        """
+        counts = {}
+        for icon in Icon.objects.filter(is_approved=False):
+            key = icon.category_id or 0
+            counts[key] = counts.get(key, 0) + 1
+
+        return counts
+
+    def test_queue(self):
+        """
+        Ensure pending icons are paged oldest first with cursors, along with counts by category.
+        """
+        words = []
+        response = self.client.get(
+            self.url_path, {
+                'results': 4,
+                'inline': 'false'
+            })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['counts']['total'], 6)
+        self.assertEqual(
+            [(x['name'], x['pending'])
+             for x in response.data['counts']['categories']],
+            [(None, 1), ('Food', 3), ('Tools', 2)])
+
+        while True:
+            words += [x['word'] for x in response.data['data']]
+            if not response.data['pagination']['nextPageExists']:
+                break
+
+            response = self.client.get(
+                self.url_path, {
+                    'results': 4,
+                    'cursor': response.data['pagination']['nextCursor']
+                })
+
+        self.assertEqual(
+            words, ['apple', 'bread', 'cheese', 'hammer', 'saw', 'misc'])
+
+    def test_category(self):
+        """
+        Ensure the queue and its counts can be limited to a category subtree.
+        """
+        hand_tools = Category.objects.create(name='Hand', parent=self.tools)
+        self.create_icon(word='file', category=hand_tools)
+
+        response = self.client.get(self.url_path, {'category': self.tools.id})
+
+        self.assertEqual(
+            [x['word'] for x in response.data['data']],
+            ['hammer', 'saw', 'file'])
+        self.assertEqual(response.data['counts']['total'], 3)
+        self.assertEqual(
+            [(x['name'], x['pending'])
+             for x in response.data['counts']['categories']],
+            [('Tools', 2), ('Hand', 1)])
+
+    def test_counters(self):
+        """
+        Ensure the counters follow approvals, moves between categories, bulk approvals, and deletions.
+        """
+        self.assertEqual(self.__counts(), self.__expected_counts())
+
+        icon = Icon.objects.get(word='apple')
+        icon.is_approved = True
+        icon.save()
+
+        icon = Icon.objects.get(word='bread')
+        icon.category = self.tools
+        icon.save()
+
+        icon = Icon.objects.get(word='done')
+        icon.is_approved = False
+        icon.save()
+
+        Icon.set_approved(Icon.objects.filter(word__in=['hammer', 'misc']))
+        Icon.objects.get(word='saw').delete()
+        self.tools.delete()
+
+        self.assertEqual(self.__counts(), self.__expected_counts())
+        self.assertEqual(self.__counts(), {self.food.id: 1})
+
+    def test_unauthorized(self):
+        """
+        Ensure users other than administrators cannot see the queue.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=None)
+        response = self.client.get(self.url_path)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
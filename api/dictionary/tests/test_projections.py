@@ -0,0 +1,131 @@
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from ..models import Category, DictionaryEntry, Icon, Word
+from ..projections import IconProjection
+from .mixins import IconFixturesMixin
+
+
+class ProjectionTests(IconFixturesMixin, APITestCase):
+    """
+    Tests to check that listing icons, categories, and dictionary entries costs a number of queries that does not grow with the number of results.
+    """
+    client = APIClient()
+
+    icons_path = f'/api/{settings.VERSION}/icons'
+    search_path = f'/api/{settings.VERSION}/icons/search/can'
+    categories_path = f'/api/{settings.VERSION}/categories'
+
+    def setUp(self):
+        """
+        Initialization method where categories and icons within them are created.
+        """
+        super().setUp()
+
+        self.categories = [
+            Category.objects.create(name=name)
+            for name in ['Containers', 'Food', 'Tools', 'Toys']
+        ]
+        self.icons = [
+            self.create_icon(
+                word=word, category=category, is_approved=True)
+            for word, category in zip(
+                ['can', 'candle', 'canoe', 'canteen'], self.categories)
+        ]
+
+    def __count_queries(self, path, params):
+        """
+        Method to request a path and return the response along with the number of queries it took.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response, len(queries)
+
+    def __assert_constant(self, path, key='data', **params):
+        """
+        Method to assert that a page of one result and a page of every result cost the same number of queries.
+        """
+        # Warm up per-process caches, such as the check for pg_trgm
+        self.__count_queries(path, params)
+
+        one, one_count = self.__count_queries(path, {**params, 'results': 1})
+        all_, all_count = self.__count_queries(path, {**params, 'results': 4})
+
+        self.assertEqual(len(one.data[key]), 1)
+        self.assertEqual(len(all_.data[key]), 4)
+        self.assertEqual(one_count, all_count)
+
+        return all_
+
+    def test_icons(self):
+        """
+        Ensure pages of icons cost a constant number of queries, with both page numbers and cursors, and serialize as before.
+        """
+        response = self.__assert_constant(self.icons_path)
+        self.assertEqual(
+            response.data['data'], [x.to_obj() for x in self.icons])
+
+        self.__assert_constant(self.icons_path, cursor='', inline='false')
+
+    def test_search(self):
+        """
+        Ensure pages of search results cost a constant number of queries.
+        """
+        self.__assert_constant(self.search_path, key='results')
+
+    def test_deferred(self):
+        """
+        Ensure the projection reads only the listed columns, so that serializing loads no deferred field.
+        """
+        icons = list(IconProjection.queryset(Icon.objects.order_by('id')))
+
+        with self.assertNumQueries(0):
+            data = IconProjection.serialize_many(icons, inline=False)
+
+        self.assertEqual(data, [x.to_obj(inline=False) for x in self.icons])
+
+    def test_categories(self):
+        """
+        Ensure the list of categories costs a constant number of queries whatever its length.
+        """
+        _, count = self.__count_queries(self.categories_path, {})
+
+        Category.objects.bulk_create(
+            [Category(name=f'Category {x}') for x in range(10)])
+        response, more_count = self.__count_queries(self.categories_path, {})
+
+        self.assertEqual(len(response.data['data']), 14)
+        self.assertEqual(count, more_count)
+
+    def test_word_entries(self):
+        """
+        Ensure the entries of a word and their icons are serialized from a constant number of queries.
+        """
+        word = Word.objects.create(id='can')
+        DictionaryEntry.objects.create(id='can', word=word, json='{}')
+
+        with CaptureQueriesContext(connection) as queries:
+            obj = word.obj
+        count = len(queries)
+
+        self.assertEqual(
+            [x['id'] for x in obj['dictionary'][0]['icons']],
+            [self.icons[0].id])
+
+        for entry in ['candle', 'canoe', 'canteen']:
+            DictionaryEntry.objects.create(id=entry, word=word, json='{}')
+
+        with self.assertNumQueries(count):
+            obj = word.obj
+
+        self.assertEqual(
+            {x['id']: [y['id'] for y in x['icons']]
+             for x in obj['dictionary']},
+            {x.word: [x.id] for x in self.icons})
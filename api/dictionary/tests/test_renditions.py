@@ -0,0 +1,207 @@
+import hashlib
+import os
+
+from io import BytesIO, StringIO
+from unittest import mock
+
+from PIL import Image as PILImage
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import DatabaseError
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from ..models import Icon, PendingIconCount
+from ..utils import Renditions
+from .mixins import IconFixturesMixin
+
+
+class RenditionsTests(IconFixturesMixin, APITestCase):
+    """
+    Tests to check the size-optimized variants of icons, and their selection by the raw icon endpoint.
+    """
+    client = APIClient()
+
+    def setUp(self):
+        """
+        Initialization method where an icon is created, and its variants produced as its transaction commits.
+        """
+        super().setUp()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.icon = self.create_icon()
+        self.url_path = f'/api/{settings.VERSION}/icons/{self.icon.md5}'
+
+    def test_generated(self):
+        """
+        Ensure every variant is stored beside the original on upload.
+        """
+        for variant in Renditions.CONTENT_TYPES:
+            self.assertTrue(
+                os.path.isfile(
+                    Renditions.absolute_path(self.icon.md5, variant)))
+
+    def test_generated_on_commit(self):
+        """
+        Ensure variants are only produced once the transaction saving an icon commits.
+        """
+        f = BytesIO()
+        PILImage.new('RGB', (64, 54), 'red').save(f, format='GIF')
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            icon = self.create_icon(word='red', content=f.getvalue())
+
+        path = Renditions.absolute_path(icon.md5, 'webp')
+        self.assertFalse(os.path.isfile(path))
+
+        for callback in callbacks:
+            callback()
+        self.assertTrue(os.path.isfile(path))
+
+    def test_failed_save(self):
+        """
+        Ensure the image stored for an icon that fails to save is removed, while images already stored are kept.
+        """
+        f = BytesIO()
+        PILImage.new('RGB', (64, 54), 'red').save(f, format='GIF')
+        md5 = hashlib.md5(f.getvalue()).hexdigest()
+
+        for content in [f.getvalue(), None]:
+            with mock.patch.object(
+                    PendingIconCount, 'add', side_effect=DatabaseError):
+                with self.assertRaises(DatabaseError):
+                    self.create_icon(word='red', content=content)
+
+        self.assertFalse(
+            os.path.isfile(
+                os.path.join(settings.MEDIA_ROOT, Icon.RELATIVE_PATH, md5)))
+        self.assertTrue(
+            os.path.isfile(
+                os.path.join(settings.MEDIA_ROOT, self.icon.image.name)))
+
+    def test_prune(self):
+        """
+        Ensure the command removes images no icon refers to, along with their variants.
+        """
+        Icon.objects.filter(id=self.icon.id).delete()
+
+        out = StringIO()
+        call_command('prune_images', min_age=0, stdout=out)
+
+        self.assertIn('1 images removed', out.getvalue())
+        self.assertEqual(
+            os.listdir(os.path.join(settings.MEDIA_ROOT, Icon.RELATIVE_PATH)),
+            [])
+
+    def test_webp(self):
+        """
+        Ensure the WebP variant is served to clients that accept it, if it is the smallest.
+        """
+        response = self.client.get(
+            self.url_path, HTTP_ACCEPT='image/webp,image/*')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Accept', response['Vary'])
+
+        if response['Content-Type'] == 'image/webp':
+            self.assertEqual(response['ETag'], f'"{self.icon.md5}.webp"')
+
+        sizes = Renditions.generate(self.icon.md5, self.icon.image.name)
+        content = b''.join(response.streaming_content)
+        self.assertEqual(
+            len(content), min(sizes['original'], sizes['gif'], sizes['webp']))
+
+    def test_accept_quality(self):
+        """
+        Ensure the WebP variant is only chosen when its type is listed in the Accept header with a nonzero quality.
+        """
+        with open(Renditions.absolute_path(self.icon.md5, 'webp'), 'wb') as f:
+            f.write(b'0')
+
+        for accept, variant in [
+            ('image/webp', 'webp'),
+            ('image/webp; q=0.5, */*', 'webp'),
+            ('IMAGE/WEBP;Q=0.8', 'webp'),
+            ('image/webp;q=0', None),
+            ('image/webp;q=0.0, image/gif', None),
+            ('image/webpx', None),
+            ('image/*, */*', None),
+        ]:
+            selected = Renditions.select(
+                self.icon.md5, self.icon.image.name, accept)[0]
+
+            if variant:
+                self.assertEqual(selected, variant, accept)
+            else:
+                self.assertNotEqual(selected, 'webp', accept)
+
+    def test_high_density(self):
+        """
+        Ensure the upscaled PNG variant is served at scale 2.
+        """
+        response = self.client.get(self.url_path, {'scale': 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'image/png')
+
+        content = b''.join(response.streaming_content)
+        with PILImage.open(BytesIO(content)) as image, \
+                PILImage.open(self.icon_filepath) as original:
+            self.assertEqual(
+                image.size, (original.width * 2, original.height * 2))
+
+    def test_fixed_type(self):
+        """
+        Ensure the URLs with an extension only serve files of the matching content type, regardless of the Accept header.
+        """
+        for suffix, content_type in [
+            ('.gif', 'image/gif'),
+            ('.webp', 'image/webp'),
+            ('@2x.png', 'image/png'),
+        ]:
+            response = self.client.get(
+                f'{self.url_path}{suffix}', HTTP_ACCEPT='image/webp,image/*')
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response['Content-Type'], content_type)
+            self.assertNotIn('Accept', response.get('Vary', ''))
+
+            content = b''.join(response.streaming_content)
+            with PILImage.open(BytesIO(content)) as image:
+                self.assertEqual(
+                    PILImage.MIME[image.format], content_type)
+
+    def test_sniff(self):
+        """
+        Ensure the content type of an original is detected from its leading bytes.
+        """
+        self.assertEqual(
+            Renditions.sniff(self.icon_filepath), 'image/gif')
+        self.assertEqual(
+            Renditions.sniff(
+                Renditions.absolute_path(self.icon.md5, 'webp')),
+            'image/webp')
+        self.assertEqual(
+            Renditions.sniff(
+                Renditions.absolute_path(self.icon.md5, 'png2x')),
+            'image/png')
+        self.assertIsNone(Renditions.sniff(
+            Renditions.absolute_path('0' * 32, 'gif')))
+
+    def test_backfill(self):
+        """
+        Ensure the backfill command restores missing variants and reports savings.
+        """
+        Renditions.delete(self.icon.md5)
+
+        out = StringIO()
+        call_command('renditions', stdout=out)
+
+        self.assertIn('1 images processed', out.getvalue())
+        for variant in Renditions.CONTENT_TYPES:
+            self.assertTrue(
+                os.path.isfile(
+                    Renditions.absolute_path(self.icon.md5, variant)))
+            self.assertIn(variant, out.getvalue())
@@ -0,0 +1,248 @@
+import os
+
+from io import BytesIO, StringIO
+
+from PIL import Image
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+from rest_framework.throttling import ScopedRateThrottle
+
+from api.authentication.models import User
+
+from ..models import Icon
+from ..utils import SentenceStrip
+from .mixins import IconFixturesMixin
+
+
+class SentenceStripTests(IconFixturesMixin, APITestCase):
+    """
+    Tests to check sentence strips, composed on the server from icons given in order.
+    """
+    client = APIClient()
+
+    url_path = f'/api/{settings.VERSION}/icons/strip'
+
+    databases = {'default', 'admin_db'}
+
+    def __gif(self, color, size=(64, 54)):
+        """
+        Method returning the contents of a GIF image of a single color.
+        """
+        f = BytesIO()
+        Image.new('RGB', size, color).save(f, format='GIF')
+
+        return f.getvalue()
+
+    def setUp(self):
+        """
+        Initialization method where icons of different colors are created, one of them awaiting approval, and the frame cache and throttling history are emptied.
+        """
+        super().setUp()
+        SentenceStrip.clear()
+        cache.clear()
+
+        self.red = self.create_icon(
+            word='red', content=self.__gif('red'), is_approved=True)
+        self.blue = self.create_icon(
+            word='blue', content=self.__gif('blue', (32, 54)),
+            is_approved=True)
+        self.green = self.create_icon(
+            word='green', content=self.__gif('green'))
+
+    def __strip(self, **params):
+        response = self.client.get(self.url_path, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response
+
+    def test_ids(self):
+        """
+        Ensure icons are composed side by side in the requested order, repeats included, at their mapped positions.
+        """
+        response = self.__strip(
+            ids=f'{self.blue.id},{self.red.id},{self.blue.id}')
+        data = response.data['data']
+
+        self.assertEqual(
+            [x['word'] for x in data['icons']], ['blue', 'red', 'blue'])
+        self.assertEqual(
+            [x['x'] for x in data['icons']],
+            [0, 32 + settings.SENTENCE_STRIP['SPACING'],
+             96 + 2 * settings.SENTENCE_STRIP['SPACING']])
+
+        key = data['url'].split('/')[-1][:-len('.png')]
+        self.assertEqual(
+            data['url'], f'/api/{settings.VERSION}/strips/{key}.png')
+
+        with Image.open(SentenceStrip.absolute_path(key)) as strip:
+            strip = strip.convert('RGB')
+            self.assertEqual(strip.size, (data['width'], data['height']))
+
+            colors = [(0, 0, 255), (255, 0, 0), (0, 0, 255)]
+            for icon, color in zip(data['icons'], colors):
+                self.assertEqual(
+                    strip.getpixel((icon['x'], icon['y'])), color)
+
+    def test_words(self):
+        """
+        Ensure words are matched to approved icons regardless of case, and words without one are left as blank cells.
+        """
+        data = self.__strip(words='Red,green,blue,nothing').data['data']
+
+        self.assertEqual(
+            [x and x['id'] for x in data['icons']],
+            [self.red.id, None, self.blue.id, None])
+        self.assertEqual(
+            data['width'],
+            64 + 64 + 32 + 64 + 3 * settings.SENTENCE_STRIP['SPACING'])
+
+    def test_pending_ids(self):
+        """
+        Ensure IDs of icons awaiting approval are left as blank cells, except for administrators.
+        """
+        ids = f'{self.red.id},{self.green.id}'
+        data = self.__strip(ids=ids).data['data']
+
+        self.assertEqual(
+            [x and x['id'] for x in data['icons']], [self.red.id, None])
+
+        admin = User.objects.create_superuser(
+            'bob', 'bob@example.com', 'Easypass123!')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {admin.access}')
+        data = self.__strip(ids=ids).data['data']
+
+        self.assertEqual(
+            [x['id'] for x in data['icons']], [self.red.id, self.green.id])
+
+    def test_frame_cache(self):
+        """
+        Ensure decoded icons are reused across strips.
+        """
+        self.__strip(ids=f'{self.red.id},{self.blue.id}')
+        self.__strip(ids=f'{self.blue.id},{self.red.id},{self.red.id}')
+
+        self.assertEqual(
+            SentenceStrip.stats(), {'frames': 2, 'hits': 3, 'misses': 2})
+
+    def test_raw(self):
+        """
+        Ensure the strip is served with immutable caching headers.
+        """
+        data = self.__strip(ids=self.red.id).data['data']
+        response = self.client.get(data['url'])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'image/png')
+        self.assertIn('immutable', response['Cache-Control'])
+
+        response = self.client.get(
+            data['url'], HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_not_modified(self):
+        """
+        Ensure we get an empty HTTP 304 response for a request already held by the client.
+        """
+        etag = self.__strip(words='red,blue')['ETag']
+        response = self.client.get(
+            self.url_path, {'words': 'red,blue'}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_icon_change(self):
+        """
+        Ensure the entity tag changes when a word resolves to another icon, even one with the same image.
+        """
+        response = self.__strip(words='red,blue')
+        etag, url = response['ETag'], response.data['data']['url']
+
+        red = self.create_icon(
+            word='red', content=self.__gif('red'), is_approved=True)
+        Icon.objects.filter(id=self.red.id).delete()
+
+        response = self.client.get(
+            self.url_path, {'words': 'red,blue'}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['data']['icons'][0]['id'], red.id)
+        self.assertEqual(response.data['data']['url'], url)
+
+    def test_prune(self):
+        """
+        Ensure the least recently requested strips are removed beyond the maximum number stored.
+        """
+        strip = {**settings.SENTENCE_STRIP, 'MAX_STRIPS': 2}
+        with self.settings(SENTENCE_STRIP=strip):
+            first = self.__strip(ids=self.red.id).data['data']['url']
+            second = self.__strip(ids=self.blue.id).data['data']['url']
+
+            # Requesting the first strip again makes the second the oldest
+            path = SentenceStrip.absolute_path(
+                first.split('/')[-1][:-len('.png')], 'json')
+            os.utime(path, (0, 0))
+            self.__strip(ids=self.red.id)
+
+            self.__strip(ids=f'{self.red.id},{self.blue.id}')
+
+        self.assertEqual(
+            self.client.get(first).status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.client.get(second).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_prune_command(self):
+        """
+        Ensure the command removes strips beyond the given number.
+        """
+        url = self.__strip(ids=self.red.id).data['data']['url']
+        self.__strip(ids=self.blue.id)
+
+        out = StringIO()
+        call_command('prune_strips', max_strips=0, stdout=out)
+
+        self.assertIn('2 strips removed', out.getvalue())
+        self.assertEqual(
+            self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(SentenceStrip.prune(0), 0)
+
+    def test_throttle(self):
+        """
+        Ensure strip requests are throttled apart from other requests.
+        """
+        rate = int(
+            ScopedRateThrottle.THROTTLE_RATES['strip'].split('/')[0])
+
+        for _ in range(rate):
+            self.__strip(ids=self.red.id)
+
+        response = self.client.get(self.url_path, {'ids': self.red.id})
+        self.assertEqual(
+            response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+        response = self.client.get(f'/api/{settings.VERSION}/icons')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        cache.clear()
+
+    def test_invalid(self):
+        """
+        Ensure we get an HTTP 400 response for missing, mixed, invalid or too many values, and an HTTP 404 response when no icon matches.
+        """
+        for params in [{}, {
+                'ids': self.red.id,
+                'words': 'red'
+        }, {
+                'ids': 'red'
+        }, {
+                'ids': ','.join(['1'] * (settings.MAX_BATCH_LEN['strip'] + 1))
+        }]:
+            response = self.client.get(self.url_path, params)
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url_path, {'words': 'nothing'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
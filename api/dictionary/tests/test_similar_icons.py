@@ -0,0 +1,125 @@
+from io import BytesIO, StringIO
+
+import numpy as np
+
+from PIL import Image as PILImage, ImageOps
+
+from django.conf import settings
+from django.core.management import call_command
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from ..models import Icon
+from ..utils import FeatureIndex
+from .mixins import IconFixturesMixin
+
+
+class SimilarIconsTests(IconFixturesMixin, APITestCase):
+    """
+    Tests to check the visual similarity index of icons, and the endpoint listing the icons most similar to an icon.
+    """
+    client = APIClient()
+
+    def setUp(self):
+        """
+        Initialization method where an icon, a recolored copy, a flipped copy, and a blank icon are created and indexed.
+        """
+        super().setUp()
+
+        with PILImage.open(self.icon_filepath) as image:
+            image = image.convert('RGBA')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.can = self.create_icon('can', is_approved=True)
+            self.tin = self.create_icon(
+                'tin', self.__gif(image.point(lambda v: v // 8 * 8)),
+                is_approved=True)
+            self.pot = self.create_icon(
+                'pot', self.__gif(ImageOps.flip(image)), is_approved=True)
+            self.blank = self.create_icon(
+                'blank',
+                self.__gif(PILImage.new('RGBA', image.size, 'white')),
+                is_approved=True)
+
+    @staticmethod
+    def __gif(image):
+        """
+        Method returning the contents of an image saved as a GIF.
+        """
+        f = BytesIO()
+        image.save(f, format='GIF')
+
+        return f.getvalue()
+
+    def __similar(self, icon, **params):
+        response = self.client.get(
+            f'/api/{settings.VERSION}/icons/{icon.id}/similar', params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response.data['data']
+
+    def test_similar(self):
+        """
+        Ensure similar icons are listed most similar first, without the icon itself.
+        """
+        data = self.__similar(self.can, inline='false')
+
+        self.assertEqual(
+            [x['id'] for x in data],
+            [self.tin.id, self.pot.id, self.blank.id])
+        self.assertGreater(data[0]['similarity'], 0.95)
+        self.assertLess(data[1]['similarity'], data[0]['similarity'])
+        self.assertEqual(data[2]['similarity'], 0)
+        self.assertIn('url', data[0])
+
+        self.assertEqual(len(self.__similar(self.can, results=1)), 1)
+
+    def test_unapproved(self):
+        """
+        Ensure icons awaiting approval are left out.
+        """
+        Icon.set_approved(Icon.objects.filter(id=self.tin.id), False)
+
+        self.assertEqual(
+            [x['id'] for x in self.__similar(self.can)],
+            [self.pot.id, self.blank.id])
+
+    def test_not_indexed(self):
+        """
+        Ensure an icon missing from the index is added on its first request.
+        """
+        jar = self.create_icon('jar', is_approved=True)
+        self.assertFalse(FeatureIndex.contains(jar.id))
+
+        data = self.__similar(jar)
+
+        self.assertTrue(FeatureIndex.contains(jar.id))
+        self.assertEqual(data[0]['id'], self.can.id)
+        self.assertAlmostEqual(data[0]['similarity'], 1, places=4)
+
+    def test_superseded(self):
+        """
+        Ensure a later vector of an icon supersedes its earlier one.
+        """
+        FeatureIndex.add(
+            self.blank.id, FeatureIndex.compute(self.icon_filepath))
+
+        self.assertEqual(FeatureIndex.stats(), {'icons': 4, 'records': 5})
+        self.assertEqual(
+            FeatureIndex.similar(self.can.id, 1)[0][0], self.blank.id)
+
+    def test_rebuild(self):
+        """
+        Ensure rebuilding the index drops deleted icons and superseded vectors.
+        """
+        FeatureIndex.add(self.can.id, np.zeros(FeatureIndex.DIMENSIONS))
+        self.pot.delete()
+
+        out = StringIO()
+        call_command('similarity_index', stdout=out)
+
+        self.assertIn('3 icons indexed', out.getvalue())
+        self.assertEqual(FeatureIndex.stats(), {'icons': 3, 'records': 3})
+        self.assertEqual(
+            FeatureIndex.similar(self.can.id, 1)[0][0], self.tin.id)
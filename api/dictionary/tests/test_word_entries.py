@@ -0,0 +1,96 @@
+from rest_framework import status
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from ..models import DictionaryEntry, Word
+from ..views import WordSearchView
+from .mixins import StubServerMixin
+
+
+class WordEntryColumnsTests(StubServerMixin, APITestCase):
+    """
+    Tests to check that dictionary entries are stored as JSON along with columns extracted from their metadata, and that word searches read those columns.
+    """
+    factory = APIRequestFactory()
+
+    word = 'trend'
+    data = [
+        {
+            'meta': {
+                'id': 'trend:2',
+                'sort': '200000002',
+                'stems': ['trend', 'trended', 'trending'],
+                'offensive': False,
+            },
+            'hwi': {
+                'hw': 'trend',
+            },
+        },
+        {
+            'meta': {
+                'id': 'trend:1',
+                'sort': '200000001',
+                'stems': ['trend', 'trends'],
+                'offensive': True,
+            },
+            'hwi': {
+                'hw': 'trend',
+            },
+        },
+        {
+            'meta': {
+                'id': 'trendy',
+                'sort': '200000003',
+            },
+        },
+    ]
+
+    def setUp(self):
+        super().setUp()
+
+        self.stub_dictionary(self.word, self.data)
+
+    def test_columns(self):
+        """
+        Ensure the headword, sort key, stems and offensive flag of each entry are stored in columns of their own, and the JSON data as is.
+        """
+        Word.objects.get_word_and_entries(self.word)
+
+        entries = DictionaryEntry.objects.filter(word_id=self.word)
+
+        self.assertEqual(
+            list(
+                entries.order_by('id').values_list(
+                    'id', 'headword', 'sort', 'stems', 'offensive')), [
+                        ('trend:1', 'trend', '200000001', ['trend', 'trends'],
+                         True),
+                        ('trend:2', 'trend', '200000002',
+                         ['trend', 'trended', 'trending'], False),
+                    ])
+        self.assertEqual(entries.get(id='trend:1').json, self.data[1])
+        self.assertEqual(
+            list(entries.filter(stems__contains=['trending'])),
+            [entries.get(id='trend:2')])
+
+    def test_search(self):
+        """
+        Ensure word searches list the metadata of entries in order of their sort keys.
+        """
+        request = self.factory.get(f'/search/{self.word}')
+        response = WordSearchView.as_view()(request, word=self.word)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [dict(x) for x in response.data['results']], [
+                {
+                    'id': 'trend:1',
+                    'sort': '200000001',
+                    'stems': ['trend', 'trends'],
+                    'offensive': True,
+                },
+                {
+                    'id': 'trend:2',
+                    'sort': '200000002',
+                    'stems': ['trend', 'trended', 'trending'],
+                    'offensive': False,
+                },
+            ])
@@ -0,0 +1,273 @@
+import threading
+import time
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+
+from api.exceptions import ServiceUnavailableError
+
+from ..models import DictionaryEntry, Word, WordMiss
+from .mixins import StubServerMixin
+
+
+class WordLookupTests(StubServerMixin, TransactionTestCase):
+    """
+    Tests to check that concurrent lookups of a word missing from the database call the dictionary API once, against a local stub server.
+    """
+    word = 'trend'
+    data = [
+        {
+            'meta': {
+                'id': 'trend:1',
+                'sort': '200000000',
+                'stems': ['trend', 'trends'],
+                'offensive': False,
+            },
+        },
+        {
+            'meta': {
+                'id': 'trend:2',
+                'sort': '200000001',
+                'stems': ['trend', 'trended'],
+                'offensive': False,
+            },
+        },
+    ]
+
+    def __lookup(self, results, barrier=None):
+        """
+        Method looking up the word from a thread, and appending the result or the error raised to a list.
+        """
+        try:
+            if barrier:
+                barrier.wait()
+
+            word, entries = Word.objects.get_word_and_entries(self.word)
+            results.append((word and word.id, len(entries)))
+        except Exception as e:
+            results.append(e)
+        finally:
+            connection.close()
+
+    def test_single_flight(self):
+        """
+        Ensure 50 simultaneous lookups make one upstream call, and each sees the word along with all of its entries.
+        """
+        self.stub_dictionary(self.word, self.data, delay=0.2)
+
+        results, barrier = [], threading.Barrier(50)
+        threads = [
+            threading.Thread(target=self.__lookup, args=(results, barrier))
+            for _ in range(50)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [(self.word, 2)] * 50)
+        self.assertEqual(self.stub_hits(f'/dictionary/{self.word}'), 1)
+        self.assertEqual(
+            DictionaryEntry.objects.filter(word_id=self.word).count(), 2)
+
+    @override_settings(
+        WORD_LOOKUP={
+            **settings.WORD_LOOKUP,
+            'LOCK_TIMEOUT': 0.1,
+        })
+    def test_lock_timeout(self):
+        """
+        Ensure a lookup waiting on another for longer than the lock timeout fails cleanly, without calling the API or leaving a partial word.
+        """
+        self.stub_dictionary(self.word, self.data, delay=1)
+
+        results = []
+        thread = threading.Thread(target=self.__lookup, args=(results, ))
+        thread.start()
+
+        while thread.is_alive() and \
+                not self.stub_hits(f'/dictionary/{self.word}'):
+            time.sleep(0.01)
+
+        with self.assertRaises(ServiceUnavailableError):
+            Word.objects.get_word_and_entries(self.word)
+        self.assertFalse(Word.objects.filter(id=self.word).exists())
+
+        thread.join()
+
+        self.assertEqual(results, [(self.word, 2)])
+        self.assertEqual(self.stub_hits(f'/dictionary/{self.word}'), 1)
+
+
+class WordMissTests(StubServerMixin, TestCase):
+    """
+    Tests to check that words missing from the dictionary, and the suggestions returned for them, are cached for a limited time.
+    """
+    word = 'trnd'
+    suggestions = ['trend', 'trad', 'tend']
+
+    def __lookup(self):
+        return Word.objects.get_word_and_entries(self.word)
+
+    def test_suggestions(self):
+        """
+        Ensure repeated lookups of a misspelling return its suggestions from one upstream call, without storing a word.
+        """
+        self.stub_dictionary(self.word, self.suggestions)
+
+        for _ in range(3):
+            self.assertEqual(self.__lookup(), (None, self.suggestions))
+
+        self.assertEqual(self.stub_hits(f'/dictionary/{self.word}'), 1)
+        self.assertFalse(Word.objects.filter(id=self.word).exists())
+
+    def test_empty(self):
+        """
+        Ensure empty results are cached as well.
+        """
+        self.stub_dictionary(self.word, [])
+
+        self.assertEqual(self.__lookup(), (None, []))
+        self.assertEqual(self.__lookup(), (None, []))
+        self.assertEqual(self.stub_hits(f'/dictionary/{self.word}'), 1)
+
+    def test_error(self):
+        """
+        Ensure error responses are not cached.
+        """
+        self.stub_route(
+            f'/dictionary/{self.word}', lambda hits: (404, '[]', 0))
+
+        self.__lookup()
+        self.__lookup()
+        self.assertEqual(self.stub_hits(f'/dictionary/{self.word}'), 2)
+
+    def test_expiry(self):
+        """
+        Ensure a miss older than the TTL is looked up again, and dropped once the word is found.
+        """
+        self.stub_dictionary(self.word, self.suggestions)
+        self.__lookup()
+
+        WordMiss.objects.filter(id=self.word).update(
+            updated=timezone.now() - timedelta(
+                seconds=settings.WORD_LOOKUP['MISS_TTL'] + 1))
+        self.stub_dictionary(
+            self.word, [{
+                'meta': {
+                    'id': self.word,
+                },
+            }])
+
+        word, entries = self.__lookup()
+
+        self.assertEqual(word.id, self.word)
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(self.stub_hits(f'/dictionary/{self.word}'), 2)
+        self.assertFalse(WordMiss.objects.filter(id=self.word).exists())
+
+
+class WordFreshnessTests(StubServerMixin, TransactionTestCase):
+    """
+    Tests to check that stored words are served while fresh, refreshed in the background once stale, and refreshed before they are served once expired.
+    """
+    word = 'trend'
+
+    def __data(self, *ids, label=''):
+        """
+        Method returning dictionary data of entries with the given numbers, labelled to tell fetches apart.
+        """
+        return [
+            {
+                'meta': {
+                    'id': f'{self.word}:{x}',
+                },
+                'label': label,
+            } for x in ids
+        ]
+
+    def __entries(self, entries):
+        return sorted((x.id, x.json['label']) for x in entries)
+
+    def __age(self, stage):
+        """
+        Method dating the word back to the end of a stage of the freshness policy.
+        """
+        Word.objects.filter(id=self.word).update(
+            updated=timezone.now() -
+            timedelta(seconds=settings.WORD_LOOKUP[stage] + 1))
+
+    def __hits(self):
+        return self.stub_hits(f'/dictionary/{self.word}')
+
+    def setUp(self):
+        """
+        Initialization method where the word is fetched with two entries, and the stub server is given new data with one entry changed, one removed and one added.
+        """
+        super().setUp()
+
+        self.stub_dictionary(self.word, self.__data(1, 2, label='old'))
+        Word.objects.get_word_and_entries(self.word)
+
+        self.stub_dictionary(
+            self.word, self.__data(1, 3, label='new'), delay=0.5)
+
+    def test_fresh(self):
+        """
+        Ensure fresh words are served without calling the API.
+        """
+        word, entries = Word.objects.get_word_and_entries(self.word)
+
+        self.assertEqual(
+            self.__entries(entries), [('trend:1', 'old'), ('trend:2', 'old')])
+        self.assertEqual(self.__hits(), 1)
+
+    def test_stale(self):
+        """
+        Ensure stale words are served at once, and refreshed once in the background.
+        """
+        self.__age('FRESH_TTL')
+
+        start = time.monotonic()
+        for _ in range(3):
+            word, entries = Word.objects.get_word_and_entries(self.word)
+            self.assertEqual(
+                self.__entries(entries),
+                [('trend:1', 'old'), ('trend:2', 'old')])
+        self.assertLess(time.monotonic() - start, 0.5)
+
+        Word.objects.refresh_in_background(self.word).result()
+
+        word, entries = Word.objects.get_word_and_entries(self.word)
+        self.assertEqual(
+            self.__entries(entries), [('trend:1', 'new'), ('trend:3', 'new')])
+        self.assertEqual(self.__hits(), 2)
+
+    def test_expired(self):
+        """
+        Ensure expired words are refreshed before they are served.
+        """
+        self.__age('STALE_TTL')
+
+        word, entries = Word.objects.get_word_and_entries(self.word)
+
+        self.assertEqual(
+            self.__entries(entries), [('trend:1', 'new'), ('trend:3', 'new')])
+        self.assertEqual(self.__hits(), 2)
+
+    def test_expired_unreachable(self):
+        """
+        Ensure expired words are still served if they cannot be refreshed.
+        """
+        self.__age('STALE_TTL')
+        self.stub_route(
+            f'/dictionary/{self.word}', lambda hits: (404, 'Not Found', 0))
+
+        word, entries = Word.objects.get_word_and_entries(self.word)
+
+        self.assertEqual(
+            self.__entries(entries), [('trend:1', 'old'), ('trend:2', 'old')])
@@ -1,12 +1,37 @@
 from django.urls import re_path, include
 from rest_framework.routers import SimpleRouter
 
+from .utils import SentenceStrip, SpriteAtlas
 from .views import *
 from .viewsets import *
 
 app_name = 'api.dictionary'
 
 urlpatterns = [
+    re_path(
+        r'^icons/(?P<md5>[a-f\d]{32})$',
+        IconRawView.as_view(),
+        name='icon-raw'),
+    re_path(
+        r'^icons/(?P<md5>[a-f\d]{32})\.(?P<extension>gif|webp)$',
+        IconRawView.as_view(),
+        name='icon-raw-variant'),
+    re_path(
+        r'^icons/(?P<md5>[a-f\d]{32})@2x\.png$',
+        IconRawView.as_view(scale=2),
+        name='icon-raw-2x'),
+    re_path(
+        r'^atlas/(?P<category_id>[1-9]\d*)/(?P<key>[a-f\d]{32})\.png$',
+        SheetRawView.as_view(path=SpriteAtlas.absolute_path),
+        name='atlas-raw'),
+    re_path(
+        r'^strips/(?P<key>[a-f\d]{32})\.png$',
+        SheetRawView.as_view(path=SentenceStrip.absolute_path),
+        name='strip-raw'),
+    re_path(
+        r'^icons/search/(?P<word>[^/]+)$',
+        IconSearchView.as_view(),
+        name='icon-search'),
     re_path(
         r'^icons/(?P<id>[1-9]\d*)/approve$',
         IconApproveView.as_view(),
@@ -18,10 +43,10 @@ urlpatterns = [
 ]
 
 categories_router = SimpleRouter(trailing_slash=False)
-categories_router.register(r'^categories', CategoriesViewSet)
+categories_router.register(r'categories', CategoriesViewSet)
 
 icons_router = SimpleRouter(trailing_slash=False)
-icons_router.register(r'^icons', IconsViewSet)
+icons_router.register(r'icons', IconsViewSet)
 
 urlpatterns += categories_router.urls
 urlpatterns += icons_router.urls
@@ -1,2 +1,13 @@
 from .external_data_managers import *
 from .b64_converter import *
+from .b64_cache import *
+from .atomic_write import *
+from .http_cache import *
+from .pagination import *
+from .autocomplete_index import *
+from .sprite_atlas import *
+from .renditions import *
+from .perceptual_hash import *
+from .feature_index import *
+from .color_palette import *
+from .sentence_strip import *
@@ -0,0 +1,19 @@
+import os
+import tempfile
+
+
+def atomic_write(path, content):
+    """
+    Write the given bytes to a file through a temporary file in the same directory, creating the directory if needed, so that concurrent readers never see a partial file.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temporary_path = tempfile.mkstemp(dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
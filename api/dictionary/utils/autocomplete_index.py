@@ -0,0 +1,180 @@
+import sys
+import threading
+import time
+
+from bisect import bisect_left, insort
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class AutocompleteIndex:
+    """
+    Utility class holding a per-process, sorted array of the distinct words of approved icons, searched by bisection to complete word prefixes without a database query. Saves and deletions update the array of the process where they happen, and bump a generation counter in the database, from which other processes learn to rebuild theirs.
+    """
+    GENERATION_NAME = 'autocomplete'
+
+    __lock = threading.Lock()
+    # Sorted pairs of lowercase key and word, or None until first built
+    __entries = None
+    __generation = None
+    __checked = 0.0
+
+    @classmethod
+    def __shared_generation(cls):
+        """
+        Private class method returning the generation counter shared by all processes.
+        """
+        from ..models import CacheGeneration
+
+        return CacheGeneration.current(cls.GENERATION_NAME)
+
+    @classmethod
+    def __bump_generation(cls):
+        """
+        Private class method incrementing the shared generation counter, and returning its new value.
+        """
+        from ..models import CacheGeneration
+
+        return CacheGeneration.bump(cls.GENERATION_NAME)
+
+    @staticmethod
+    def __entry(word):
+        """
+        Private static method returning the sorted pair of a word, whose key shares the word's string when it is already lowercase.
+        """
+        key = word.lower()
+
+        return (word if key == word else key, word)
+
+    @classmethod
+    def __approved_words(cls, words=None):
+        """
+        Private class method returning the set of distinct words of approved icons, optionally restricted to some words.
+        """
+        from ..models import Icon
+
+        queryset = Icon.objects.filter(is_approved=True)
+        if words is not None:
+            queryset = queryset.filter(word__in=words)
+
+        return set(queryset.values_list('word', flat=True).distinct())
+
+    @classmethod
+    def __build(cls):
+        """
+        Private class method loading the whole array from the database. Must be called with the lock held.
+        """
+        cls.__generation = cls.__shared_generation()
+        cls.__entries = sorted(
+            cls.__entry(word) for word in cls.__approved_words())
+
+    @classmethod
+    def __ensure_current(cls):
+        """
+        Private class method building the array if it is missing, or rebuilding it if another process has changed the words since it was built. The shared counter is checked at most once per interval. Must be called with the lock held.
+        """
+        now = time.monotonic()
+
+        if cls.__entries is None:
+            cls.__build()
+        elif now - cls.__checked >= settings.AUTOCOMPLETE['CHECK_INTERVAL']:
+            if cls.__shared_generation() != cls.__generation:
+                cls.__build()
+        else:
+            return
+
+        cls.__checked = now
+
+    @classmethod
+    def complete(cls, prefix, limit=10):
+        """
+        Class method returning up to limit words starting with a prefix, without regard to case, in alphabetical order.
+        """
+        prefix = prefix.lower()
+
+        with cls.__lock:
+            cls.__ensure_current()
+            entries = cls.__entries
+
+            results = []
+            i = bisect_left(entries, (prefix, ))
+            while (len(results) < limit and i < len(entries) and
+                   entries[i][0].startswith(prefix)):
+                results.append(entries[i][1])
+                i += 1
+
+        return results
+
+    @classmethod
+    def sync(cls, words):
+        """
+        Class method bringing some words in line with the database, adding those that belong to an approved icon and removing the others. Other processes are notified to rebuild.
+        """
+        words = {x for x in words if x}
+        if not words:
+            return
+
+        approved = cls.__approved_words(words)
+        generation = cls.__bump_generation()
+
+        with cls.__lock:
+            if cls.__entries is None:
+                return
+
+            for word in words:
+                entry = cls.__entry(word)
+                i = bisect_left(cls.__entries, entry)
+                present = (
+                    i < len(cls.__entries) and cls.__entries[i] == entry)
+
+                if word in approved and not present:
+                    insort(cls.__entries, entry)
+                elif word not in approved and present:
+                    del cls.__entries[i]
+
+            # Keep the array unless another process changed words meanwhile
+            if generation == cls.__generation + 1:
+                cls.__generation = generation
+
+    @classmethod
+    def invalidate(cls):
+        """
+        Class method marking the array as stale in every process, to be used after bulk changes that send no signals.
+        """
+        cls.__bump_generation()
+
+        with cls.__lock:
+            cls.__entries = None
+
+    @classmethod
+    def stats(cls):
+        """
+        Class method returning the number of words and the approximate memory footprint of the array in bytes, counting strings shared between keys and words once.
+        """
+        with cls.__lock:
+            entries = cls.__entries or []
+            size = sys.getsizeof(entries)
+
+            for entry in entries:
+                key, word = entry
+                size += sys.getsizeof(entry) + sys.getsizeof(word)
+                if key is not word:
+                    size += sys.getsizeof(key)
+
+            return OrderedDict(
+                {
+                    'entries': len(entries),
+                    'bytes': size,
+                    'generation': cls.__generation,
+                })
+
+    @classmethod
+    def clear(cls):
+        """
+        Class method discarding the array of this process, which is rebuilt on the next completion.
+        """
+        with cls.__lock:
+            cls.__entries = None
+            cls.__generation = None
+            cls.__checked = 0.0
@@ -0,0 +1,95 @@
+import threading
+
+from collections import OrderedDict
+
+from django.conf import settings
+
+from .b64_converter import Base64Converter
+
+
+class Base64Cache:
+    """
+    Utility class defining a cache of base-64 renditions keyed by MD5 hashsum, bounded in size and local to the process, evicting the least recently used entries first.
+    """
+
+    __lock = threading.Lock()
+    __entries = OrderedDict()
+    __size = 0
+    __hits = 0
+    __misses = 0
+
+    @classmethod
+    def set(cls, md5, b64):
+        """
+        Class method storing a rendition, evicting the least recently used entries until the cache fits in its size limit. Renditions larger than the limit are not stored.
+        """
+        max_bytes = settings.B64_CACHE['MAX_BYTES']
+        if len(b64) > max_bytes:
+            return
+
+        with cls.__lock:
+            if md5 in cls.__entries:
+                cls.__size -= len(cls.__entries.pop(md5))
+
+            cls.__entries[md5] = b64
+            cls.__size += len(b64)
+
+            while cls.__size > max_bytes:
+                _, evicted = cls.__entries.popitem(last=False)
+                cls.__size -= len(evicted)
+
+    @classmethod
+    def get(cls, md5):
+        """
+        Class method returning the rendition for a hashsum, or None on a miss.
+        """
+        with cls.__lock:
+            b64 = cls.__entries.get(md5)
+            if b64 is None:
+                cls.__misses += 1
+                return None
+
+            cls.__entries.move_to_end(md5)
+            cls.__hits += 1
+
+            return b64
+
+    @classmethod
+    def get_or_encode(cls, md5, relative_path, block_size=2**16):
+        """
+        Class method returning the cached rendition for a hashsum, encoding the file at a path relative to settings.MEDIA_ROOT and caching the result on a miss. Files without a hashsum are encoded without caching.
+        """
+        if not md5:
+            return Base64Converter.encode(relative_path, block_size=block_size)
+
+        b64 = cls.get(md5)
+        if b64 is None:
+            b64 = Base64Converter.encode(relative_path, block_size=block_size)
+            cls.set(md5, b64)
+
+        return b64
+
+    @classmethod
+    def stats(cls):
+        """
+        Class method returning the hit and miss counters, along with the number and total size of entries.
+        """
+        with cls.__lock:
+            return OrderedDict(
+                {
+                    'hits': cls.__hits,
+                    'misses': cls.__misses,
+                    'entries': len(cls.__entries),
+                    'bytes': cls.__size,
+                })
+
+    @classmethod
+    def clear(cls):
+        """
+        Class method emptying the cache and resetting the counters.
+        """
+        with cls.__lock:
+            cls.__entries.clear()
+            cls.__size = 0
+            cls.__hits = 0
+            cls.__misses = 0
@@ -1,16 +1,18 @@
-import hashlib
+import binascii
+import mmap
 import os
 
-from base64 import b16encode, b64encode
-from functools import partial
-
 from django.conf import settings
 
 
 class Base64Converter:
     """
-    Utility class containing a method to encode files as a base-64 bytes string.
+    Utility class containing methods to encode files as base-64 strings, either in one shot or as a stream of chunks.
     """
+    # Files smaller than this many bytes are read directly, since mapping
+    # them costs more than the copy it saves.
+    MMAP_THRESHOLD = 2**16
+
     class ImproperlyDefinedPath(Exception):
         """
         Exception to be raised when zero or both paths (of relative_path and absolute_path) are defined.
@@ -21,21 +23,59 @@ class Base64Converter:
             )
 
     @classmethod
-    def encode(cls, relative_path=None, absolute_path=None, block_size=2**16):
+    def __absolute_path(cls, relative_path, absolute_path):
         """
-        Convert a file to a base-64 bytes string. Takes either a path relative to settings.MEDIA_ROOT or an absolute path as a keyword argument.
+        Private class method resolving exactly one of a path relative to settings.MEDIA_ROOT or an absolute path to an absolute path.
         """
         if not (bool(relative_path) ^ bool(absolute_path)):
             raise cls.ImproperlyDefinedPath()
 
-        if bool(relative_path) and not bool(absolute_path):
-            absolute_path = os.path.join(settings.MEDIA_ROOT, relative_path)
+        if relative_path:
+            return os.path.join(settings.MEDIA_ROOT, relative_path)
+
+        return absolute_path
+
+    @classmethod
+    def encode(cls, relative_path=None, absolute_path=None, block_size=2**16):
+        """
+        Convert a file to a base-64 string. Takes either a path relative to settings.MEDIA_ROOT or an absolute path as a keyword argument.
+
+        Larger files are memory-mapped and encoded in a single pass, so no intermediate copy of their contents is made. The block_size argument is kept for compatibility with callers of the former, buffered implementation.
+        """
+        absolute_path = cls.__absolute_path(relative_path, absolute_path)
+
+        with open(absolute_path, 'rb') as f:
+            # Small files (including empty ones, which cannot be mapped)
+            if os.fstat(f.fileno()).st_size < cls.MMAP_THRESHOLD:
+                data = f.read()
+                return str(binascii.b2a_base64(data, newline=False), 'ascii')
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return str(binascii.b2a_base64(data, newline=False), 'ascii')
+
+    @classmethod
+    def iter_encode(
+            cls, relative_path=None, absolute_path=None, chunk_size=2**16):
+        """
+        Generate a file as a sequence of base-64 strings, which concatenate to the output of encode(). Takes either a path relative to settings.MEDIA_ROOT or an absolute path as a keyword argument.
+
+        The file is memory-mapped and encoded in slices of chunk_size bytes, rounded down to a multiple of three so that no chunk but the last carries padding.
+        """
+        absolute_path = cls.__absolute_path(relative_path, absolute_path)
+        chunk_size = max(3, chunk_size - chunk_size % 3)
 
-        if absolute_path != None:
-            with open(absolute_path, 'rb') as f:
-                bytes_str = b''
-                for buffer in iter(partial(f.read, block_size), b''):
-                    bytes_str += buffer
-                return str(b64encode(bytes_str), 'utf-8')
+        with open(absolute_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return
 
-        return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                view = memoryview(data)
+                try:
+                    for offset in range(0, size, chunk_size):
+                        yield str(
+                            binascii.b2a_base64(
+                                view[offset:offset + chunk_size],
+                                newline=False), 'ascii')
+                finally:
+                    view.release()
@@ -2,14 +2,11 @@ import os
 import re
 import string
 
-from functools import partial
-
-from django.core.files.base import ContentFile
+from django.core.files import File
 from django.core.management.base import CommandError
-from django.db.models.signals import post_save
 from django.utils.translation import gettext_lazy as _
 
-from ..models import Word, Image, Icon, Category
+from ..models import Word, Icon, Category
 
 
 class BulkUploader:
@@ -23,19 +20,9 @@ class BulkUploader:
         """
         Method to save icons to database and media store.
         """
-        filename = filepath.split('/')[-1]
         with open(filepath, 'rb') as f:
-            bytes_str = b''
-            for buffer in iter(partial(f.read, Icon.BLOCK_SIZE), b''):
-                bytes_str += buffer
-
-            post_save.disconnect(Image.post_save, sender=Icon, dispatch_uid='0')
-
-            icon = Icon.objects.create(
-                word=word, descriptor=descriptor, category=category)
-            icon.image.save(filename, ContentFile(bytes_str), save=False)
-
-            post_save.connect(Image.post_save, sender=Icon, dispatch_uid='0')
+            icon = Icon(word=word, descriptor=descriptor, category=category)
+            icon.set_image(File(f))
             icon.save()
 
     @classmethod
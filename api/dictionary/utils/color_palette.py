@@ -0,0 +1,93 @@
+import re
+
+import numpy as np
+
+from PIL import Image
+
+
+class ColorPalette:
+    """
+    Utility class extracting the dominant colors of an image with NumPy. Opaque pixels are counted into buckets of similar colors, each channel being quantized to LEVELS levels, and the most common buckets make up the palette, along with the share of pixels in each and their mean color.
+    """
+    LEVELS = 4
+    BUCKET_WIDTH = 256 // LEVELS
+    BUCKETS = LEVELS**3
+
+    # Palettes hold up to this many colors, each covering at least MIN_SHARE
+    # of the opaque pixels
+    MAX_COLORS = 5
+    MIN_SHARE = 0.05
+
+    @classmethod
+    def extract(cls, f):
+        """
+        Class method returning the palette of the first frame of an image, given its path or a file object, as a list of three-tuples containing a bucket, its share of the opaque pixels, and the mean color of its pixels as an RGB three-tuple, most common first.
+        """
+        with Image.open(f) as image:
+            image.seek(0)
+            pixels = np.asarray(image.convert('RGBA')).reshape(-1, 4)
+
+        pixels = pixels[pixels[:, 3] >= 128, :3].astype(np.int64)
+        if not len(pixels):
+            return []
+
+        levels = pixels // cls.BUCKET_WIDTH
+        buckets = (levels[:, 0] * cls.LEVELS + levels[:, 1]) * cls.LEVELS + \
+            levels[:, 2]
+
+        counts = np.bincount(buckets, minlength=cls.BUCKETS)
+        sums = np.stack(
+            [
+                np.bincount(
+                    buckets, weights=pixels[:, i], minlength=cls.BUCKETS)
+                for i in range(3)
+            ],
+            axis=1)
+
+        top = np.argsort(-counts, kind='stable')[:cls.MAX_COLORS]
+        top = top[counts[top] >= cls.MIN_SHARE * len(pixels)]
+        shares = counts[top] / len(pixels)
+        means = np.rint(sums[top] / counts[top, None]).astype(int)
+
+        return [
+            (bucket, share, tuple(mean))
+            for bucket, share, mean in zip(
+                top.tolist(), shares.tolist(), means.tolist())
+        ]
+
+    @classmethod
+    def bucket(cls, rgb):
+        """
+        Class method returning the bucket of a color.
+        """
+        r, g, b = (x // cls.BUCKET_WIDTH for x in rgb)
+
+        return (r * cls.LEVELS + g) * cls.LEVELS + b
+
+    @classmethod
+    def neighbours(cls, rgb):
+        """
+        Class method returning the buckets of a color and of the colors one level away in any channel. Every color closer to the given one than BUCKET_WIDTH falls in one of them.
+        """
+        ranges = [
+            range(max(x // cls.BUCKET_WIDTH - 1, 0),
+                  min(x // cls.BUCKET_WIDTH + 2, cls.LEVELS)) for x in rgb
+        ]
+
+        return [(r * cls.LEVELS + g) * cls.LEVELS + b
+                for r in ranges[0] for g in ranges[1] for b in ranges[2]]
+
+    @staticmethod
+    def parse(color):
+        """
+        Static method returning the RGB three-tuple of a hexadecimal color such as "#ff8800" or "f80", raising a ValueError if it is invalid.
+        """
+        match = re.fullmatch(r'#?([\da-fA-F]{3}|[\da-fA-F]{6})', color.strip())
+        if not match:
+            raise ValueError(f'Invalid color: {color}')
+
+        digits = match.group(1)
+        if len(digits) == 3:
+            digits = ''.join(x * 2 for x in digits)
+
+        return tuple(int(digits[i:i + 2], 16) for i in range(0, 6, 2))
@@ -1,4 +1,3 @@
-import requests
 from django.conf import settings
 from .external_api_manager import ExternalAPIManager
 
@@ -17,6 +16,6 @@ class DictionaryAPIManager(ExternalAPIManager):
         except AttributeError:
             pass
 
-        return requests.get(
-            f'https://www.dictionaryapi.com/api/v3/references/collegiate/json/{word}?key={settings.MW_DICTIONARY_API_KEY}'
+        return cls.request(
+            f"{settings.EXTERNAL_API['DICTIONARY_URL']}{word}?key={settings.MW_DICTIONARY_API_KEY}"
         )
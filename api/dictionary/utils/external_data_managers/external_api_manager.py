@@ -1,16 +1,35 @@
 import json
+import os
+import random
 import requests
 import string
+import threading
 
 from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class JitteredRetry(Retry):
+    """
+    Retry policy drawing each backoff uniformly between zero and its exponential value, so that workers retrying a failing upstream at once spread out rather than retrying in lockstep.
+    """
+    def get_backoff_time(self):
+        return random.uniform(0, super().get_backoff_time())
 
 
 class ExternalAPIManager:
     """
     Class defining utility methods for sending requests to an external API.
+
+    Requests go through a single pooled session per process, so connections to the external servers are kept alive and reused across lookups. The session is rebuilt after a fork, since connections must not be shared between worker processes.
     """
     __num_api_calls = 0
 
+    __session = None
+    __session_pid = None
+    __session_lock = threading.Lock()
+
     @classmethod
     def num_api_calls(cls):
         """
@@ -46,3 +65,76 @@ class ExternalAPIManager:
             raise AttributeError(
                 f"type object '{cls.__name__}' has no attribute 'increment_num_api_calls'"
             )
+
+    @staticmethod
+    def __build_session():
+        """
+        Private static method returning a new session whose connection pools and retry policy follow settings.EXTERNAL_API.
+        """
+        config = settings.EXTERNAL_API
+
+        # Only idempotent requests are retried, and the last response is
+        # returned once retries run out, so callers still see its status.
+        # Read timeouts are not retried, so a slow server holds a worker for
+        # no longer than one READ_TIMEOUT.
+        retry = JitteredRetry(
+            total=config['RETRIES'],
+            read=False,
+            backoff_factor=config['BACKOFF_FACTOR'],
+            status_forcelist=config['RETRY_STATUSES'],
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=config['POOL_CONNECTIONS'],
+            pool_maxsize=config['POOL_MAXSIZE'],
+            max_retries=retry,
+        )
+
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+        return session
+
+    @classmethod
+    def session(cls):
+        """
+        Class method returning the session shared by the current process, creating it on first use or after a fork.
+        """
+        pid = os.getpid()
+
+        # Class attributes are read through ExternalAPIManager, so that every
+        # subclass shares the one session
+        with ExternalAPIManager.__session_lock:
+            if ExternalAPIManager.__session_pid != pid:
+                ExternalAPIManager.__session = \
+                    ExternalAPIManager.__build_session()
+                ExternalAPIManager.__session_pid = pid
+
+            return ExternalAPIManager.__session
+
+    @classmethod
+    def close_session(cls):
+        """
+        Class method closing the session of the current process, so that the next request opens a new one with the current settings.
+        """
+        with ExternalAPIManager.__session_lock:
+            if ExternalAPIManager.__session_pid == os.getpid():
+                ExternalAPIManager.__session.close()
+
+            ExternalAPIManager.__session = None
+            ExternalAPIManager.__session_pid = None
+
+    @classmethod
+    def request(cls, url, method='GET', **kwargs):
+        """
+        Class method sending a request through the shared session, bounded by the connect and read timeouts in settings.EXTERNAL_API unless a timeout is given. Raises a requests.exceptions.RequestException if the server cannot be reached in time.
+        """
+        kwargs.setdefault(
+            'timeout', (
+                settings.EXTERNAL_API['CONNECT_TIMEOUT'],
+                settings.EXTERNAL_API['READ_TIMEOUT'],
+            ))
+
+        return cls.session().request(method, url, **kwargs)
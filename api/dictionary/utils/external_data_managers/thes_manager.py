@@ -1,4 +1,3 @@
-import requests
 from .external_api_manager import ExternalAPIManager
 
 
@@ -18,6 +17,6 @@ class ThesaurusAPIManager(ExternalAPIManager):
         except AttributeError:
             pass
 
-        # return requests.get(
+        # return cls.request(
         #     f'https://www.dictionaryapi.com/api/v3/references/collegiate/json/{word}?key={settings.MW_DICTIONARY_API_KEY}'
         # )
@@ -0,0 +1,181 @@
+import os
+import threading
+
+import numpy as np
+
+from PIL import Image
+
+from django.conf import settings
+
+from .atomic_write import atomic_write
+
+
+class FeatureIndex:
+    """
+    Utility class keeping a feature vector per icon for visual similarity search. Vectors are small grayscale thumbnails, centred and scaled to unit length, so that cosine similarity is a dot product, computed against every icon at once with NumPy.
+
+    Vectors are stored as fixed-size records in a file under settings.MEDIA_ROOT, memory-mapped by each process. The file is appended to on upload, one record per write, and a later record for an icon supersedes earlier ones. Records of deleted icons are left in place until the index is rebuilt.
+    """
+    RELATIVE_PATH = 'index'
+    FILENAME = 'features.bin'
+
+    # Thumbnail size, whose pixels are the dimensions of the vectors
+    SIZE = (12, 12)
+    DIMENSIONS = SIZE[0] * SIZE[1]
+    RECORD = np.dtype([('id', '<i8'), ('vector', '<f4', (DIMENSIONS, ))])
+
+    __lock = threading.Lock()
+    __version = None
+    __ids = np.empty(0, dtype='<i8')
+    __vectors = np.empty((0, DIMENSIONS), dtype='<f4')
+    __rows = np.empty(0, dtype=np.intp)
+
+    @classmethod
+    def path(cls):
+        """
+        Class method returning the absolute path of the index file.
+        """
+        return os.path.join(
+            settings.MEDIA_ROOT, cls.RELATIVE_PATH, cls.FILENAME)
+
+    @classmethod
+    def compute(cls, f):
+        """
+        Class method returning the feature vector of the first frame of an image, given its path or a file object. Transparent pixels are flattened onto white.
+        """
+        with Image.open(f) as image:
+            image.seek(0)
+            image = image.convert('RGBA')
+
+        background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+        thumbnail = Image.alpha_composite(background, image).convert(
+            'L').resize(cls.SIZE, Image.LANCZOS)
+
+        vector = np.asarray(thumbnail, dtype='<f4').ravel()
+        vector -= vector.mean()
+        norm = np.linalg.norm(vector)
+
+        return vector / norm if norm else vector
+
+    @classmethod
+    def __records(cls, ids, vectors):
+        """
+        Private class method packing icon IDs and their vectors into records.
+        """
+        records = np.zeros(len(ids), dtype=cls.RECORD)
+        records['id'] = ids
+        records['vector'] = vectors
+
+        return records
+
+    @classmethod
+    def add(cls, icon_id, vector):
+        """
+        Class method appending the vector of an icon to the index, superseding any earlier vector of the icon. The record is appended in a single write, so that concurrent writers do not interleave.
+        """
+        path = cls.path()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, cls.__records([icon_id], [vector]).tobytes())
+        finally:
+            os.close(fd)
+
+    @classmethod
+    def rebuild(cls, items):
+        """
+        Class method replacing the index with the vectors of an iterable of two-tuples containing an icon ID and its vector. The file is replaced at once, so that readers never see a partial index.
+        """
+        ids, vectors = [], []
+        for icon_id, vector in items:
+            ids.append(icon_id)
+            vectors.append(vector)
+
+        atomic_write(cls.path(), cls.__records(ids, vectors).tobytes())
+
+        return len(ids)
+
+    @classmethod
+    def __load(cls):
+        """
+        Private class method mapping the index file again if it was replaced or appended to since it was last mapped. The latest record of each icon is found once per mapping, rather than on every query.
+        """
+        path = cls.path()
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            stat = None
+
+        version = (path, stat.st_ino, stat.st_size) if stat else (path, )
+        if version == cls.__version:
+            return
+
+        count = stat.st_size // cls.RECORD.itemsize if stat else 0
+        if count:
+            records = np.memmap(
+                path, dtype=cls.RECORD, mode='r', shape=(count, ))
+            ids = np.asarray(records['id'])
+
+            # The first occurrence of each ID from the end is its latest
+            unique, first = np.unique(ids[::-1], return_index=True)
+
+            cls.__ids = unique
+            cls.__vectors = records['vector']
+            cls.__rows = count - 1 - first
+        else:
+            cls.__ids = np.empty(0, dtype='<i8')
+            cls.__vectors = np.empty((0, cls.DIMENSIONS), dtype='<f4')
+            cls.__rows = np.empty(0, dtype=np.intp)
+
+        cls.__version = version
+
+    @classmethod
+    def contains(cls, icon_id):
+        """
+        Class method returning whether an icon has a vector in the index.
+        """
+        with cls.__lock:
+            cls.__load()
+            ids = cls.__ids
+
+        i = np.searchsorted(ids, icon_id)
+
+        return bool(i < len(ids) and ids[i] == icon_id)
+
+    @classmethod
+    def similar(cls, icon_id, k):
+        """
+        Class method returning a list of up to k two-tuples containing the IDs of the icons most similar to an icon and their cosine similarity, most similar first, or None if the icon is not in the index.
+        """
+        with cls.__lock:
+            cls.__load()
+            ids, vectors, rows = cls.__ids, cls.__vectors, cls.__rows
+
+        i = np.searchsorted(ids, icon_id)
+        if i == len(ids) or ids[i] != icon_id:
+            return None
+
+        # Superseded records are scored too, which is cheaper than copying
+        # the latest ones out of the mapping
+        scores = (vectors @ vectors[rows[i]])[rows]
+        scores[i] = -np.inf
+
+        k = min(k, len(ids) - 1)
+        if k <= 0:
+            return []
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+
+        return list(zip(ids[top].tolist(), scores[top].tolist()))
+
+    @classmethod
+    def stats(cls):
+        """
+        Class method returning a dictionary of the number of icons and of records in the index.
+        """
+        with cls.__lock:
+            cls.__load()
+
+            return {'icons': len(cls.__ids), 'records': len(cls.__vectors)}
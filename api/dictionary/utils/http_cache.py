@@ -0,0 +1,76 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_etags, quote_etag
+
+# One year, the conventional maximum for cached, content-addressed resources
+IMMUTABLE_MAX_AGE = 60 * 60 * 24 * 365
+
+
+def etag_matches(request, etag):
+    """
+    Return True if the If-None-Match header of a request lists the given entity tag or a wildcard.
+    """
+    header = request.META.get('HTTP_IF_NONE_MATCH')
+    if not header:
+        return False
+
+    etags = parse_etags(header)
+
+    return '*' in etags or quote_etag(etag) in etags or \
+        ('W/' + quote_etag(etag)) in etags
+
+
+def set_immutable(response, etag):
+    """
+    Mark a response as a content-addressed resource, which may be cached indefinitely by clients and proxies.
+    """
+    response['ETag'] = quote_etag(etag)
+    patch_cache_control(
+        response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+
+    return response
+
+
+def collection_version(queryset):
+    """
+    Get an entity tag and the last modification time of a queryset of timestamped models, from its number of rows and latest update in a single aggregate query. Any insertion, update, or deletion changes the entity tag.
+    """
+    version = queryset.order_by().aggregate(
+        count=Count('pk'), latest=Max('updated'))
+
+    return version_etag(version['count'], version['latest']), version['latest']
+
+
+def version_etag(count, latest):
+    """
+    Get the entity tag of a collection from its number of rows and latest update.
+    """
+    return hashlib.md5(
+        f'{count}:{latest.isoformat() if latest else ""}'.encode(
+            'utf-8')).hexdigest()
+
+
+def set_version(response, etag, last_modified=None):
+    """
+    Set the ETag and Last-Modified headers of a response.
+    """
+    response['ETag'] = quote_etag(etag)
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+
+    return response
+
+
+def not_modified_response(request, etag, last_modified=None):
+    """
+    Get an empty HTTP 304 response if the conditional headers of a request match the given version, or None otherwise. If-None-Match takes precedence over If-Modified-Since.
+    """
+    response = get_conditional_response(
+        request,
+        etag=quote_etag(etag),
+        last_modified=int(last_modified.timestamp())
+        if last_modified else None)
+
+    return set_version(response, etag, last_modified) if response else None
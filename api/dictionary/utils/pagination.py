@@ -0,0 +1,110 @@
+import json
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as BinasciiError
+from functools import reduce
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import ErrorDetail
+
+from api.exceptions import BadRequestError
+
+
+def get_results_per_page(request, key):
+    """
+    Get the number of results per page from the "results" query parameter of a request, defaulting to and capped by the settings for the given kind of object.
+    """
+    results = request.query_params.get(
+        'results', settings.DEFAULT_PAGE_LEN[key])
+
+    try:
+        results = int(results)
+    except ValueError:
+        results = 0
+
+    if results < 1:
+        raise BadRequestError(
+            ErrorDetail(
+                _('Query parameter "results" must be a positive integer.'),
+                'invalid_type'))
+
+    return min(results, settings.MAX_PAGE_LEN[key])
+
+
+class KeysetPaginator:
+    """
+    Utility class for paginating an ordered queryset by keyset (or "seek") pagination. Pages are addressed by an opaque cursor encoding the ordering values of the last row on the previous page, so each page costs one indexed range scan regardless of its depth, and no count is needed.
+
+    Every field in the ordering is sorted in ascending order, and the last field must be unique.
+    """
+    class InvalidCursor(Exception):
+        """
+        Exception to be raised when a cursor cannot be decoded or does not match the ordering.
+        """
+        def __init__(self):
+            return super().__init__('The cursor is invalid.')
+
+    def __init__(self, queryset, ordering, per_page):
+        """
+        Initialization method taking a queryset, the names of its ordering fields, and the maximum number of results per page.
+        """
+        self.queryset = queryset.order_by(*ordering)
+        self.ordering = tuple(ordering)
+        self.per_page = per_page
+
+    def encode_cursor(self, instance):
+        """
+        Method returning the cursor pointing just past a given model instance.
+        """
+        values = [getattr(instance, field) for field in self.ordering]
+
+        return str(
+            urlsafe_b64encode(json.dumps(values).encode('utf-8')),
+            'ascii').rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """
+        Method returning the ordering values encoded by a cursor.
+        """
+        try:
+            padding = '=' * (-len(cursor) % 4)
+            values = json.loads(urlsafe_b64decode(cursor + padding))
+        except (BinasciiError, UnicodeDecodeError, ValueError):
+            raise self.InvalidCursor()
+
+        if not isinstance(values, list) or \
+                len(values) != len(self.ordering) or \
+                not all(isinstance(x, (str, int)) for x in values):
+            raise self.InvalidCursor()
+
+        return values
+
+    def __after(self, values):
+        """
+        Private method building a filter selecting rows that sort after the given ordering values, i.e. (a, b, c) > (x, y, z) expanded as a disjunction.
+        """
+        clauses = []
+        for i, field in enumerate(self.ordering):
+            equal = {f: v for f, v in zip(self.ordering[:i], values[:i])}
+            clauses.append(Q(**equal, **{f'{field}__gt': values[i]}))
+
+        return reduce(lambda x, y: x | y, clauses)
+
+    def page(self, cursor=None):
+        """
+        Method returning a two-tuple containing (a) the list of results following a cursor, or the first results if the cursor is empty, and (b) the cursor for the next page, or None if this page is the last.
+        """
+        queryset = self.queryset
+        if cursor:
+            queryset = queryset.filter(self.__after(self.decode_cursor(cursor)))
+
+        # Fetch one extra row to find out whether another page exists
+        object_list = list(queryset[:self.per_page + 1])
+        if len(object_list) > self.per_page:
+            object_list = object_list[:self.per_page]
+            return object_list, self.encode_cursor(object_list[-1])
+
+        return object_list, None
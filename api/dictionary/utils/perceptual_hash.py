@@ -0,0 +1,68 @@
+from PIL import Image
+
+
+class PerceptualHash:
+    """
+    Utility class computing 64-bit difference hashes (dHash) of images with Pillow. Unlike MD5 hashsums, difference hashes of re-saved or slightly recolored images differ in only a few bits, so near-duplicates are found by Hamming distance.
+
+    For lookups, hashes are split into CHUNKS chunks stored in indexed columns. By the pigeonhole principle, two hashes within a distance smaller than CHUNKS share at least one chunk exactly, so candidates are found with one equality lookup per chunk (multi-index hashing) rather than by comparing every hash.
+    """
+    WIDTH = 9
+    HEIGHT = 8
+    CHUNKS = 4
+    CHUNK_BITS = 16
+
+    @classmethod
+    def compute(cls, f):
+        """
+        Class method returning the difference hash of the first frame of an image, given its path or a file object, as an unsigned integer. Transparent pixels are flattened onto white, so that the hash depends on what is displayed.
+        """
+        with Image.open(f) as image:
+            image.seek(0)
+            image = image.convert('RGBA')
+
+        background = Image.new('RGBA', image.size, (255, 255, 255, 255))
+        pixels = list(
+            Image.alpha_composite(background, image).convert('L').resize(
+                (cls.WIDTH, cls.HEIGHT), Image.LANCZOS).getdata())
+
+        value = 0
+        for row in range(cls.HEIGHT):
+            for col in range(cls.WIDTH - 1):
+                i = row * cls.WIDTH + col
+                value = (value << 1) | (pixels[i] > pixels[i + 1])
+
+        return value
+
+    @classmethod
+    def chunks(cls, value):
+        """
+        Class method splitting a hash into its chunks, most significant first.
+        """
+        mask = (1 << cls.CHUNK_BITS) - 1
+
+        return [
+            (value >> (cls.CHUNK_BITS * i)) & mask
+            for i in reversed(range(cls.CHUNKS))
+        ]
+
+    @staticmethod
+    def distance(a, b):
+        """
+        Static method returning the Hamming distance between two hashes.
+        """
+        return bin(a ^ b).count('1')
+
+    @staticmethod
+    def to_signed(value):
+        """
+        Static method converting an unsigned 64-bit hash to the signed integer stored in a 64-bit column.
+        """
+        return value - (1 << 64) if value >= (1 << 63) else value
+
+    @staticmethod
+    def to_unsigned(value):
+        """
+        Static method converting a stored signed integer back to an unsigned 64-bit hash.
+        """
+        return value + (1 << 64) if value < 0 else value
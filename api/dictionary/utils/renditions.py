@@ -0,0 +1,208 @@
+import os
+
+from collections import OrderedDict
+from io import BytesIO
+
+from PIL import Image
+
+from django.conf import settings
+
+from .atomic_write import atomic_write
+
+
+class Renditions:
+    """
+    Utility class producing size-optimized variants of an icon with Pillow, and choosing among them for a request. Variants are stored beside the original as <md5>.<variant>, addressed by the hashsum of the original.
+    """
+    ORIGINAL = 'original'
+
+    # Variant names, by content type
+    CONTENT_TYPES = OrderedDict(
+        {
+            'gif': 'image/gif',
+            'webp': 'image/webp',
+            'png2x': 'image/png',
+        })
+
+    # Content types of originals, by leading bytes
+    SIGNATURES = OrderedDict(
+        {
+            b'GIF87a': 'image/gif',
+            b'GIF89a': 'image/gif',
+            b'\x89PNG\r\n\x1a\n': 'image/png',
+            b'\xff\xd8\xff': 'image/jpeg',
+        })
+
+    @staticmethod
+    def __gif(image, f):
+        """
+        Private static method saving a GIF with an optimized palette, keeping any animation.
+        """
+        image.save(
+            f,
+            format='GIF',
+            optimize=True,
+            save_all=getattr(image, 'n_frames', 1) > 1)
+
+    @staticmethod
+    def __webp(image, f):
+        """
+        Private static method saving a lossless WebP image, keeping any animation.
+        """
+        image.save(
+            f,
+            format='WEBP',
+            lossless=True,
+            method=6,
+            save_all=getattr(image, 'n_frames', 1) > 1)
+
+    @staticmethod
+    def __png2x(image, f):
+        """
+        Private static method saving the first frame as a PNG image upscaled twice with nearest-neighbour sampling, for high-density screens.
+        """
+        image.seek(0)
+        image = image.convert('RGBA')
+        image.resize(
+            (image.width * 2, image.height * 2),
+            Image.NEAREST).save(
+                f, format='PNG', optimize=True)
+
+    @classmethod
+    def relative_path(cls, md5, variant):
+        """
+        Class method returning the path of a variant relative to settings.MEDIA_ROOT.
+        """
+        from ..models import Icon
+
+        return os.path.join(Icon.RELATIVE_PATH, f'{md5}.{variant}')
+
+    @classmethod
+    def absolute_path(cls, md5, variant):
+        """
+        Class method returning the absolute path of a variant.
+        """
+        return os.path.join(
+            settings.MEDIA_ROOT, cls.relative_path(md5, variant))
+
+    @classmethod
+    def generate(cls, md5, relative_path, force=False):
+        """
+        Class method producing the variants of an original image given by a path relative to settings.MEDIA_ROOT, and returning the size in bytes of the original and of each stored variant. Existing variants are kept unless force is True. Returns an empty dictionary if the original cannot be read as an image.
+        """
+        original = os.path.join(settings.MEDIA_ROOT, relative_path)
+        sizes = OrderedDict({cls.ORIGINAL: os.path.getsize(original)})
+        writers = {
+            'gif': cls.__gif,
+            'webp': cls.__webp,
+            'png2x': cls.__png2x,
+        }
+
+        for variant in cls.CONTENT_TYPES:
+            path = cls.absolute_path(md5, variant)
+            if not force and os.path.isfile(path):
+                sizes[variant] = os.path.getsize(path)
+                continue
+
+            f = BytesIO()
+            try:
+                with Image.open(original) as image:
+                    writers[variant](image, f)
+            except OSError:
+                return OrderedDict()
+
+            atomic_write(path, f.getvalue())
+            sizes[variant] = len(f.getvalue())
+
+        return sizes
+
+    @classmethod
+    def delete(cls, md5):
+        """
+        Class method removing every stored variant of an image.
+        """
+        for variant in cls.CONTENT_TYPES:
+            try:
+                os.remove(cls.absolute_path(md5, variant))
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def __accepts(accept, content_type):
+        """
+        Private static method returning whether an Accept header lists a content type with a quality above zero. Wildcard ranges are ignored, since clients send them regardless of the image formats they decode.
+        """
+        for media_range in accept.split(','):
+            media_type, *params = [x.strip() for x in media_range.split(';')]
+            if media_type.lower() != content_type:
+                continue
+
+            quality = 1.0
+            for param in params:
+                name, _, value = param.partition('=')
+                if name.strip().lower() == 'q':
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+
+            return quality > 0
+
+        return False
+
+    @classmethod
+    def sniff(cls, path):
+        """
+        Class method returning the content type of an image file from its leading signature bytes, or None if it is unknown or the file is missing. Only the header is read, the image is not decoded.
+        """
+        try:
+            with open(path, 'rb') as f:
+                header = f.read(12)
+        except FileNotFoundError:
+            return None
+
+        for signature, content_type in cls.SIGNATURES.items():
+            if header.startswith(signature):
+                return content_type
+        if header[:4] == b'RIFF' and header[8:12] == b'WEBP':
+            return 'image/webp'
+        return None
+
+    @classmethod
+    def select(cls, md5, relative_path, accept='', scale=1, content_type=None):
+        """
+        Class method choosing the file to serve for a request, returning the variant name, its absolute path and its content type, or None if no stored file fits. The high-density PNG is served at scale 2 if stored. Otherwise, if content_type is given, the smallest stored file of that type is chosen, else the smallest stored file among the original, the GIF variant and the variants whose content type is explicitly accepted with a nonzero quality is chosen.
+        """
+        original = os.path.join(settings.MEDIA_ROOT, relative_path)
+        candidates = [(cls.ORIGINAL, original, None)]
+        candidates.extend(
+            (variant, cls.absolute_path(md5, variant), x)
+            for variant, x in cls.CONTENT_TYPES.items())
+
+        if scale == 2 and os.path.isfile(candidates[-1][1]):
+            candidates = candidates[-1:]
+        elif content_type is not None:
+            candidates = [
+                (variant, path, content_type)
+                for variant, path, x in candidates[:-1]
+                if (x or cls.sniff(path)) == content_type]
+        else:
+            candidates = [
+                x for x in candidates
+                if x[0] in (cls.ORIGINAL, 'gif') or (
+                    x[0] == 'webp' and cls.__accepts(accept, x[2]))]
+
+        sizes = {}
+        for variant, path, _ in candidates:
+            try:
+                sizes[variant] = os.path.getsize(path)
+            except FileNotFoundError:
+                pass
+
+        selected = min(
+            (x for x in candidates if x[0] in sizes),
+            key=lambda x: sizes[x[0]],
+            default=None)
+        if selected and selected[2] is None:
+            selected = (*selected[:2], cls.sniff(selected[1]))
+        return selected
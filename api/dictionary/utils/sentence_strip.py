@@ -0,0 +1,197 @@
+import hashlib
+import json
+import os
+import threading
+
+from collections import OrderedDict
+from io import BytesIO
+
+from PIL import Image
+
+from django.conf import settings
+
+from .atomic_write import atomic_write
+
+
+class SentenceStrip:
+    """
+    Utility class composing the icons of a sentence into a single PNG strip, in order, along with a JSON map of the position of each icon. Strips are stored under settings.MEDIA_ROOT and addressed by a hash of the sequence of MD5 hashsums of their icons, so that they may be cached indefinitely, and are built on their first request.
+
+    Decoded icon frames are kept in a bounded, least-recently-used cache local to the process, since sentences share most of their words. Stored strips are bounded as well: once there are more than settings.SENTENCE_STRIP['MAX_STRIPS'], the least recently requested ones are removed, their modification time being renewed on each request.
+    """
+    RELATIVE_PATH = 'strip'
+
+    # Icons are at most this size, as enforced on upload. Words without an
+    # icon are left as blank cells, so the strip still reads in order.
+    CELL_WIDTH = 64
+    CELL_HEIGHT = 54
+
+    __lock = threading.Lock()
+    __frames = OrderedDict()
+    __hits = 0
+    __misses = 0
+
+    @staticmethod
+    def key(md5s):
+        """
+        Static method returning the address of the strip of a sequence of images, given their MD5 hashsums in order, with None for blank cells.
+        """
+        return hashlib.md5(
+            ','.join(x or '' for x in md5s).encode('ascii')).hexdigest()
+
+    @classmethod
+    def relative_path(cls, key, extension='png'):
+        """
+        Class method returning the path of a strip file relative to settings.MEDIA_ROOT.
+        """
+        return os.path.join(cls.RELATIVE_PATH, f'{key}.{extension}')
+
+    @classmethod
+    def absolute_path(cls, key, extension='png'):
+        """
+        Class method returning the absolute path of a strip file.
+        """
+        return os.path.join(
+            settings.MEDIA_ROOT, cls.relative_path(key, extension))
+
+    @classmethod
+    def __frame(cls, md5, relative_path):
+        """
+        Private class method returning the decoded first frame of an image, fitted to a cell, from the frame cache if possible.
+        """
+        with cls.__lock:
+            frame = cls.__frames.get(md5)
+            if frame is not None:
+                cls.__frames.move_to_end(md5)
+                cls.__hits += 1
+                return frame
+
+            cls.__misses += 1
+
+        with Image.open(
+                os.path.join(settings.MEDIA_ROOT, relative_path)) as image:
+            image.seek(0)
+            frame = image.convert('RGBA')
+        frame.thumbnail((cls.CELL_WIDTH, cls.CELL_HEIGHT))
+
+        max_frames = settings.SENTENCE_STRIP['FRAME_CACHE_LEN']
+        with cls.__lock:
+            cls.__frames[md5] = frame
+            while len(cls.__frames) > max_frames:
+                cls.__frames.popitem(last=False)
+
+        return frame
+
+    @classmethod
+    def __build(cls, key, images):
+        """
+        Private class method pasting images side by side, separated by the configured spacing, and storing the strip and its map.
+        """
+        spacing = settings.SENTENCE_STRIP['SPACING']
+        frames = [cls.__frame(*x) if x else None for x in images]
+        widths = [x.width if x else cls.CELL_WIDTH for x in frames]
+
+        strip = Image.new(
+            'RGBA',
+            (sum(widths) + spacing * max(len(widths) - 1, 0), cls.CELL_HEIGHT))
+        cells = []
+
+        x = 0
+        for frame, width in zip(frames, widths):
+            if frame:
+                # Icons shorter than a cell are centred vertically
+                y = (cls.CELL_HEIGHT - frame.height) // 2
+                strip.paste(frame, (x, y))
+                cells.append([x, y, frame.width, frame.height])
+            else:
+                cells.append(None)
+
+            x += width + spacing
+
+        layout = OrderedDict(
+            {
+                'width': strip.width,
+                'height': strip.height,
+                'cells': cells,
+            })
+
+        f = BytesIO()
+        strip.save(f, format='PNG', optimize=True)
+
+        atomic_write(cls.absolute_path(key), f.getvalue())
+        atomic_write(
+            cls.absolute_path(key, 'json'),
+            json.dumps(layout).encode('utf-8'))
+
+        return layout
+
+    @classmethod
+    def get_or_build(cls, images):
+        """
+        Class method returning the address and map of the strip of a sequence of images, given as two-tuples of their MD5 hashsums and their paths relative to settings.MEDIA_ROOT, with None for blank cells. The strip is built if it does not exist yet.
+        """
+        key = cls.key([x[0] if x else None for x in images])
+
+        try:
+            with open(cls.absolute_path(key, 'json'), 'rb') as f:
+                layout = json.load(f, object_pairs_hook=OrderedDict)
+            os.utime(cls.absolute_path(key, 'json'))
+        except FileNotFoundError:
+            layout = cls.__build(key, images)
+            cls.prune(settings.SENTENCE_STRIP['MAX_STRIPS'])
+
+        return key, layout
+
+    @classmethod
+    def prune(cls, max_strips):
+        """
+        Class method removing the least recently requested strips until no more than max_strips are stored, and returning the number of strips removed.
+        """
+        directory = os.path.join(settings.MEDIA_ROOT, cls.RELATIVE_PATH)
+
+        try:
+            with os.scandir(directory) as entries:
+                strips = [
+                    (x.stat().st_mtime, x.name[:-len('.json')])
+                    for x in entries if x.name.endswith('.json')
+                ]
+        except FileNotFoundError:
+            return 0
+
+        if len(strips) <= max_strips:
+            return 0
+
+        strips.sort()
+        removed = strips[:len(strips) - max_strips]
+
+        for _, key in removed:
+            # The map goes first, so a strip is never found without its image
+            for extension in ['json', 'png']:
+                try:
+                    os.remove(cls.absolute_path(key, extension))
+                except FileNotFoundError:
+                    pass
+
+        return len(removed)
+
+    @classmethod
+    def stats(cls):
+        """
+        Class method returning a dictionary of the number of cached frames and the hit and miss counts of the frame cache.
+        """
+        with cls.__lock:
+            return {
+                'frames': len(cls.__frames),
+                'hits': cls.__hits,
+                'misses': cls.__misses,
+            }
+
+    @classmethod
+    def clear(cls):
+        """
+        Class method emptying the frame cache and resetting its counters.
+        """
+        with cls.__lock:
+            cls.__frames.clear()
+            cls.__hits = 0
+            cls.__misses = 0
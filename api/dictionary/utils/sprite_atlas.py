@@ -0,0 +1,148 @@
+import hashlib
+import json
+import math
+import os
+
+from collections import OrderedDict
+from io import BytesIO
+
+from PIL import Image
+
+from django.conf import settings
+
+from .atomic_write import atomic_write
+
+
+class SpriteAtlas:
+    """
+    Utility class packing icon images into a single PNG sprite sheet, along with a JSON map of the position of each image. Atlases are stored under settings.MEDIA_ROOT in a directory per category, and addressed by a hash of the MD5 hashsums of their members, so that a change in membership yields a new atlas, built lazily on its first request. Superseded atlases stay available to clients holding their address, until there are more than settings.SPRITE_ATLAS['MAX_ATLASES'] stored and the least recently requested ones are removed, their modification time being renewed on each request.
+    """
+    RELATIVE_PATH = 'atlas'
+
+    # Icons are at most this size, as enforced on upload
+    CELL_WIDTH = 64
+    CELL_HEIGHT = 54
+
+    @staticmethod
+    def key(md5s):
+        """
+        Static method returning the address of the atlas of a set of images, given their MD5 hashsums.
+        """
+        return hashlib.md5(
+            ','.join(sorted(set(md5s))).encode('ascii')).hexdigest()
+
+    @classmethod
+    def relative_path(cls, category_id, key, extension='png'):
+        """
+        Class method returning the path of an atlas file of a category relative to settings.MEDIA_ROOT.
+        """
+        return os.path.join(
+            cls.RELATIVE_PATH, str(category_id), f'{key}.{extension}')
+
+    @classmethod
+    def absolute_path(cls, category_id, key, extension='png'):
+        """
+        Class method returning the absolute path of an atlas file of a category.
+        """
+        return os.path.join(
+            settings.MEDIA_ROOT,
+            cls.relative_path(category_id, key, extension))
+
+    @classmethod
+    def __build(cls, category_id, key, images):
+        """
+        Private class method packing images into a grid of cells, as close to square as possible, and storing the sheet and its map.
+        """
+        columns = max(1, math.ceil(math.sqrt(len(images))))
+        rows = max(1, math.ceil(len(images) / columns))
+
+        sheet = Image.new(
+            'RGBA', (columns * cls.CELL_WIDTH, rows * cls.CELL_HEIGHT))
+        sprites = OrderedDict()
+
+        for i, (md5, relative_path) in enumerate(sorted(images.items())):
+            x = i % columns * cls.CELL_WIDTH
+            y = i // columns * cls.CELL_HEIGHT
+
+            with Image.open(
+                    os.path.join(settings.MEDIA_ROOT, relative_path)) as image:
+                image = image.convert('RGBA')
+                image.thumbnail((cls.CELL_WIDTH, cls.CELL_HEIGHT))
+                sheet.paste(image, (x, y))
+                sprites[md5] = [x, y, image.width, image.height]
+
+        atlas = OrderedDict(
+            {
+                'width': sheet.width,
+                'height': sheet.height,
+                'sprites': sprites,
+            })
+
+        f = BytesIO()
+        sheet.save(f, format='PNG', optimize=True)
+
+        atomic_write(cls.absolute_path(category_id, key), f.getvalue())
+        atomic_write(
+            cls.absolute_path(category_id, key, 'json'),
+            json.dumps(atlas).encode('utf-8'))
+
+        return atlas
+
+    @classmethod
+    def get_or_build(cls, category_id, images):
+        """
+        Class method returning the address and map of the atlas of some images of a category, given as a dictionary of their MD5 hashsums to their paths relative to settings.MEDIA_ROOT. The atlas is built if it does not exist yet.
+        """
+        key = cls.key(images)
+
+        path = cls.absolute_path(category_id, key, 'json')
+
+        try:
+            with open(path, 'rb') as f:
+                atlas = json.load(f, object_pairs_hook=OrderedDict)
+            os.utime(path)
+        except FileNotFoundError:
+            atlas = cls.__build(category_id, key, images)
+            cls.prune(settings.SPRITE_ATLAS['MAX_ATLASES'])
+
+        return key, atlas
+
+    @classmethod
+    def prune(cls, max_atlases):
+        """
+        Class method removing the least recently requested atlases of every category until no more than max_atlases are stored, and returning the number of atlases removed.
+        """
+        root = os.path.join(settings.MEDIA_ROOT, cls.RELATIVE_PATH)
+        atlases = []
+
+        try:
+            with os.scandir(root) as directories:
+                for directory in directories:
+                    if not directory.is_dir():
+                        continue
+
+                    with os.scandir(directory.path) as entries:
+                        atlases.extend(
+                            (
+                                x.stat().st_mtime,
+                                directory.name,
+                                x.name[:-len('.json')])
+                            for x in entries if x.name.endswith('.json'))
+        except FileNotFoundError:
+            return 0
+
+        if len(atlases) <= max_atlases:
+            return 0
+
+        atlases.sort()
+        removed = atlases[:len(atlases) - max_atlases]
+
+        for _, category_id, key in removed:
+            # The map goes first, so an atlas is never found without its image
+            for extension in ['json', 'png']:
+                try:
+                    os.remove(cls.absolute_path(category_id, key, extension))
+                except FileNotFoundError:
+                    pass
+
+        return len(removed)
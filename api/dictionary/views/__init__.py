@@ -1,5 +1,7 @@
 from .icon_search_view import *
+from .icon_raw_view import *
 from .icon_views import *
 from .mp3_views import *
+from .sheet_raw_view import *
 from .word_view import *
 from .word_search_view import *
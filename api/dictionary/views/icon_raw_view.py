@@ -0,0 +1,57 @@
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.views import View
+
+from ..models import Icon
+from ..utils import Renditions, etag_matches, set_immutable
+
+
+class IconRawView(View):
+    """
+    View class for serving the raw bytes of an icon, addressed by its MD5 hashsum. Since the address is derived from the content, responses are marked immutable and revalidated with strong entity tags. Without an extension, the smallest variant accepted by the client is served, or the high-density variant with the query parameter "scale=2". With an extension, only files of the matching content type are served, or the high-density variant at "@2x.png".
+    """
+    scale = None
+
+    def get(self, request, md5, extension=None):
+        """
+        GET method for obtaining an icon file, or an empty HTTP 304 response if the client already holds a copy.
+        """
+        icon = Icon.objects.filter(_hash=bytes.fromhex(md5)).only(
+            'id', 'image', '_hash').first()
+
+        if not icon or not icon.image:
+            raise Http404()
+
+        negotiated = extension is None and self.scale is None
+        if negotiated:
+            selected = Renditions.select(
+                md5,
+                icon.image.name,
+                accept=request.META.get('HTTP_ACCEPT', ''),
+                scale=2 if request.GET.get('scale') == '2' else 1)
+        else:
+            selected = Renditions.select(
+                md5,
+                icon.image.name,
+                scale=self.scale or 1,
+                content_type=Renditions.CONTENT_TYPES[extension or 'png2x'])
+
+        if not selected or not selected[2]:
+            raise Http404()
+
+        variant, path, content_type = selected
+        etag = md5 if variant == Renditions.ORIGINAL else f'{md5}.{variant}'
+
+        if etag_matches(request, etag):
+            response = HttpResponseNotModified()
+        else:
+            try:
+                response = FileResponse(
+                    open(path, 'rb'), content_type=content_type)
+            except FileNotFoundError:
+                raise Http404()
+
+        if negotiated:
+            patch_vary_headers(response, ['Accept'])
+
+        return set_immutable(response, etag)
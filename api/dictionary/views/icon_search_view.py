@@ -1,4 +1,3 @@
-from django.conf import settings
 from django.core.paginator import (Paginator, InvalidPage, PageNotAnInteger)
 from django.utils.translation import gettext_lazy as _
 
@@ -8,11 +7,15 @@ from rest_framework.response import Response
 
 from api import NON_FIELD_ERRORS_KEY
 from ..models import Icon
+from ..projections import IconProjection
+from ..utils import (
+    collection_version, get_results_per_page, not_modified_response,
+    set_version)
 
 
 class IconSearchView(generics.GenericAPIView):
     """
-    View class for getting search results.
+    View class for getting search results, ranked by relevance.
     """
 
     def __error_response(self, error_detail, status):
@@ -24,7 +27,7 @@ class IconSearchView(generics.GenericAPIView):
     def __success_response(self, paginator, page):
         return Response(
             {
-                'results': [x.obj for x in page.object_list],
+                'results': IconProjection.serialize_many(page.object_list),
                 'pagination': {
                     'totalResults': paginator.count,
                     'maxResultsPerPage': paginator.per_page,
@@ -43,15 +46,18 @@ class IconSearchView(generics.GenericAPIView):
         GET method for obtaining search results.
         """
         page_num = request.query_params.get('page', 1)
-        results_per_page = min(
-            request.query_params.get(
-                'results', settings.DEFAULT_PAGE_LEN['icon']),
-            settings.MAX_PAGE_LEN['icon'],
-        )
+        results_per_page = get_results_per_page(request, 'icon')
+
+        entries = Icon.objects.search(word)
+
+        # Answer conditional requests before any encoding is done
+        version = collection_version(entries)
+        response = not_modified_response(request, *version)
+        if response:
+            return response
 
-        entries = Icon.objects.filter(word__icontains=word).extra(
-            select={'relevance': 'char_length(word)'}, order_by=['relevance'])
-        paginator = Paginator(entries, results_per_page)
+        paginator = Paginator(
+            IconProjection.queryset(entries), results_per_page)
 
         try:
             page = paginator.get_page(page_num)
@@ -70,4 +76,5 @@ class IconSearchView(generics.GenericAPIView):
                 status.HTTP_404_NOT_FOUND,
             )
 
-        return self.__success_response(paginator, page)
+        return set_version(
+            self.__success_response(paginator, page), *version)
@@ -1,8 +1,8 @@
 from django.conf import settings
 from django.core.paginator import (Paginator, InvalidPage, PageNotAnInteger)
-from django.db.models.signals import post_save
 from django.shortcuts import get_object_or_404
 from django.http import Http404
+from django.utils.translation import gettext_lazy as _
 
 from rest_framework import status, serializers, generics
 from rest_framework.exceptions import (
@@ -13,9 +13,11 @@ from rest_framework.response import Response
 from api import NON_FIELD_ERRORS_KEY
 from api.authentication.permissions import IsVerified, IsOwner
 
-from ..models import Icon, Category, Image
+from ..models import Icon, Category
+from ..projections import IconProjection
 from ..serializers import (
     IconUploadSerializer, IconApproveSerializer, IconUpdateSerializer)
+from ..utils import KeysetPaginator, get_results_per_page
 
 
 class IconUploadView(generics.GenericAPIView):
@@ -69,12 +71,11 @@ class IconApproveView(generics.GenericAPIView):
 
     def post(self, request, id):
         """
-        Action to approve an icon.
+        Action to approve an icon, in a single UPDATE.
         """
-        queryset = Icon.objects.all()
-        icon = get_object_or_404(queryset, id=id)
-        icon.is_approved = True
-        icon.save()
+        queryset = Icon.objects.filter(id=id)
+        if not Icon.set_approved(queryset) and not queryset.exists():
+            raise Http404()
 
         return Response(
             {'success': 'Icon approved.'}, status=status.HTTP_200_OK)
@@ -103,10 +104,30 @@ class IconListView(generics.GenericAPIView):
 
     # serializer_class = IconListSerializer
 
+    def __error_response(self, error_detail, status):
+        return Response(
+            {
+                NON_FIELD_ERRORS_KEY: [error_detail],
+            }, status=status)
+
+    def __keyset_response(self, object_list, next_cursor, per_page):
+        return Response(
+            {
+                'data': IconProjection.serialize_many(object_list),
+                'pagination': {
+                    'maxResultsPerPage': per_page,
+                    'numResultsThisPage': len(object_list),
+                    'nextCursor': next_cursor,
+                    'nextPageExists': next_cursor is not None,
+                }
+            },
+            status=status.HTTP_200_OK,
+        )
+
     def __success_response(self, paginator, page):
         return Response(
             {
-                'data': [x.obj for x in page.object_list],
+                'data': IconProjection.serialize_many(page.object_list),
                 'pagination': {
                     'totalResults': paginator.count,
                     'maxResultsPerPage': paginator.per_page,
@@ -128,29 +149,32 @@ class IconListView(generics.GenericAPIView):
         category_id = request.query_params.get('category', None)
         page_num = request.query_params.get('page', 1)
 
-        results_per_page = min(
-            request.query_params.get(
-                'results', settings.DEFAULT_PAGE_LEN['icon']),
-            settings.MAX_PAGE_LEN['icon'],
-        )
+        results_per_page = get_results_per_page(request, 'icon')
+
+        if category_id:
+            category_id = get_object_or_404(Category, id=category_id).id
+
+        icons, ordering = Icon.listing(search=search, category_id=category_id)
+        icons = IconProjection.queryset(icons)
+
+        # Keyset pagination, selected by the presence of the cursor parameter
+        if 'cursor' in request.query_params:
+            paginator = KeysetPaginator(icons, ordering, results_per_page)
+            try:
+                object_list, next_cursor = paginator.page(
+                    request.query_params['cursor'])
+            except KeysetPaginator.InvalidCursor:
+                return self.__error_response(
+                    ErrorDetail(
+                        _('Query parameter "cursor" is invalid.'),
+                        'invalid_cursor'),
+                    status.HTTP_400_BAD_REQUEST,
+                )
 
-        icons = []
-        if search and category_id:
-            category = get_object_or_404(Category, id=category_id)
-            icons = Icon.by_category(
-                category.id, filter_kwargs={'word__istartswith': search})
-        elif search and not category_id:
-            icons = list(Icon.objects.filter(word__istartswith=search))
-        elif not search and category_id:
-            category = get_object_or_404(Category, id=category_id)
-            icons = Icon.by_category(category.id)
-        else:
-            icons = list(Icon.objects.all())
-
-        icons = sorted(icons, key=lambda x: x.word.lower())
-        if search:
-            icons = sorted(icons, key=lambda x: len(x.word))
+            return self.__keyset_response(
+                object_list, next_cursor, results_per_page)
 
+        # Page number pagination
         paginator = Paginator(icons, results_per_page)
         try:
             page = paginator.get_page(page_num)
@@ -213,8 +237,6 @@ class IconDeleteView(generics.GenericAPIView):
     def delete(self, request, id):
         icon = get_object_or_404(Icon, id=id)
 
-        post_save.disconnect(Image.post_save, sender=Icon, dispatch_uid='0')
         icon.delete()
-        post_save.connect(Image.post_save, sender=Icon, dispatch_uid='0')
 
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,26 @@
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.views import View
+
+from ..utils import etag_matches, set_immutable
+
+
+class SheetRawView(View):
+    """
+    View class for serving a PNG sheet composed of icons, such as a sprite atlas or a sentence strip, addressed by a hash of its icons. The absolute path of a sheet is given by the path attribute, called with the arguments of the URL. Like icon files, responses are marked immutable.
+    """
+    path = None
+
+    def get(self, request, key, **kwargs):
+        """
+        GET method for obtaining a sheet, or an empty HTTP 304 response if the client already holds a copy.
+        """
+        if etag_matches(request, key):
+            return set_immutable(HttpResponseNotModified(), key)
+
+        try:
+            f = open(self.path(key=key, **kwargs), 'rb')
+        except FileNotFoundError:
+            raise Http404()
+
+        return set_immutable(
+            FileResponse(f, content_type='image/png'), key)
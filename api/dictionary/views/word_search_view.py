@@ -1,4 +1,3 @@
-import json
 from collections import OrderedDict
 
 from django.conf import settings
@@ -59,19 +58,10 @@ class WordSearchView(generics.GenericAPIView):
         if type(entries) == list:
             paginator = Paginator(entries, results_per_page)
         else:
-            # The following variable names a list, and is not the dict type.
-            # Here, dict refers to a literal dictionary.
-
-            # Create results array for use in generating response
-            dict_entries = entries
-            meta_fields = {'id', 'sort', 'stems', 'offensive'}
-            results = sorted(
-                    [
-                        {key: json.loads(x.json)['meta'][key] \
-                            for key in meta_fields
-                        } for x in dict_entries
-                    ],
-                    key=lambda y: y['sort'])
+            # Results come from the columns extracted from each entry, and
+            # are sorted and paginated by the database
+            results = entries.order_by('sort', 'id').values(
+                'id', 'sort', 'stems', 'offensive')
 
             paginator = Paginator(results, results_per_page)
         try:
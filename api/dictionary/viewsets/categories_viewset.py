@@ -1,13 +1,21 @@
+from collections import OrderedDict
+
 from django.conf import settings
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 
 from rest_framework import exceptions, status
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework.viewsets import GenericViewSet
 
-from ..models import Category
+from ..models import Category, Icon
+from ..projections import CategoryProjection
 from ..serializers import CategorySerializer
+from ..utils import (
+    SpriteAtlas, collection_version, etag_matches, not_modified_response,
+    set_version, version_etag)
 
 from api.authentication.permissions import IsSafeMethod, IsVerified
 from api.exceptions import BadRequestError
@@ -22,15 +30,121 @@ class CategoriesViewSet(GenericViewSet):
         parent = request.query_params.get('parent', None)
         if parent: parent = int(parent)
 
-        return Response(
+        categories = Category.objects.filter(parent=parent)
+
+        version = collection_version(categories)
+        response = not_modified_response(request, *version)
+        if response:
+            return response
+
+        response = Response(
+            {
+                'data':
+                CategoryProjection.serialize_many(
+                    CategoryProjection.queryset(categories.order_by('id')))
+            },
+            status=status.HTTP_200_OK,
+        )
+
+        return set_version(response, *version)
+
+    @action(detail=False, url_path='tree')
+    def tree(self, request):
+        """
+        Action to retrieve the whole category hierarchy as nested objects, built from a single query. The entity tag is derived from the number of categories and the latest update, so an unchanged tree costs no serialization.
+        """
+        rows = list(
+            Category.objects.order_by('depth', 'name').values_list(
+                'id', 'name', 'parent_id', 'updated'))
+
+        latest = max((x[3] for x in rows), default=None)
+        version = version_etag(len(rows), latest), latest
+
+        response = not_modified_response(request, *version)
+        if response:
+            return response
+
+        # Parents sort before their children, since rows are ordered by depth
+        nodes = {}
+        roots = []
+        for id, name, parent_id, _ in rows:
+            node = OrderedDict({'id': id, 'name': name, 'children': []})
+            nodes[id] = node
+
+            if parent_id in nodes:
+                nodes[parent_id]['children'].append(node)
+            else:
+                roots.append(node)
+
+        response = Response({'data': roots}, status=status.HTTP_200_OK)
+
+        return set_version(response, *version)
+
+    @action(detail=True, url_path='atlas')
+    def atlas(self, request, pk=None):
+        """
+        Action to retrieve a sprite atlas of the approved icons in a category and its subcategories, so a whole category can be shown from a single image. The atlas is addressed by a hash of its members, which also serves as the entity tag, and is built on the first request after membership changes. Only the first settings.MAX_BATCH_LEN['atlas'] icons in listing order are packed, which is reported by the "truncated" flag.
+        """
+        category = get_object_or_404(Category, pk=pk)
+        max_atlas_len = settings.MAX_BATCH_LEN['atlas']
+        icons = list(
+            Icon.by_category(category.id, {
+                'is_approved': True,
+                '_hash__isnull': False,
+            }).order_by(*Icon.LIST_ORDERING).only(
+                'id', 'word', 'image', '_hash')[:max_atlas_len + 1])
+
+        truncated = len(icons) > max_atlas_len
+        icons = icons[:max_atlas_len]
+
+        images = {x.md5: x.image.name for x in icons}
+        key = SpriteAtlas.key(images)
+
+        if etag_matches(request, key):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            response['ETag'] = f'"{key}"'
+            return response
+
+        key, atlas = SpriteAtlas.get_or_build(category.id, images)
+
+        icon_objs = []
+        for icon in icons:
+            x, y, width, height = atlas['sprites'][icon.md5]
+            icon_objs.append(
+                OrderedDict(
+                    {
+                        'id': icon.id,
+                        'word': icon.word,
+                        'md5': icon.md5,
+                        'x': x,
+                        'y': y,
+                        'width': width,
+                        'height': height,
+                    }))
+
+        response = Response(
             {
-                'data': [
-                    x.obj for x in Category.objects.filter(
-                        parent=parent).order_by('id')
-                ]
+                'data':
+                OrderedDict(
+                    {
+                        'url':
+                        reverse(
+                            'api:dict:atlas-raw',
+                            kwargs={
+                                'category_id': category.id,
+                                'key': key,
+                            }),
+                        'width': atlas['width'],
+                        'height': atlas['height'],
+                        'truncated': truncated,
+                        'icons': icon_objs,
+                    })
             },
             status=status.HTTP_200_OK,
         )
+        response['ETag'] = f'"{key}"'
+
+        return response
 
     def retrieve(self, request, *args, **kwargs):
         return Response(
@@ -70,7 +184,6 @@ class CategoriesViewSet(GenericViewSet):
             raise exceptions.MethodNotAllowed(request.method)
 
         category = get_object_or_404(Category, id=id)
-        for cat in Category.subcategories(category.id):
-            cat.delete()
+        Category.subcategories(category.id).delete()
 
         return Response(status=status.HTTP_204_NO_CONTENT)
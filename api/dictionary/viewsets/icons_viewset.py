@@ -1,26 +1,42 @@
+import hashlib
+import json
+import re
+
+from collections import OrderedDict
+
 from django.conf import settings
 from django.core.paginator import (Paginator, InvalidPage, PageNotAnInteger)
-from django.db.models.signals import post_save
+from django.db.models import Q
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import exceptions, status
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAdminUser
 from rest_framework.exceptions import ErrorDetail
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.viewsets import GenericViewSet
 
 from api import NON_FIELD_ERRORS_KEY
 from api.authentication.permissions import IsSafeMethod, IsVerified
 from api.exceptions import BadRequestError
 
-from ..models import Icon, Image
+from ..models import Category, Icon, PendingIconCount
+from ..projections import IconProjection
 from ..serializers.icon_serializers import *
+from ..utils import (
+    AutocompleteIndex, ColorPalette, FeatureIndex, KeysetPaginator,
+    Renditions, SentenceStrip, collection_version, etag_matches,
+    get_results_per_page, not_modified_response, set_version)
 
 
 class IconsViewSet(GenericViewSet):
     queryset = Icon.objects.all()
     permission_classes = [IsSafeMethod | IsVerified | IsAdminUser]
+    throttle_scope = None
 
     def __error_response(self, error_detail, status):
         return Response(
@@ -40,6 +56,20 @@ class IconsViewSet(GenericViewSet):
 
         return IconRetrieveSerializer
 
+    def __inline(self, request):
+        """
+        Whether icon images should be embedded as base-64 strings, as opposed to being referenced by URL. Defaults to True, and is disabled with the query parameter "inline=false".
+        """
+        inline = request.query_params.get('inline', 'true')
+
+        return inline.lower() not in {'false', '0', 'no'}
+
+    def __is_admin(self, request):
+        """
+        Whether the request comes from an administrator, who may see icons awaiting approval.
+        """
+        return request.user.is_staff or request.user.is_superuser
+
     def list(self, request):
         if request.method != 'GET':
             raise exceptions.MethodNotAllowed(request.method)
@@ -47,30 +77,68 @@ class IconsViewSet(GenericViewSet):
         search = request.query_params.get('search', None)
         category_id = request.query_params.get('category', None)
         page_num = request.query_params.get('page', 1)
+        inline = self.__inline(request)
+
+        results_per_page = get_results_per_page(request, 'icon')
+
+        if category_id:
+            category_id = get_object_or_404(Category, id=category_id).id
+
+        color = request.query_params.get('color', None)
+        if color:
+            try:
+                color = ColorPalette.parse(color)
+            except ValueError:
+                raise BadRequestError(
+                    ErrorDetail(
+                        _('Query parameter "color" must be a hexadecimal RGB color.'),
+                        'invalid_type'))
+
+        icons, ordering = Icon.listing(
+            search=search, category_id=category_id, color=color)
+
+        # Answer conditional requests before any encoding is done
+        version = collection_version(icons)
+        response = not_modified_response(request, *version)
+        if response:
+            return response
+
+        icons = IconProjection.queryset(icons)
+
+        # Keyset pagination, selected by the presence of the cursor parameter
+        if 'cursor' in request.query_params:
+            paginator = KeysetPaginator(icons, ordering, results_per_page)
+            try:
+                object_list, next_cursor = paginator.page(
+                    request.query_params['cursor'])
+            except KeysetPaginator.InvalidCursor:
+                return self.__error_response(
+                    ErrorDetail(
+                        _('Query parameter "cursor" is invalid.'),
+                        'invalid_cursor'),
+                    status.HTTP_400_BAD_REQUEST,
+                )
+
+            count = len(object_list)
+            response = Response(
+                {
+                    'success':
+                    f'Found {count} icon{"" if count == 1 else "s"}.',
+                    'data':
+                    IconProjection.serialize_many(object_list, inline=inline),
+                    'pagination': {
+                        'maxResultsPerPage': results_per_page,
+                        'numResultsThisPage': count,
+                        'nextCursor': next_cursor,
+                        'nextPageExists': next_cursor is not None,
+                    }
+                },
+                status=status.HTTP_200_OK,
+            )
 
-        results_per_page = min(
-            request.query_params.get(
-                'results', settings.DEFAULT_PAGE_LEN['icon']),
-            settings.MAX_PAGE_LEN['icon'],
-        )
-
-        icons = []
-        if search and category_id:
-            category = get_object_or_404(Category, id=category_id)
-            icons = Icon.by_category(
-                category.id, filter_kwargs={'word__istartswith': search})
-        elif search and not category_id:
-            icons = list(Icon.objects.filter(word__istartswith=search))
-        elif not search and category_id:
-            category = get_object_or_404(Category, id=category_id)
-            icons = Icon.by_category(category.id)
-        else:
-            icons = list(Icon.objects.all())
-
-        icons = sorted(icons, key=lambda x: x.word.lower())
-        if search:
-            icons = sorted(icons, key=lambda x: len(x.word))
+            return set_version(response, *version)
 
+        # Page number pagination
         paginator = Paginator(icons, results_per_page)
         try:
             page = paginator.get_page(page_num)
@@ -89,11 +157,12 @@ class IconsViewSet(GenericViewSet):
                 status.HTTP_404_NOT_FOUND,
             )
 
-        return Response(
+        response = Response(
             {
                 'success':
                 f'Found {paginator.count} icon{"" if paginator.count == 1 else "s"}.',
-                'data': [x.obj for x in page.object_list],
+                'data':
+                IconProjection.serialize_many(page.object_list, inline=inline),
                 'pagination': {
                     'totalResults': paginator.count,
                     'maxResultsPerPage': paginator.per_page,
@@ -107,6 +176,356 @@ class IconsViewSet(GenericViewSet):
             status=status.HTTP_200_OK,
         )
 
+        return set_version(response, *version)
+
+    @action(detail=False, url_path='autocomplete')
+    def autocomplete(self, request):
+        """
+        Action to complete the "search" query parameter to the words of approved icons, served from an in-memory index rather than the database.
+        """
+        search = request.query_params.get('search', '')
+        results = get_results_per_page(request, 'autocomplete')
+
+        words = AutocompleteIndex.complete(search, results) if search else []
+
+        return Response(
+            {
+                'success':
+                f'Found {len(words)} word{"" if len(words) == 1 else "s"}.',
+                'data': words,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def __batch_keys(self, request, key, pattern, distinct=True):
+        """
+        Get the comma-separated values of a query parameter in order, raising an error if any of them does not match a pattern. Repeated values are dropped unless distinct is False.
+        """
+        values = [
+            x.strip().lower()
+            for x in request.query_params.get(key, '').split(',')
+            if x.strip()
+        ]
+
+        for value in values:
+            if not re.fullmatch(pattern, value):
+                raise BadRequestError(
+                    ErrorDetail(
+                        _('Query parameter "%(key)s" contains an invalid value.') %
+                        {'key': key},
+                        'invalid_type'))
+
+        if not distinct:
+            return values
+
+        return list(OrderedDict.fromkeys(values))
+
+    @action(detail=False, url_path='batch')
+    def batch(self, request):
+        """
+        Action to retrieve several icons at once by the comma-separated query parameters "ids" and "md5s", from a single query. Results follow the order of the request, and icons that do not exist, or await approval and are not requested by an administrator, are reported as missing rather than failing the request.
+        """
+        ids = [int(x) for x in self.__batch_keys(request, 'ids', r'\d+')]
+        md5s = self.__batch_keys(request, 'md5s', r'[a-f\d]{32}')
+
+        if not ids and not md5s:
+            raise BadRequestError(
+                ErrorDetail(
+                    _('Query parameter "ids" or "md5s" is required.'),
+                    'required'))
+
+        max_batch_len = settings.MAX_BATCH_LEN['icon']
+        if len(ids) + len(md5s) > max_batch_len:
+            raise BadRequestError(
+                ErrorDetail(
+                    _('No more than %(max)d icons may be requested at once.') %
+                    {'max': max_batch_len},
+                    'too_many'))
+
+        icons = Icon.objects.filter(
+            Q(id__in=ids) | Q(_hash__in=[bytes.fromhex(x) for x in md5s]))
+        if not self.__is_admin(request):
+            icons = icons.filter(is_approved=True)
+        icons = IconProjection.queryset(icons)
+
+        by_id, by_md5 = {}, {}
+        for icon in icons.order_by('id'):
+            by_id[icon.id] = icon
+            by_md5.setdefault(icon.md5, icon)
+
+        inline = self.__inline(request)
+        data = OrderedDict(
+            {
+                'ids': [
+                    IconProjection.serialize(by_id[x], inline=inline)
+                    if x in by_id else None
+                    for x in ids
+                ],
+                'md5s': [
+                    IconProjection.serialize(by_md5[x], inline=inline)
+                    if x in by_md5 else None
+                    for x in md5s
+                ],
+            })
+        missing = OrderedDict(
+            {
+                'ids': [x for x in ids if x not in by_id],
+                'md5s': [x for x in md5s if x not in by_md5],
+            })
+
+        count = len(ids) + len(md5s) - sum(len(x) for x in missing.values())
+        return Response(
+            {
+                'success': f'Found {count} icon{"" if count == 1 else "s"}.',
+                'data': data,
+                'missing': missing,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @action(
+        detail=False,
+        url_path='strip',
+        throttle_classes=[
+            *api_settings.DEFAULT_THROTTLE_CLASSES, ScopedRateThrottle
+        ],
+        throttle_scope='strip')
+    def strip(self, request):
+        """
+        Action to retrieve a sentence strip, a single image of icons side by side, given either the comma-separated query parameter "ids" or "words" in order. Repeated icons are kept, and words without an approved icon are left as blank cells, as are IDs of icons awaiting approval unless requested by an administrator. Like category atlases, the strip image is addressed by a hash of its icons. The entity tag of the response is a hash of the request along with the icons it resolved to, since the same words may map to other icons over time.
+        """
+        ids = [
+            int(x)
+            for x in self.__batch_keys(request, 'ids', r'\d+', False)
+        ]
+        words = self.__batch_keys(request, 'words', r'[^,]{1,40}', False)
+
+        if bool(ids) == bool(words):
+            raise BadRequestError(
+                ErrorDetail(
+                    _('Either query parameter "ids" or "words" is required.'),
+                    'required'))
+
+        max_strip_len = settings.MAX_BATCH_LEN['strip']
+        if len(ids) + len(words) > max_strip_len:
+            raise BadRequestError(
+                ErrorDetail(
+                    _('No more than %(max)d icons may be composed at once.') %
+                    {'max': max_strip_len},
+                    'too_many'))
+
+        icons = Icon.objects.filter(_hash__isnull=False)
+        if not self.__is_admin(request):
+            icons = icons.filter(is_approved=True)
+        if ids:
+            icons = icons.filter(id__in=ids)
+        else:
+            # The first approved icon of each word, in listing order
+            icons = icons.filter(
+                word_key__in=words, is_approved=True).order_by(
+                    'word_key', 'id').distinct('word_key')
+
+        found = {
+            x.id if ids else x.word_key: x
+            for x in icons.only('id', 'word', 'word_key', 'image', '_hash')
+        }
+        icons = [found.get(x) for x in ids or words]
+
+        if not found:
+            raise exceptions.NotFound()
+
+        etag = hashlib.md5(
+            json.dumps(
+                [
+                    'ids' if ids else 'words',
+                    ids or words,
+                    [[x.id, x.word, x.md5] if x else None for x in icons],
+                ]).encode('utf-8')).hexdigest()
+
+        if etag_matches(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+            response['ETag'] = f'"{etag}"'
+            return response
+
+        images = [(x.md5, x.image.name) if x else None for x in icons]
+
+        key, layout = SentenceStrip.get_or_build(images)
+
+        icon_objs = []
+        for icon, cell in zip(icons, layout['cells']):
+            if icon is None:
+                icon_objs.append(None)
+                continue
+
+            x, y, width, height = cell
+            icon_objs.append(
+                OrderedDict(
+                    {
+                        'id': icon.id,
+                        'word': icon.word,
+                        'md5': icon.md5,
+                        'x': x,
+                        'y': y,
+                        'width': width,
+                        'height': height,
+                    }))
+
+        response = Response(
+            {
+                'data':
+                OrderedDict(
+                    {
+                        'url':
+                        reverse('api:dict:strip-raw', kwargs={'key': key}),
+                        'width': layout['width'],
+                        'height': layout['height'],
+                        'icons': icon_objs,
+                    })
+            },
+            status=status.HTTP_200_OK,
+        )
+        response['ETag'] = f'"{etag}"'
+
+        return response
+
+    @action(
+        detail=False,
+        url_path='pending',
+        permission_classes=[IsAdminUser])
+    def pending(self, request):
+        """
+        Action to list icons awaiting approval, oldest first, optionally within a category subtree. Pages are addressed by keyset cursors over a partial index of pending icons. Pending counts by category, within the subtree if any, are read from maintained counters rather than counted.
+        """
+        category_id = request.query_params.get('category', None)
+        results_per_page = get_results_per_page(request, 'icon')
+        inline = self.__inline(request)
+
+        if category_id:
+            category_id = get_object_or_404(Category, id=category_id).id
+            icons = Icon.by_category(category_id, {'is_approved': False})
+        else:
+            icons = Icon.objects.filter(is_approved=False)
+
+        paginator = KeysetPaginator(
+            IconProjection.queryset(icons), ('id', ), results_per_page)
+        try:
+            object_list, next_cursor = paginator.page(
+                request.query_params.get('cursor'))
+        except KeysetPaginator.InvalidCursor:
+            return self.__error_response(
+                ErrorDetail(
+                    _('Query parameter "cursor" is invalid.'),
+                    'invalid_cursor'),
+                status.HTTP_400_BAD_REQUEST,
+            )
+
+        counts = PendingIconCount.objects.filter(count__gt=0)
+        if category_id:
+            counts = counts.filter(
+                category_id__in=Category.subcategories(category_id).values(
+                    'id'))
+        counts = list(
+            counts.order_by('category_id').values_list('category_id', 'count'))
+        names = dict(
+            Category.objects.filter(
+                id__in=[x for x, _ in counts]).values_list('id', 'name'))
+
+        count = len(object_list)
+        return Response(
+            {
+                'success':
+                f'Found {count} pending icon{"" if count == 1 else "s"}.',
+                'data':
+                IconProjection.serialize_many(object_list, inline=inline),
+                'counts': {
+                    'total':
+                    sum(x for _, x in counts),
+                    'categories': [
+                        OrderedDict(
+                            {
+                                'id': x or None,
+                                'name': names.get(x),
+                                'pending': n,
+                            }) for x, n in counts
+                    ],
+                },
+                'pagination': {
+                    'maxResultsPerPage': results_per_page,
+                    'numResultsThisPage': count,
+                    'nextCursor': next_cursor,
+                    'nextPageExists': next_cursor is not None,
+                }
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='approve',
+        url_name='approve-many',
+        permission_classes=[IsAdminUser])
+    def approve(self, request):
+        """
+        Action to approve, or revoke approval of, many icons at once, selected by a list of IDs or by a category and search filter. Runs as a single UPDATE, without saving each icon.
+        """
+        serializer = IconBulkApproveSerializer(data=request.data)
+
+        if not serializer.is_valid():
+            raise BadRequestError(detail=serializer.errors)
+
+        counts = serializer.save()
+        verb = 'Approved' if serializer.validated_data['is_approved'] \
+            else 'Revoked approval of'
+
+        return Response(
+            {
+                'success':
+                f'{verb} {counts["updated"]} icon{"" if counts["updated"] == 1 else "s"}.',
+                'data': counts,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @action(detail=True, url_path='similar')
+    def similar(self, request, pk=None):
+        """
+        Action to list the approved icons that look most like an icon, most similar first, by the cosine similarity of their feature vectors. Icons uploaded before the similarity index existed are added to it on their first request.
+        """
+        icon = get_object_or_404(Icon, pk=pk)
+        results_per_page = get_results_per_page(request, 'similar')
+        inline = self.__inline(request)
+
+        # Extra matches make up for those awaiting approval or deleted
+        matches = FeatureIndex.similar(icon.id, results_per_page * 2)
+        if matches is None and icon.index_features():
+            matches = FeatureIndex.similar(icon.id, results_per_page * 2)
+
+        matches = matches or []
+        icons = {
+            x.id: x
+            for x in IconProjection.queryset(
+                Icon.objects.filter(
+                    id__in=[x for x, _ in matches], is_approved=True))
+        }
+
+        data = []
+        for x, similarity in matches:
+            if x in icons and len(data) < results_per_page:
+                obj = IconProjection.serialize(icons[x], inline=inline)
+                obj['similarity'] = round(similarity, 4)
+                data.append(obj)
+
+        count = len(data)
+        return Response(
+            {
+                'success':
+                f'Found {count} similar icon{"" if count == 1 else "s"}.',
+                'data': data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
     def retrieve(self, request, *args, **kwargs):
         if request.method != 'GET':
             raise exceptions.MethodNotAllowed(request.method)
@@ -114,7 +533,9 @@ class IconsViewSet(GenericViewSet):
         return Response(
             {
                 'success': 'Found an icon with the specified ID.',
-                'data': get_object_or_404(Category, *args, **kwargs).obj
+                'data':
+                get_object_or_404(Icon, *args, **kwargs).to_obj(
+                    inline=self.__inline(request))
             },
             status=status.HTTP_200_OK,
         )
@@ -134,7 +555,8 @@ class IconsViewSet(GenericViewSet):
         return Response(
             {
                 'success': 'You have successfully uploaded an icon.',
-                'data': category.obj
+                'data': category.obj,
+                'duplicates': serializer.duplicates,
             },
             status=status.HTTP_201_CREATED)
 
@@ -170,13 +592,12 @@ class IconsViewSet(GenericViewSet):
         if request.method != 'DELETE':
             raise exceptions.MethodNotAllowed(request.method)
 
-        post_save.disconnect(Image.post_save, sender=Icon, dispatch_uid='0')
         icon = get_object_or_404(Icon, pk=pk)
 
         if Icon.objects.filter(_hash=icon._hash).count() == 1:
+            Renditions.delete(icon.md5)
             icon.image.delete()
 
         icon.delete()
-        post_save.connect(Image.post_save, sender=Icon, dispatch_uid='0')
 
         return Response(status=status.HTTP_204_NO_CONTENT)
@@ -49,3 +49,13 @@ class InternalServerError(APIException):
     status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
     default_detail = _('An internal server error occurred.')
     default_code = 'internal_server_error'
+
+
+class ServiceUnavailableError(APIException):
+    """
+    Exception to be used with the HTTP 503 SERVICE UNAVAILABLE status code. Inherits from rest_framework.exceptions.APIException.
+    """
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = _(
+        'The service is temporarily unavailable. Please try again later.')
+    default_code = 'service_unavailable'
@@ -149,8 +149,10 @@ class PDF(TimestampedModel):
         """
         Serialize relevant fields and properties for JSON output.
         """
+        # Read through all() so that prefetched categories are used, and sort
+        # by name here so that both paths agree
         categories_str = ','.join(
-            map(lambda x: x['name'], self.categories.values('name')))
+            sorted(x.name for x in self.categories.all()))
 
         return OrderedDict(
             {
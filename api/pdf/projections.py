@@ -0,0 +1,32 @@
+from django.db.models import Prefetch
+
+from api.projections import Projection
+
+from .models import PDF
+
+
+class PDFCategoryProjection(Projection):
+    """
+    Projection of Bookshelf categories as listed.
+    """
+    fields = ('id', 'name', 'topic')
+
+    @classmethod
+    def serialize(cls, instance):
+        return instance.obj
+
+
+class PDFProjection(Projection):
+    """
+    Projection of PDFs as listed, with the names of their categories loaded for all PDFs in one query.
+    """
+    fields = ('id', 'title', 'pdf', '_hash', 'topic')
+    prefetch_related = (
+        Prefetch(
+            'categories',
+            queryset=PDF.Category.objects.only('id', 'name')),
+    )
+
+    @classmethod
+    def serialize(cls, instance):
+        return instance.obj
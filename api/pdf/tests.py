@@ -0,0 +1,78 @@
+import shutil
+import tempfile
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+from rest_framework.test import APIClient, APITestCase
+
+from .models import PDF
+
+
+class PDFListTests(APITestCase):
+    """
+    Tests to check that listing PDFs costs a number of queries that does not grow with the number of results.
+    """
+    client = APIClient()
+
+    pdfs_path = f'/api/{settings.VERSION}/pdfs'
+
+    def setUp(self):
+        """
+        Initialization method where a temporary media directory and categories are created.
+        """
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+
+        media_override = override_settings(MEDIA_ROOT=media_root)
+        media_override.enable()
+        self.addCleanup(media_override.disable)
+
+        self.categories = [
+            PDF.Category.objects.create(name=name)
+            for name in ['Essays', 'Papers']
+        ]
+
+    def __create_pdf(self, title):
+        pdf = PDF(title=title)
+        pdf.pdf.save(
+            f'{title}.pdf',
+            ContentFile(f'%PDF-1.4 {title}'.encode('utf-8')),
+            save=False)
+        pdf.save()
+        pdf.categories.set(self.categories)
+
+        return pdf
+
+    def __count_queries(self, params={}):
+        """
+        Method to list PDFs and return the response along with the number of queries it took.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.pdfs_path, params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return response, len(queries)
+
+    def test_list(self):
+        """
+        Ensure listing PDFs costs a constant number of queries, with each PDF listed once along with its categories.
+        """
+        self.__create_pdf('first')
+        _, count = self.__count_queries()
+
+        for title in ['second', 'third', 'fourth']:
+            self.__create_pdf(title)
+        response, more_count = self.__count_queries(
+            {'categories': 'Essays,Papers'})
+
+        self.assertEqual(count, more_count)
+        self.assertEqual(len(response.data['data']), 4)
+        self.assertEqual(
+            {x['categories'] for x in response.data['data']},
+            {'Essays,Papers'})
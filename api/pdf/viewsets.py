@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from api.authentication.permissions import IsSafeMethod
 
 from .models import PDF
+from .projections import PDFCategoryProjection, PDFProjection
 from .serializers import *
 
 
@@ -39,7 +40,8 @@ class PDFViewSet(viewsets.ModelViewSet):
             objs = objs[:100]
         """
 
-        objs = list(map(lambda x: x.obj, set(objs)))
+        objs = PDFProjection.serialize_many(
+            PDFProjection.queryset(objs.distinct().order_by('id')))
 
         count = len(objs)
         obj = {
@@ -107,7 +109,8 @@ class PDFCategoryViewset(viewsets.ModelViewSet):
             topic = request.query_params.get('topic', 1)
             objs = objs.filter(topic=topic)
 
-        objs = list(map(lambda x: x.obj, set(objs)))
+        objs = PDFCategoryProjection.serialize_many(
+            PDFCategoryProjection.queryset(objs))
 
         count = len(objs)
         obj = {
@@ -0,0 +1,54 @@
+import abc
+
+
+class Projection(abc.ABC):
+    """
+    Base class declaring one output shape of a model: the columns it reads, the relations it follows, and how an instance is serialized. Querysets are narrowed with only() and their relations loaded with select_related() and prefetch_related(), so serializing a page costs the same number of queries whatever its length.
+
+    Relations that Django cannot prefetch, such as those joined on a plain column, are loaded for a whole page at once by overriding prepare().
+    """
+    # Columns read, in only() notation, or every column if empty
+    fields = ()
+
+    # Forward relations joined in the same query
+    select_related = ()
+
+    # Relations loaded with one extra query each, as names or Prefetch objects
+    prefetch_related = ()
+
+    @classmethod
+    def queryset(cls, queryset):
+        """
+        Class method narrowing a queryset to the columns and relations of the output shape.
+        """
+        if cls.fields:
+            queryset = queryset.only(*cls.fields)
+        if cls.select_related:
+            queryset = queryset.select_related(*cls.select_related)
+        if cls.prefetch_related:
+            queryset = queryset.prefetch_related(*cls.prefetch_related)
+
+        return queryset
+
+    @classmethod
+    def prepare(cls, instances):
+        """
+        Class method loading, for a list of instances at once, any data they need beyond their queryset. Does nothing by default.
+        """
+
+    @classmethod
+    @abc.abstractmethod
+    def serialize(cls, instance, **kwargs):
+        """
+        Class method serializing a single, prepared instance for JSON output. Must be implemented by every projection.
+        """
+
+    @classmethod
+    def serialize_many(cls, instances, **kwargs):
+        """
+        Class method preparing and serializing a list or queryset of instances.
+        """
+        instances = list(instances)
+        cls.prepare(instances)
+
+        return [cls.serialize(x, **kwargs) for x in instances]
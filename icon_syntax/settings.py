@@ -97,6 +97,7 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    'django.contrib.postgres',
     'django.contrib.staticfiles',
     'django.contrib.sites',
     'django_smtp_ssl',
@@ -210,6 +211,7 @@ REST_FRAMEWORK = {
     'DEFAULT_THROTTLE_RATES': {
         'anon': '10000/day',
         'user': '100000/day',
+        'strip': '60/minute',
     },
     'EXCEPTION_HANDLER':
     'api.exceptions.exception_handler'
@@ -293,14 +295,104 @@ FRONT_END_VERIFY_PATHS = {
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media/')
 
+# Base-64 rendition cache, keyed by MD5 hashsum. MAX_BYTES bounds the size
+# of the cache kept in each process.
+B64_CACHE = {
+    'MAX_BYTES': 2**25,
+}
+
+# Icon search. Fuzzy matches must share at least this fraction of trigrams
+# with the query, as in the similarity threshold of pg_trgm.
+ICON_SEARCH = {
+    'SIMILARITY_THRESHOLD': 0.3,
+}
+
+# Near-duplicate icon detection. Uploads are flagged when the difference
+# hash of an icon is within MAX_DISTANCE bits of theirs, which must be
+# smaller than the number of indexed chunks (4).
+NEAR_DUPLICATES = {
+    'MAX_DISTANCE': 3,
+}
+
+# Icon color filter. Icons match a color when one of their dominant colors
+# is within MAX_DISTANCE of it, in RGB space, which must be smaller than the
+# width of a color bucket (64).
+ICON_COLORS = {
+    'MAX_DISTANCE': 48,
+}
+
+# Icon word autocompletion, served from an index in each process. Changes
+# are announced through a counter in the database, which each process checks
+# at most every CHECK_INTERVAL seconds.
+AUTOCOMPLETE = {
+    'CHECK_INTERVAL': 5,
+}
+
 # Pagination
 DEFAULT_PAGE_LEN = {
     'icon': 100,
+    'autocomplete': 10,
+    'similar': 10,
     'post': 5,
     'comment': 5,
 }
 MAX_PAGE_LEN = {k: v * 5 for k, v in DEFAULT_PAGE_LEN.items()}
 
+# Maximum number of objects requested at once from batch endpoints, and of
+# icons packed into a category atlas
+MAX_BATCH_LEN = {
+    'icon': 100,
+    'strip': 50,
+    'atlas': 256,
+}
+
+# Sentence strips. FRAME_CACHE_LEN bounds the number of decoded icons kept
+# in each process, MAX_STRIPS the number of strips stored on disk, and SPACING
+# is the gap between icons, in pixels.
+SENTENCE_STRIP = {
+    'FRAME_CACHE_LEN': 1024,
+    'MAX_STRIPS': 10000,
+    'SPACING': 4,
+}
+
+# Category atlases. MAX_ATLASES bounds the number of atlases stored on disk
+# across categories, superseded ones included.
+SPRITE_ATLAS = {
+    'MAX_ATLASES': 1000,
+}
+
+# Merriam-Webster API requests. Timeouts are in seconds, and failed GET
+# requests are retried with jittered exponential backoff. POOL_MAXSIZE bounds
+# the open connections kept per host in each worker process.
+EXTERNAL_API = {
+    'DICTIONARY_URL':
+    'https://www.dictionaryapi.com/api/v3/references/collegiate/json/',
+    'MP3_URL': 'https://media.merriam-webster.com/audio/prons/en/us/mp3/',
+    'CONNECT_TIMEOUT': 3.05,
+    'READ_TIMEOUT': 10,
+    'RETRIES': 2,
+    'BACKOFF_FACTOR': 0.25,
+    'RETRY_STATUSES': (429, 500, 502, 503, 504),
+    'POOL_CONNECTIONS': 4,
+    'POOL_MAXSIZE': 10,
+}
+
+# Word lookups. Concurrent lookups of a word missing from the database wait
+# for the first one to fetch it, for up to LOCK_TIMEOUT seconds. Words missing
+# from the dictionary, and the suggestions returned for them, are reused for
+# MISS_TTL seconds.
+#
+# Words are served as stored for FRESH_TTL seconds after they are fetched,
+# then served and refreshed by one of REFRESH_WORKERS background threads, and
+# refreshed before they are served from STALE_TTL seconds on.
+WORD_LOOKUP = {
+    'LOCK_TIMEOUT': 20,
+    'MISS_TTL': 60 * 60 * 24,
+    'FRESH_TTL': 60 * 60 * 24 * 7,
+    'STALE_TTL': 60 * 60 * 24 * 30,
+    'REFRESH_WORKERS': 2,
+}
+
 # Count API calls (used in testing)
 COUNT_API_CALLS = False
 SEND_EMAIL = True